@@ -0,0 +1,37 @@
+"""Add selector to refresh tokens
+
+Revision ID: 004
+Revises: 003, 6d82ab3ef914
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: Union[str, Sequence[str], None] = ("003", "6d82ab3ef914")
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Selector for "<selector>.<verifier>" refresh tokens. Existing rows keep a NULL
+    # selector and their bcrypt hash; they are rotated into the new format on next use.
+    op.add_column(
+        "refresh_tokens",
+        sa.Column("selector", sa.String(32), nullable=True),
+    )
+    op.create_index(
+        "ix_refresh_tokens_selector", "refresh_tokens", ["selector"], unique=True
+    )
+
+
+def downgrade() -> None:
+    # Selector-format tokens cannot be verified without their selector; revoke them
+    op.execute("UPDATE refresh_tokens SET revoked = 1 WHERE selector IS NOT NULL")
+    op.drop_index("ix_refresh_tokens_selector", table_name="refresh_tokens")
+    op.drop_column("refresh_tokens", "selector")
@@ -0,0 +1,39 @@
+"""Add composite indexes for keyset pagination
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # (filter, sort column, id) indexes so cursor seeks of the form
+    # (sort, id) < (:sort, :id) are index range scans at any depth
+    op.create_index("ix_jobs_status_created_at_id", "jobs", ["status", "created_at", "id"])
+    op.create_index("ix_jobs_status_updated_at_id", "jobs", ["status", "updated_at", "id"])
+    op.create_index(
+        "ix_jobs_employer_id_created_at_id", "jobs", ["employer_id", "created_at", "id"]
+    )
+    op.create_index(
+        "ix_applications_job_id_created_at_id",
+        "applications",
+        ["job_id", "created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_applications_job_id_created_at_id", table_name="applications")
+    op.drop_index("ix_jobs_employer_id_created_at_id", table_name="jobs")
+    op.drop_index("ix_jobs_status_updated_at_id", table_name="jobs")
+    op.drop_index("ix_jobs_status_created_at_id", table_name="jobs")
@@ -0,0 +1,61 @@
+"""Add weighted full-text search vector to jobs
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _weighted_vector(prefix: str) -> str:
+    # title (A) > tags (B) > requirements (C) > description (D)
+    return (
+        f"setweight(to_tsvector('english', coalesce({prefix}title, '')), 'A') || "
+        f"setweight(to_tsvector('english', coalesce(array_to_string({prefix}tags, ' '), '')), 'B') || "
+        f"setweight(to_tsvector('english', coalesce({prefix}requirements_md, '')), 'C') || "
+        f"setweight(to_tsvector('english', coalesce({prefix}description_md, '')), 'D')"
+    )
+
+
+def upgrade() -> None:
+    op.add_column("jobs", sa.Column("search_vector", postgresql.TSVECTOR, nullable=True))
+
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION jobs_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := {_weighted_vector("NEW.")};
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER jobs_search_vector_trigger
+        BEFORE INSERT OR UPDATE OF title, tags, requirements_md, description_md ON jobs
+        FOR EACH ROW EXECUTE FUNCTION jobs_search_vector_update()
+    """)
+
+    # Backfill existing rows
+    op.execute(f"UPDATE jobs SET search_vector = {_weighted_vector('')}")
+
+    op.create_index(
+        "ix_jobs_search_vector", "jobs", ["search_vector"], postgresql_using="gin"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_search_vector", table_name="jobs")
+    op.execute("DROP TRIGGER IF EXISTS jobs_search_vector_trigger ON jobs")
+    op.execute("DROP FUNCTION IF EXISTS jobs_search_vector_update()")
+    op.drop_column("jobs", "search_vector")
@@ -0,0 +1,118 @@
+"""Add published_job_cards read model
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "published_job_cards",
+        sa.Column("job_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("employer_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("employer_company_name", sa.String(255), nullable=True),
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("description_md", sa.Text, nullable=False),
+        sa.Column("requirements_md", sa.Text, nullable=True),
+        sa.Column("excerpt", sa.Text, nullable=True),
+        sa.Column("location", sa.String(255), nullable=True),
+        sa.Column("is_salary_public", sa.Boolean, nullable=False),
+        sa.Column("salaries", postgresql.JSON, nullable=False),
+        sa.Column("categories", postgresql.ARRAY(sa.String), nullable=False),
+        sa.Column("tags", postgresql.ARRAY(sa.String), nullable=True),
+        sa.Column("created_at", sa.DateTime, nullable=False),
+        sa.Column("updated_at", sa.DateTime, nullable=False),
+        sa.Column("refreshed_at", sa.DateTime, nullable=False),
+        sa.Column("search_vector", postgresql.TSVECTOR, nullable=True),
+        sa.ForeignKeyConstraint(["job_id"], ["jobs.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["employer_id"], ["employers.id"], ondelete="CASCADE"),
+    )
+    op.create_index(
+        "ix_published_job_cards_employer_id", "published_job_cards", ["employer_id"]
+    )
+    op.create_index(
+        "ix_published_job_cards_created_at_job_id",
+        "published_job_cards",
+        ["created_at", "job_id"],
+    )
+    op.create_index(
+        "ix_published_job_cards_updated_at_job_id",
+        "published_job_cards",
+        ["updated_at", "job_id"],
+    )
+    op.create_index(
+        "ix_published_job_cards_search_vector",
+        "published_job_cards",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+
+    # Reuse the jobs search trigger function; cards carry the same searchable columns
+    op.execute("""
+        CREATE TRIGGER published_job_cards_search_vector_trigger
+        BEFORE INSERT OR UPDATE OF title, tags, requirements_md, description_md
+        ON published_job_cards
+        FOR EACH ROW EXECUTE FUNCTION jobs_search_vector_update()
+    """)
+
+    # Backfill from published jobs. The excerpt here is a plain truncation;
+    # `python -m app.scripts.rebuild_job_cards` regenerates markdown-stripped excerpts.
+    op.execute("""
+        INSERT INTO published_job_cards (
+            job_id, employer_id, employer_company_name, title, description_md,
+            requirements_md, excerpt, location, is_salary_public, salaries,
+            categories, tags, created_at, updated_at, refreshed_at
+        )
+        SELECT
+            j.id,
+            j.employer_id,
+            e.company_name,
+            j.title,
+            j.description_md,
+            j.requirements_md,
+            left(regexp_replace(j.description_md, '\\s+', ' ', 'g'), 280),
+            j.location,
+            j.is_salary_public,
+            CASE WHEN j.is_salary_public THEN coalesce((
+                SELECT json_agg(json_build_object(
+                    'id', s.id,
+                    'currency', s.currency,
+                    'amount_min', s.amount_min,
+                    'amount_max', s.amount_max,
+                    'created_at', s.created_at,
+                    'updated_at', s.updated_at
+                ))
+                FROM job_salaries s WHERE s.job_id = j.id
+            ), '[]'::json) ELSE '[]'::json END,
+            ARRAY(
+                SELECT c.name FROM job_categories jc
+                JOIN categories c ON c.id = jc.category_id
+                WHERE jc.job_id = j.id
+                ORDER BY c.name
+            ),
+            j.tags,
+            j.created_at,
+            j.updated_at,
+            now() AT TIME ZONE 'utc'
+        FROM jobs j
+        JOIN employers e ON e.id = j.employer_id
+        WHERE j.status = 'published'
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table("published_job_cards")
@@ -0,0 +1,92 @@
+"""Add indexed salary ranges to published_job_cards
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _envelope_sql(currency: str) -> str:
+    # [lowest min, highest max] of the job's public salaries in `currency`; NULL
+    # when there are none (or the salary is hidden) or any has an open bound
+    return f"""(
+        SELECT CASE
+            WHEN count(*) > 0 AND bool_and(s.amount_min IS NOT NULL AND s.amount_max IS NOT NULL)
+            THEN numrange(min(s.amount_min), greatest(max(s.amount_max), min(s.amount_min)), '[]')
+        END
+        FROM job_salaries s
+        WHERE s.job_id = published_job_cards.job_id AND s.currency = '{currency}'
+          AND published_job_cards.is_salary_public
+    )"""
+
+
+def upgrade() -> None:
+    op.add_column(
+        "published_job_cards",
+        sa.Column(
+            "salary_currencies",
+            postgresql.ARRAY(sa.String),
+            nullable=False,
+            server_default="{}",
+        ),
+    )
+    op.add_column(
+        "published_job_cards", sa.Column("salary_range_mvr", postgresql.NUMRANGE, nullable=True)
+    )
+    op.add_column(
+        "published_job_cards", sa.Column("salary_range_usd", postgresql.NUMRANGE, nullable=True)
+    )
+
+    op.execute(f"""
+        UPDATE published_job_cards SET
+            salary_currencies = ARRAY(
+                SELECT DISTINCT s.currency::text FROM job_salaries s
+                WHERE s.job_id = published_job_cards.job_id
+                  AND published_job_cards.is_salary_public
+                ORDER BY 1
+            ),
+            salary_range_mvr = {_envelope_sql("MVR")},
+            salary_range_usd = {_envelope_sql("USD")}
+    """)
+    op.alter_column("published_job_cards", "salary_currencies", server_default=None)
+
+    op.create_index(
+        "ix_published_job_cards_salary_currencies",
+        "published_job_cards",
+        ["salary_currencies"],
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_published_job_cards_salary_range_mvr",
+        "published_job_cards",
+        ["salary_range_mvr"],
+        postgresql_using="gist",
+    )
+    op.create_index(
+        "ix_published_job_cards_salary_range_usd",
+        "published_job_cards",
+        ["salary_range_usd"],
+        postgresql_using="gist",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_published_job_cards_salary_range_usd", table_name="published_job_cards")
+    op.drop_index("ix_published_job_cards_salary_range_mvr", table_name="published_job_cards")
+    op.drop_index("ix_published_job_cards_salary_currencies", table_name="published_job_cards")
+    op.drop_column("published_job_cards", "salary_range_usd")
+    op.drop_column("published_job_cards", "salary_range_mvr")
+    op.drop_column("published_job_cards", "salary_currencies")
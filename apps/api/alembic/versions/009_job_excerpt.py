@@ -0,0 +1,76 @@
+"""Add precomputed plain-text excerpt to jobs
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+import re
+from typing import Optional, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 500
+
+# Frozen copy of app.utils.text.make_excerpt as of this revision, so later changes
+# to the application code can't alter (or break) what this migration does
+EXCERPT_LENGTH = 280
+_MARKDOWN_LINK = re.compile(r"!?\[([^\]]*)\]\([^)]*\)")
+_MARKDOWN_BLOCK_PREFIX = re.compile(r"^\s*(?:#{1,6}|[-*+]|\d+\.|>)\s+", re.MULTILINE)
+_MARKDOWN_EMPHASIS = re.compile(r"[*_`~]+")
+
+
+def make_excerpt(markdown: Optional[str], max_length: int = EXCERPT_LENGTH) -> str:
+    text = _MARKDOWN_LINK.sub(r"\1", markdown or "")
+    text = _MARKDOWN_BLOCK_PREFIX.sub("", text)
+    text = _MARKDOWN_EMPHASIS.sub("", text)
+    text = " ".join(text.split())
+    if len(text) <= max_length:
+        return text
+    return text[:max_length].rsplit(" ", 1)[0] + "…"
+
+
+def upgrade() -> None:
+    op.add_column("jobs", sa.Column("excerpt", sa.Text, nullable=True))
+
+    # Excerpts strip markdown, so they are computed in Python in batches
+    bind = op.get_bind()
+    jobs = sa.table(
+        "jobs",
+        sa.column("id"),
+        sa.column("description_md", sa.Text),
+        sa.column("excerpt", sa.Text),
+    )
+    last_id = None
+    while True:
+        query = sa.select(jobs.c.id, jobs.c.description_md).order_by(jobs.c.id).limit(BATCH_SIZE)
+        if last_id is not None:
+            query = query.where(jobs.c.id > last_id)
+        rows = bind.execute(query).all()
+        if not rows:
+            break
+        bind.execute(
+            jobs.update()
+            .where(jobs.c.id == sa.bindparam("job_id"))
+            .values(excerpt=sa.bindparam("job_excerpt")),
+            [{"job_id": row.id, "job_excerpt": make_excerpt(row.description_md)} for row in rows],
+        )
+        last_id = rows[-1].id
+
+    # Published job cards copy the job's excerpt
+    op.execute("""
+        UPDATE published_job_cards c SET excerpt = j.excerpt
+        FROM jobs j WHERE j.id = c.job_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column("jobs", "excerpt")
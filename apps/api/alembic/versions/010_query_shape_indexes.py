@@ -0,0 +1,61 @@
+"""Add composite and BRIN indexes matching the hot query shapes
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# name -> (table, columns, extra create_index kwargs)
+NEW_INDEXES = {
+    # Per-job application listings filtered by status
+    "ix_applications_job_id_status_created_at_id": (
+        "applications", ["job_id", "status", "created_at", "id"], {}
+    ),
+    # Time-range scans over the append-mostly applications table
+    "ix_applications_created_at_brin": (
+        "applications", ["created_at"], {"postgresql_using": "brin"}
+    ),
+    # Jobs by category; the (job_id, category_id) primary key only serves the reverse
+    "ix_job_categories_category_id_job_id": ("job_categories", ["category_id", "job_id"], {}),
+}
+
+# No longer used by any query: published listings read published_job_cards (whose
+# (created_at, job_id)/(updated_at, job_id) indexes come from 007), and the
+# single-column job_id index is a prefix of ix_applications_job_id_created_at_id
+OLD_INDEXES = {
+    "ix_jobs_status_created_at_id": ("jobs", ["status", "created_at", "id"]),
+    "ix_jobs_status_updated_at_id": ("jobs", ["status", "updated_at", "id"]),
+    "ix_applications_job_id": ("applications", ["job_id"]),
+}
+
+
+def upgrade() -> None:
+    # CREATE/DROP INDEX CONCURRENTLY can't run inside a transaction. A failed
+    # concurrent build leaves an invalid index behind, so drop any leftover first.
+    with op.get_context().autocommit_block():
+        for name, (table, columns, kwargs) in NEW_INDEXES.items():
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
+            op.create_index(name, table, columns, postgresql_concurrently=True, **kwargs)
+        for name, (table, _) in OLD_INDEXES.items():
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, (table, columns) in OLD_INDEXES.items():
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
+            op.create_index(name, table, columns, postgresql_concurrently=True)
+        for name, (table, _, _) in reversed(NEW_INDEXES.items()):
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
@@ -1,16 +1,15 @@
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 import uuid
 
 from app.core.employer import get_current_employer
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.db.models import Application, Job, Employer
 from app.schemas.application import ApplicationCreate, ApplicationUpdate, ApplicationResponse
 from app.schemas.common import CursorPage
 from app.utils.pagination import get_cursor_paginated_results
-from app.utils.rate_limit import check_rate_limit
 
 router = APIRouter()
 
@@ -18,19 +17,10 @@ router = APIRouter()
 async def create_public_application(
     job_id: uuid.UUID,
     data: ApplicationCreate,
-    request: Request,
     db: AsyncSession,
 ) -> ApplicationResponse:
     """Create an application for a job (public endpoint)."""
-    # Rate limiting
-    client_ip = request.client.host if request.client else "unknown"
-    allowed, _ = await check_rate_limit(f"apply:{client_ip}", limit=5, window_seconds=300)
-    if not allowed:
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail="Too many application attempts",
-        )
-
+    # Rate limited by RateLimitMiddleware (RATE_LIMIT_POLICIES["apply"])
     # Verify job exists and is published
     result = await db.execute(
         select(Job).where(and_(Job.id == job_id, Job.status == "published"))
@@ -66,7 +56,7 @@ async def list_job_applications(
     cursor: Optional[str] = Query(None),
     status_filter: Optional[str] = Query(None, alias="status"),
     employer: Employer = Depends(get_current_employer),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db, scope="function"),
 ):
     """List applications for a job."""
     # Verify job belongs to employer
@@ -86,28 +76,27 @@ async def list_job_applications(
     if status_filter:
         query = query.where(Application.status == status_filter)
 
-    # Apply ordering
-    query = query.order_by(Application.created_at.desc())
-
-    # Cursor pagination
-    applications, next_cursor = await get_cursor_paginated_results(
+    # Keyset pagination ordered by (created_at, id), newest first
+    applications, next_cursor, prev_cursor = await get_cursor_paginated_results(
         db=db,
         query=query,
         cursor=cursor,
         page_size=20,
         id_field=Application.id,
+        sort_field=Application.created_at,
+        sort_order="desc",
     )
 
     items = [ApplicationResponse.model_validate(app) for app in applications]
 
-    return CursorPage(items=items, next_cursor=next_cursor)
+    return CursorPage(items=items, next_cursor=next_cursor, prev_cursor=prev_cursor)
 
 
 @router.get("/{application_id}", response_model=ApplicationResponse)
 async def get_application(
     application_id: uuid.UUID,
     employer: Employer = Depends(get_current_employer),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db, scope="function"),
 ):
     """Get an application by ID."""
     result = await db.execute(
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import timedelta, datetime, timezone
 
@@ -8,17 +9,20 @@ from app.core.security import (
     verify_password,
     create_access_token,
     create_refresh_token,
+    split_refresh_token,
     hash_refresh_token,
     verify_refresh_token,
-    verify_token,
+    verify_legacy_refresh_token,
+    is_legacy_refresh_token,
     blacklist_token,
 )
+from app.core.auth_cache import verify_token_cached, forget_token, invalidate_employer_principal
 from app.core.config import settings
-from app.db.session import get_db
+from app.core.hashing import run_in_hash_executor
+from app.db.session import get_db, release_connection
 from app.db.models import Employer, RefreshToken
 from app.schemas.auth import LoginRequest, RegisterRequest, TokenResponse, RefreshTokenRequest, LogoutRequest
 from app.core.employer import get_current_employer
-from app.utils.rate_limit import check_rate_limit
 import structlog
 
 logger = structlog.get_logger(__name__)
@@ -26,40 +30,60 @@ logger = structlog.get_logger(__name__)
 router = APIRouter()
 
 
+def _issue_refresh_token(db: AsyncSession, employer_id) -> str:
+    """Create a new refresh token for an employer and add it to the session."""
+    refresh_token_plain = create_refresh_token()
+    selector, verifier = split_refresh_token(refresh_token_plain)
+
+    db.add(
+        RefreshToken(
+            employer_id=employer_id,
+            selector=selector,
+            token_hash=hash_refresh_token(verifier),
+            expires_at=datetime.utcnow() + timedelta(days=settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS),
+        )
+    )
+    return refresh_token_plain
+
+
+def _email_already_registered() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Email already registered",
+    )
+
+
 @router.post("/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
 async def register(
     data: RegisterRequest,
-    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
     """Register a new employer account."""
-    # Rate limiting
-    client_ip = request.client.host if request.client else "unknown"
-    allowed, _ = await check_rate_limit(f"register:{client_ip}", limit=5, window_seconds=300)
-    if not allowed:
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail="Too many registration attempts",
-        )
-
+    # Rate limited by RateLimitMiddleware (RATE_LIMIT_POLICIES["register"])
     # Check if email already exists
     result = await db.execute(select(Employer).where(Employer.email == data.email))
     existing = result.scalar_one_or_none()
     if existing:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered",
-        )
+        raise _email_already_registered()
+
+    # Don't hold a pooled connection while bcrypt runs
+    await release_connection(db)
+    password_hash = await run_in_hash_executor(get_password_hash, data.password)
 
     # Create employer
     employer = Employer(
         company_name=data.company_name,
         email=data.email,
-        password_hash=get_password_hash(data.password),
+        password_hash=password_hash,
         contact_info=data.contact_info,
     )
     db.add(employer)
-    await db.commit()
+    try:
+        await db.commit()
+    except IntegrityError:
+        # A concurrent registration for the same email won the race while we hashed
+        await db.rollback()
+        raise _email_already_registered()
     await db.refresh(employer)
 
     # Create tokens
@@ -68,15 +92,7 @@ async def register(
     )
 
     # Create and store refresh token
-    refresh_token_plain = create_refresh_token()
-    refresh_token_hash = hash_refresh_token(refresh_token_plain)
-
-    refresh_token_db = RefreshToken(
-        employer_id=employer.id,
-        token_hash=refresh_token_hash,
-        expires_at=datetime.utcnow() + timedelta(days=settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS),
-    )
-    db.add(refresh_token_db)
+    refresh_token_plain = _issue_refresh_token(db, employer.id)
     await db.commit()
 
     return TokenResponse(
@@ -90,24 +106,19 @@ async def register(
 @router.post("/login", response_model=TokenResponse)
 async def login(
     data: LoginRequest,
-    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
     """Login and get access token."""
-    # Rate limiting
-    client_ip = request.client.host if request.client else "unknown"
-    allowed, _ = await check_rate_limit(f"login:{client_ip}", limit=10, window_seconds=60)
-    if not allowed:
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail="Too many login attempts",
-        )
-
+    # Rate limited by RateLimitMiddleware (RATE_LIMIT_POLICIES["login"])
     # Find employer
     result = await db.execute(select(Employer).where(Employer.email == data.email))
     employer = result.scalar_one_or_none()
 
-    if not employer or not verify_password(data.password, employer.password_hash):
+    # Don't hold a pooled connection while bcrypt runs
+    await release_connection(db)
+    if not employer or not await run_in_hash_executor(
+        verify_password, data.password, employer.password_hash
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
@@ -119,15 +130,7 @@ async def login(
     )
 
     # Create and store refresh token
-    refresh_token_plain = create_refresh_token()
-    refresh_token_hash = hash_refresh_token(refresh_token_plain)
-
-    refresh_token_db = RefreshToken(
-        employer_id=employer.id,
-        token_hash=refresh_token_hash,
-        expires_at=datetime.utcnow() + timedelta(days=settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS),
-    )
-    db.add(refresh_token_db)
+    refresh_token_plain = _issue_refresh_token(db, employer.id)
     await db.commit()
 
     return TokenResponse(
@@ -151,25 +154,54 @@ async def refresh_token(
     - Issues a new refresh token (rotation)
     - Revokes the old refresh token
     """
-    # Find all non-expired, non-revoked refresh tokens for verification
     now = datetime.utcnow()
-    result = await db.execute(
-        select(RefreshToken).where(
-            RefreshToken.expires_at > now,
-            RefreshToken.revoked == 0
-        )
-    )
-    all_tokens = result.scalars().all()
-
-    # Find the token that matches the provided refresh token
+    selector, verifier = split_refresh_token(data.refresh_token)
     refresh_token_db = None
-    for token in all_tokens:
-        if verify_refresh_token(data.refresh_token, token.token_hash):
-            refresh_token_db = token
-            break
+
+    if selector is not None:
+        # Selector/verifier tokens: one indexed lookup, then a constant-time HMAC check
+        result = await db.execute(
+            select(RefreshToken).where(
+                RefreshToken.selector == selector,
+                RefreshToken.expires_at > now,
+                RefreshToken.revoked == 0,
+            )
+        )
+        candidate = result.scalar_one_or_none()
+        if candidate and verify_refresh_token(verifier, candidate.token_hash):
+            refresh_token_db = candidate
+    elif (
+        settings.REFRESH_TOKEN_ACCEPT_LEGACY
+        and data.employer_id is not None
+        and is_legacy_refresh_token(data.refresh_token)
+    ):
+        # Legacy bcrypt-hashed tokens have no selector. Only the employer's legacy rows
+        # are checked, and they are rotated into the new format on use or age out at
+        # expiry. The scan is capped (newest first) so one request costs a bounded
+        # number of bcrypt checks however many legacy rows the table holds.
+        result = await db.execute(
+            select(RefreshToken)
+            .where(
+                RefreshToken.employer_id == data.employer_id,
+                RefreshToken.selector.is_(None),
+                RefreshToken.expires_at > now,
+                RefreshToken.revoked == 0,
+            )
+            .order_by(RefreshToken.created_at.desc())
+            .limit(settings.REFRESH_TOKEN_LEGACY_SCAN_LIMIT)
+        )
+        legacy_tokens = result.scalars().all()
+        # Don't hold a pooled connection while bcrypt runs
+        await release_connection(db)
+        for token in legacy_tokens:
+            if await run_in_hash_executor(
+                verify_legacy_refresh_token, data.refresh_token, token.token_hash
+            ):
+                refresh_token_db = token
+                break
 
     if not refresh_token_db:
-        logger.warning("Invalid refresh token provided", employer_id=refresh_token_db.employer_id if refresh_token_db else None)
+        logger.warning("Invalid refresh token provided", legacy_format=selector is None)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid refresh token",
@@ -195,24 +227,10 @@ async def refresh_token(
         data={"sub": str(employer.id), "employer_id": str(employer.id), "roles": ["employer_admin"]}
     )
 
-    # Rotate refresh token for security (optional but recommended)
-    new_refresh_token_plain = create_refresh_token()
-    new_refresh_token_hash = hash_refresh_token(new_refresh_token_plain)
-
-    # Revoke old token and create new one
+    # Rotate refresh token for security: revoke the old token and issue a new one
     refresh_token_db.revoked = 1
-
-    new_refresh_token_db = RefreshToken(
-        employer_id=employer.id,
-        token_hash=new_refresh_token_hash,
-        expires_at=datetime.utcnow() + timedelta(days=settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS),
-    )
-
-    db.add(new_refresh_token_db)
-    await db.commit()
-
-    # Update last used timestamp for old token
     refresh_token_db.last_used_at = datetime.utcnow()
+    new_refresh_token_plain = _issue_refresh_token(db, employer.id)
     await db.commit()
 
     return TokenResponse(
@@ -246,7 +264,7 @@ async def logout(
     token = auth_header[7:]  # Remove "Bearer " prefix
 
     # Verify token and extract JTI for blacklisting
-    is_valid, payload, error_message = verify_token(token)
+    is_valid, payload, error_message = await verify_token_cached(token)
     if not is_valid or payload is None:
         # Token is already invalid, but we'll still return success
         logger.info("Logout attempted with invalid token", employer_id=str(employer.id))
@@ -254,10 +272,21 @@ async def logout(
 
     jti = payload.get("jti")
     if jti:
-        blacklist_token(jti)
+        try:
+            await blacklist_token(jti, payload["exp"])
+        except Exception as e:
+            logger.error("Failed to revoke token on logout", employer_id=str(employer.id), error=str(e))
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Logout could not be completed, please retry",
+            )
         logger.info("Token successfully blacklisted", employer_id=str(employer.id), jti=jti)
     else:
         logger.warning("Token missing JTI claim during logout", employer_id=str(employer.id))
 
+    # Drop the cached claims and principal so the next request re-authenticates
+    forget_token(token)
+    await invalidate_employer_principal(employer.id)
+
     # Note: In production, you might also want to revoke associated refresh tokens
 
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db
+from app.db.session import get_read_db
 from app.db.models import Category
 from app.schemas.category import CategoryResponse
 from app.schemas.common import CursorPage
@@ -12,7 +12,7 @@ router = APIRouter()
 
 @router.get("", response_model=list[CategoryResponse])
 async def list_categories(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db, scope="function"),
 ):
     """List all categories."""
     result = await db.execute(select(Category).order_by(Category.name))
@@ -2,9 +2,12 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.employer import get_current_employer
+from app.core.auth_cache import invalidate_employer_principal
 from app.db.session import get_db
 from app.db.models import Employer
 from app.schemas.employer import EmployerResponse, EmployerUpdate
+from app.db.read_model import sync_employer_job_cards
+from app.utils.cache import bump_public_jobs_generation
 
 router = APIRouter()
 
@@ -24,13 +27,33 @@ async def update_current_employer(
     db: AsyncSession = Depends(get_db),
 ):
     """Update current employer information."""
+    # The authenticated principal may come from cache; modify the stored row
+    employer = await db.get(Employer, employer.id)
+    if employer is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Employer account not found",
+        )
+
     # Update fields
     update_data = data.model_dump(exclude_unset=True)
+    company_name_changed = (
+        "company_name" in update_data and update_data["company_name"] != employer.company_name
+    )
     for key, value in update_data.items():
         setattr(employer, key, value)
 
+    # Published job cards embed the company name
+    if company_name_changed:
+        await sync_employer_job_cards(db, employer.id, employer.company_name)
+
     await db.commit()
     await db.refresh(employer)
+    await invalidate_employer_principal(employer.id)
+
+    # Cached public listings embed the company name
+    if company_name_changed:
+        await bump_public_jobs_generation()
 
     return EmployerResponse.model_validate(employer)
 
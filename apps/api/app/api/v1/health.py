@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db
+from app.db.session import get_primary_read_db
 
 router = APIRouter()
 
@@ -14,7 +14,7 @@ async def liveness():
 
 
 @router.get("/readyz")
-async def readiness(db: AsyncSession = Depends(get_db)):
+async def readiness(db: AsyncSession = Depends(get_primary_read_db, scope="function")):
     """Readiness probe endpoint."""
     try:
         await db.execute(text("SELECT 1"))
@@ -24,7 +24,7 @@ async def readiness(db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/healthz")
-async def health(db: AsyncSession = Depends(get_db)):
+async def health(db: AsyncSession = Depends(get_primary_read_db, scope="function")):
     """Health check endpoint."""
     try:
         await db.execute(text("SELECT 1"))
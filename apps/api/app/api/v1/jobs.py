@@ -1,40 +1,68 @@
-from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy import select, and_, or_
+from datetime import datetime
+from typing import Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from sqlalchemy import select, delete, and_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only
+from pydantic import BaseModel
 import uuid
 
 from app.core.employer import get_current_employer, require_roles
-from app.db.session import get_db
-from app.db.models import Job, Employer, Category, JobCategory
-from app.schemas.job import JobCreate, JobUpdate, JobResponse, JobSalaryCreate, SupportedCurrency
+from app.db.session import get_db, get_read_db
+from app.db.models import Job, Employer, JobCategory
+from app.db.loaders import with_job_relations, attach_job_details, load_job
+from app.db.search import search_matches
+from app.db.read_model import sync_job_cards
+from app.schemas.job import (
+    JobCreate,
+    JobUpdate,
+    JobResponse,
+    JobSummaryResponse,
+    JobSalaryCreate,
+    SupportedCurrency,
+)
 from app.db.models import JobSalary as JobSalaryModel
 from app.schemas.common import CursorPage
 from app.utils.pagination import get_cursor_paginated_results
+from app.utils.projection import resolve_projection
+from app.utils.cache import bump_public_jobs_generation
+from app.utils.text import make_excerpt
 
 router = APIRouter()
 
 
-@router.get("", response_model=CursorPage[JobResponse])
+def job_columns(model: type[BaseModel]) -> list:
+    """Job columns backing the fields of `model`, for load_only."""
+    return [getattr(Job, name) for name in model.model_fields if name in Job.__table__.c]
+
+
+@router.get("", response_model=CursorPage[Union[JobResponse, JobSummaryResponse]])
 async def list_jobs(
     cursor: Optional[str] = Query(None),
     q: Optional[str] = Query(None),
     location: Optional[str] = Query(None),
     status: Optional[str] = Query(None),
+    view: Optional[str] = Query("full", regex="^(full|summary)$"),
+    fields: Optional[str] = Query(None),
     employer: Employer = Depends(get_current_employer),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db, scope="function"),
 ):
-    """List jobs for the current employer."""
-    query = select(Job).options(selectinload(Job.employer), selectinload(Job.salaries)).where(Job.employer_id == employer.id)
+    """
+    List jobs for the current employer.
+
+    view=summary returns a lean item with a plain-text excerpt instead of the markdown
+    bodies; fields=a,b,c narrows the view to those fields. Only the job columns
+    backing the returned fields are read.
+    """
+    projection = resolve_projection(view, fields, JobResponse, JobSummaryResponse)
+
+    query = with_job_relations(select(Job)).where(Job.employer_id == employer.id)
+    if projection:
+        query = query.options(load_only(*job_columns(projection)))
 
     if q:
-        query = query.where(
-            or_(
-                Job.title.ilike(f"%{q}%"),
-                Job.description_md.ilike(f"%{q}%"),
-            )
-        )
+        # Full-text search over the weighted, GIN-indexed search vector
+        query = query.where(search_matches(Job.search_vector, q))
 
     if location:
         query = query.where(Job.location.ilike(f"%{location}%"))
@@ -42,33 +70,32 @@ async def list_jobs(
     if status:
         query = query.where(Job.status == status)
 
-    # Apply ordering
-    query = query.order_by(Job.created_at.desc())
-
-    # Cursor pagination
-    jobs, next_cursor = await get_cursor_paginated_results(
+    # Keyset pagination ordered by (created_at, id), newest first
+    jobs, next_cursor, prev_cursor = await get_cursor_paginated_results(
         db=db,
         query=query,
         cursor=cursor,
         page_size=20,
         id_field=Job.id,
+        sort_field=Job.created_at,
+        sort_order="desc",
     )
 
-    # Load categories and set employer company name
-    for job in jobs:
-        cat_result = await db.execute(
-            select(Category)
-            .join(JobCategory)
-            .where(JobCategory.job_id == job.id)
+    # Load categories and set employer company name for the whole page
+    await attach_job_details(db, jobs)
+
+    if projection:
+        page = CursorPage[projection](
+            items=[projection.model_validate(job) for job in jobs],
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
         )
-        job.categories = [cat.name for cat in cat_result.scalars().all()]
-        # Set employer company name for response
-        if job.employer:
-            job.employer_company_name = job.employer.company_name
+        # Projected items don't fit the full response model, so skip its validation
+        return Response(content=page.model_dump_json(), media_type="application/json")
 
     items = [JobResponse.model_validate(job) for job in jobs]
 
-    return CursorPage(items=items, next_cursor=next_cursor)
+    return CursorPage(items=items, next_cursor=next_cursor, prev_cursor=prev_cursor)
 
 
 @router.post("", response_model=JobResponse, status_code=status.HTTP_201_CREATED)
@@ -89,6 +116,7 @@ async def create_job(
         employer_id=employer.id,
         title=data.title,
         description_md=data.description_md,
+        excerpt=make_excerpt(data.description_md),
         requirements_md=data.requirements_md,
         location=data.location,
         is_salary_public=data.is_salary_public,
@@ -115,20 +143,11 @@ async def create_job(
             job_category = JobCategory(job_id=job.id, category_id=cat_id)
             db.add(job_category)
 
+    # New jobs start as drafts, so there is no published job card to maintain yet
     await db.commit()
-    await db.refresh(job, ["employer", "salaries"])
 
-    # Load categories
-    cat_result = await db.execute(
-        select(Category)
-        .join(JobCategory)
-        .where(JobCategory.job_id == job.id)
-    )
-    job.categories = [cat.name for cat in cat_result.scalars().all()]
-
-    # Set employer company name for response
-    if job.employer:
-        job.employer_company_name = job.employer.company_name
+    # Reload with employer, salaries and categories in a constant number of queries
+    job = await load_job(db, Job.id == job.id)
 
     return JobResponse.model_validate(job)
 
@@ -137,15 +156,10 @@ async def create_job(
 async def get_job(
     job_id: uuid.UUID,
     employer: Employer = Depends(get_current_employer),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db, scope="function"),
 ):
     """Get a job by ID."""
-    result = await db.execute(
-        select(Job)
-        .options(selectinload(Job.employer), selectinload(Job.salaries))
-        .where(and_(Job.id == job_id, Job.employer_id == employer.id))
-    )
-    job = result.scalar_one_or_none()
+    job = await load_job(db, Job.id == job_id, Job.employer_id == employer.id)
 
     if not job:
         raise HTTPException(
@@ -153,18 +167,6 @@ async def get_job(
             detail="Job not found",
         )
 
-    # Load categories
-    cat_result = await db.execute(
-        select(Category)
-        .join(JobCategory)
-        .where(JobCategory.job_id == job.id)
-    )
-    job.categories = [cat.name for cat in cat_result.scalars().all()]
-    
-    # Set employer company name for response (employer already loaded via selectinload)
-    if job.employer:
-        job.employer_company_name = job.employer.company_name
-
     return JobResponse.model_validate(job)
 
 
@@ -177,9 +179,7 @@ async def update_job(
 ):
     """Update a job."""
     result = await db.execute(
-        select(Job)
-        .options(selectinload(Job.employer), selectinload(Job.salaries))
-        .where(and_(Job.id == job_id, Job.employer_id == employer.id))
+        select(Job).where(and_(Job.id == job_id, Job.employer_id == employer.id))
     )
     job = result.scalar_one_or_none()
 
@@ -196,16 +196,25 @@ async def update_job(
             detail="At least one salary entry is required when salary is public",
         )
 
+    was_published = job.status == "published"
+
     # Update fields (excluding salaries and category_ids)
     update_data = data.model_dump(exclude_unset=True, exclude={"salaries", "category_ids"})
     for key, value in update_data.items():
         setattr(job, key, value)
+    if "description_md" in update_data:
+        job.excerpt = make_excerpt(job.description_md)
+
+    # Salary and category changes don't dirty the job row, so bump updated_at
+    # explicitly; it versions the job for public ETags
+    if data.salaries is not None or data.category_ids is not None:
+        job.updated_at = datetime.utcnow()
 
     # Update salaries if provided
     if data.salaries is not None:
         # Remove existing salaries
         await db.execute(
-            select(JobSalaryModel).where(JobSalaryModel.job_id == job.id)
+            delete(JobSalaryModel).where(JobSalaryModel.job_id == job.id)
         )
         # Add new salaries
         for salary_data in data.salaries:
@@ -221,27 +230,24 @@ async def update_job(
     if data.category_ids is not None:
         # Remove existing categories
         await db.execute(
-            select(JobCategory).where(JobCategory.job_id == job.id)
+            delete(JobCategory).where(JobCategory.job_id == job.id)
         )
         # Add new categories
         for cat_id in data.category_ids:
             job_category = JobCategory(job_id=job.id, category_id=cat_id)
             db.add(job_category)
 
+    # Keep the published job card in sync within the same transaction
+    await db.flush()
+    await sync_job_cards(db, [job.id])
     await db.commit()
-    await db.refresh(job, ["employer", "salaries"])
 
-    # Load categories
-    cat_result = await db.execute(
-        select(Category)
-        .join(JobCategory)
-        .where(JobCategory.job_id == job.id)
-    )
-    job.categories = [cat.name for cat in cat_result.scalars().all()]
+    # Invalidate cached public listings if the published set changed
+    if was_published or job.status == "published":
+        await bump_public_jobs_generation()
 
-    # Set employer company name for response (employer already loaded via selectinload)
-    if job.employer:
-        job.employer_company_name = job.employer.company_name
+    # Reload with employer, salaries and categories in a constant number of queries
+    job = await load_job(db, Job.id == job.id)
 
     return JobResponse.model_validate(job)
 
@@ -264,6 +270,12 @@ async def delete_job(
             detail="Job not found",
         )
 
+    was_published = job.status == "published"
+    # The published job card is removed by its ON DELETE CASCADE foreign key
     await db.delete(job)
     await db.commit()
 
+    # Invalidate cached public listings if the published set changed
+    if was_published:
+        await bump_public_jobs_generation()
+
@@ -1,53 +1,135 @@
-from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
-from sqlalchemy import select, or_, and_
+from typing import Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from sqlalchemy import Select, select, or_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
+from pydantic import BaseModel
 import uuid
 
-from app.db.session import get_db
-from app.db.models import Job, Category, JobCategory, Employer, JobSalary
-from sqlalchemy.orm import selectinload
-from app.schemas.job import JobResponse, JobPublicResponse
+from app.db.session import get_db, get_read_db
+from app.db.models import PublishedJobCard
+from app.db.read_model import salary_filter
+from app.db.search import search_matches, search_rank
+from app.db.facets import get_facet_counts
+from app.schemas.job import JobPublicResponse, JobPublicSummaryResponse, JobFacetsResponse
 from app.schemas.application import ApplicationCreate, ApplicationResponse
 from app.schemas.location import AtollResponse, LocationResponse
 from app.schemas.common import CursorPage
 from app.utils.pagination import get_cursor_paginated_results
+from app.utils.projection import normalize_fields, resolve_projection
+from app.utils.cache import (
+    get_public_jobs_page_key,
+    get_cached_public_jobs_page,
+    store_public_jobs_page,
+)
+from app.utils.http_cache import make_etag, etag_matches, public_cache_headers, not_modified
 
 router = APIRouter()
 
 
-def job_to_public_response(job: Job) -> JobPublicResponse:
-    """Convert a Job model to JobPublicResponse, respecting salary visibility."""
-    salaries = []
-    salary_hidden = None
-
-    if job.is_salary_public:
-        # Include salaries if public
-        salaries = job.salaries if hasattr(job, 'salaries') else []
-        salary_hidden = False
-    else:
-        # Hide salaries if not public
-        salaries = []
-        salary_hidden = True
-
+def card_to_public_response(card: PublishedJobCard) -> JobPublicResponse:
+    """Convert a published job card to JobPublicResponse, respecting salary visibility."""
     return JobPublicResponse(
-        id=job.id,
-        employer_id=job.employer_id,
-        employer_company_name=getattr(job, 'employer_company_name', getattr(job.employer, 'company_name', None)),
-        title=job.title,
-        description_md=job.description_md,
-        requirements_md=job.requirements_md,
-        location=job.location,
-        is_salary_public=job.is_salary_public,
-        salary_hidden=salary_hidden,
-        salaries=salaries,
-        status=job.status,
-        categories=getattr(job, 'categories', []),
-        tags=job.tags,
-        created_at=job.created_at,
-        updated_at=job.updated_at,
+        id=card.job_id,
+        employer_id=card.employer_id,
+        employer_company_name=card.employer_company_name,
+        title=card.title,
+        description_md=card.description_md,
+        requirements_md=card.requirements_md,
+        excerpt=card.excerpt,
+        location=card.location,
+        is_salary_public=card.is_salary_public,
+        # Cards only hold salaries when they are public
+        salary_hidden=not card.is_salary_public,
+        salaries=card.salaries,
+        status="published",
+        categories=card.categories,
+        tags=card.tags,
+        created_at=card.created_at,
+        updated_at=card.updated_at,
     )
 
+
+# Card columns backing each public response field, for projected listings
+PUBLIC_JOB_FIELD_COLUMNS = {
+    "id": [PublishedJobCard.job_id],
+    "salary_hidden": [PublishedJobCard.is_salary_public],
+    "status": [],
+}
+
+
+def project_card(card: PublishedJobCard, model: type[BaseModel]) -> BaseModel:
+    """Build a projected response from a card, reading only the model's fields."""
+    values = {}
+    for name in model.model_fields:
+        if name == "id":
+            values[name] = card.job_id
+        elif name == "salary_hidden":
+            values[name] = not card.is_salary_public
+        elif name == "status":
+            values[name] = "published"
+        else:
+            values[name] = getattr(card, name)
+    return model.model_validate(values)
+
+
+def card_columns(model: type[BaseModel]) -> list:
+    """Card columns needed to build `model`, for load_only."""
+    columns = []
+    for name in model.model_fields:
+        columns.extend(PUBLIC_JOB_FIELD_COLUMNS.get(name, [getattr(PublishedJobCard, name, None)]))
+    return [column for column in columns if column is not None]
+
+
+def filter_public_jobs(
+    query: Select,
+    q: Optional[str],
+    location: Optional[str],
+    salary_min: Optional[float],
+    salary_max: Optional[float],
+    salary_currency: Optional[str],
+) -> Select:
+    """Apply the public listing filters to a query over published job cards."""
+    if q:
+        # Full-text search over the weighted, GIN-indexed search vector
+        query = query.where(search_matches(PublishedJobCard.search_vector, q))
+
+    if location:
+        if location.lower() == "maldives":
+            # "maldives" matches all jobs since all current jobs are in Maldives
+            # In the future, this could be filtered by country if we add international jobs
+            pass  # No additional filtering needed - show all jobs
+        elif location.lower() == "remote":
+            # Remote jobs - look for "remote" in location, title, or description
+            query = query.where(
+                or_(
+                    PublishedJobCard.location.ilike("%remote%"),
+                    PublishedJobCard.title.ilike("%remote%"),
+                    PublishedJobCard.description_md.ilike("%remote%")
+                )
+            )
+        elif location.lower() == "hybrid":
+            # Hybrid jobs - look for "hybrid" in location, title, or description
+            query = query.where(
+                or_(
+                    PublishedJobCard.location.ilike("%hybrid%"),
+                    PublishedJobCard.title.ilike("%hybrid%"),
+                    PublishedJobCard.description_md.ilike("%hybrid%")
+                )
+            )
+        else:
+            # Specific location search (e.g., "Male'", "Ari Atoll")
+            query = query.where(PublishedJobCard.location.ilike(f"%{location}%"))
+
+    # Salary filtering on the precomputed currency set and per-currency
+    # salary ranges (GIN/GiST-indexed containment instead of anti-join subqueries)
+    salary_predicate = salary_filter(salary_min, salary_max, salary_currency)
+    if salary_predicate is not None:
+        query = query.where(salary_predicate)
+
+    return query
+
+
 # Maldives locations data - all 26 atolls with major inhabited islands
 MALDIVES_LOCATIONS = [
     {
@@ -167,166 +249,219 @@ async def get_locations():
     return {"locations": MALDIVES_LOCATIONS}
 
 
-@router.get("/jobs", response_model=CursorPage[JobPublicResponse])
+@router.get("/jobs", response_model=CursorPage[Union[JobPublicResponse, JobPublicSummaryResponse]])
 async def list_public_jobs(
+    request: Request,
     cursor: Optional[str] = Query(None),
     q: Optional[str] = Query(None),
     location: Optional[str] = Query(None),
     salary_min: Optional[float] = Query(None),
     salary_max: Optional[float] = Query(None),
     salary_currency: Optional[str] = Query(None, regex="^(MVR|USD)$"),
-    sort_by: Optional[str] = Query("created_at", regex="^(created_at|updated_at)$"),
+    sort_by: Optional[str] = Query("created_at", regex="^(created_at|updated_at|relevance)$"),
     sort_order: Optional[str] = Query("desc", regex="^(asc|desc)$"),
-    db: AsyncSession = Depends(get_db),
+    view: Optional[str] = Query("full", regex="^(full|summary)$"),
+    fields: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_read_db, scope="function"),
 ):
     """
     List all published jobs (public endpoint).
 
+    Projection:
+    - view=summary returns a lean item with a plain-text excerpt instead of the
+      markdown description and requirements
+    - fields=a,b,c returns only those fields of the selected view (id is always included)
+    - Only the columns backing the returned fields are read from the database
+
     Filtering behavior:
     - Currency filtering: If salary_currency is provided, shows only jobs that have at least one salary in that currency
-    - Salary range filtering: If salary_min/salary_max are provided, further filters to show only jobs where salaries fall within the range
+    - Salary range filtering: If salary_min and/or salary_max are provided, further filters to show only jobs where salaries fall within the range (a missing bound is open-ended)
     - Combined: When both currency and range are specified, shows jobs that have salaries in the specified currency AND within the specified range
     - No filters: Shows all jobs regardless of currency or salary
-    """
-    query = select(Job).options(selectinload(Job.employer), selectinload(Job.salaries)).where(Job.status == "published")
 
-    if q:
-        query = query.where(
-            or_(
-                Job.title.ilike(f"%{q}%"),
-                Job.description_md.ilike(f"%{q}%"),
-            )
-        )
+    Search behavior:
+    - q is matched with full-text search (websearch syntax: "quoted phrases", OR, -exclusions)
+    - sort_by=relevance ranks matches by title > tags > requirements > description;
+      without q it falls back to created_at
 
-    if location:
-        if location.lower() == "maldives":
-            # "maldives" matches all jobs since all current jobs are in Maldives
-            # In the future, this could be filtered by country if we add international jobs
-            pass  # No additional filtering needed - show all jobs
-        elif location.lower() == "remote":
-            # Remote jobs - look for "remote" in location, title, or description
-            query = query.where(
-                or_(
-                    Job.location.ilike("%remote%"),
-                    Job.title.ilike("%remote%"),
-                    Job.description_md.ilike("%remote%")
-                )
-            )
-        elif location.lower() == "hybrid":
-            # Hybrid jobs - look for "hybrid" in location, title, or description
-            query = query.where(
-                or_(
-                    Job.location.ilike("%hybrid%"),
-                    Job.title.ilike("%hybrid%"),
-                    Job.description_md.ilike("%hybrid%")
-                )
-            )
-        else:
-            # Specific location search (e.g., "Male'", "Ari Atoll")
-            query = query.where(Job.location.ilike(f"%{location}%"))
-
-    # Currency filtering: if currency is specified, only show jobs that have salaries in that currency
-    if salary_currency:
-        # Find jobs that have salaries in the selected currency
-        jobs_with_currency_subquery = select(JobSalary.job_id).where(
-            JobSalary.currency == salary_currency
-        ).distinct()
-        query = query.where(Job.id.in_(select(jobs_with_currency_subquery.c.job_id)))
-
-    # Salary range filtering: if range is specified, further filter jobs where salaries fall within the range
-    if salary_min is not None and salary_max is not None:
-        # For currency-specific filtering, check salaries in the selected currency (or all currencies if no currency selected)
-        currency_filter = JobSalary.currency == salary_currency if salary_currency else True
-
-        # Subquery to find jobs that have salaries that DON'T match the range
-        non_matching_salaries_subquery = select(JobSalary.job_id).where(
-            and_(
-                currency_filter,
-                # Either amount_min is less than salary_min OR amount_max is greater than salary_max
-                # OR amount_min/amount_max are NULL (which we consider as not matching)
-                or_(
-                    JobSalary.amount_min < salary_min,
-                    JobSalary.amount_max > salary_max,
-                    JobSalary.amount_min.is_(None),
-                    JobSalary.amount_max.is_(None)
-                )
-            )
-        ).subquery()
+    Pages are cached in Redis by normalized query and invalidated whenever a
+    published job changes. The ETag is derived from the same generation-scoped
+    key, so a matching If-None-Match returns 304 without touching the database.
+    """
+    cache_params = {
+        "cursor": cursor,
+        "q": q,
+        "location": location.lower() if location else None,
+        "salary_min": salary_min,
+        "salary_max": salary_max,
+        "salary_currency": salary_currency,
+        "sort_by": sort_by,
+        "sort_order": sort_order,
+        "view": view,
+        "fields": normalize_fields(fields),
+    }
+    projection = resolve_projection(view, fields, JobPublicResponse, JobPublicSummaryResponse)
+    cache_key = await get_public_jobs_page_key(cache_params)
+    if cache_key:
+        etag = make_etag(cache_key)
+        if etag_matches(request, etag):
+            return not_modified(etag)
 
-        # Exclude jobs that have any non-matching salaries
-        query = query.where(
-            ~Job.id.in_(select(non_matching_salaries_subquery.c.job_id))
-        )
+        cached_body = await get_cached_public_jobs_page(cache_key)
+        if cached_body is not None:
+            return Response(
+                content=cached_body,
+                media_type="application/json",
+                headers=public_cache_headers(etag),
+            )
 
-    # Apply ordering
-    sort_column = getattr(Job, sort_by) if sort_by in ['created_at', 'updated_at'] else Job.created_at
-    query = query.order_by(sort_column.desc() if sort_order == "desc" else sort_column.asc())
+    # Published job cards hold one denormalized row per published job, so no joins
+    query = select(PublishedJobCard)
+    if projection:
+        query = query.options(load_only(*card_columns(projection)))
+    query = filter_public_jobs(query, q, location, salary_min, salary_max, salary_currency)
 
-    # Cursor pagination
-    jobs, next_cursor = await get_cursor_paginated_results(
+    # Keyset pagination ordered by (sort column, id)
+    if sort_by == "relevance" and q:
+        # Relevance ranking only applies to text searches
+        sort_column = search_rank(PublishedJobCard.search_vector, q)
+    elif sort_by == "updated_at":
+        sort_column = PublishedJobCard.updated_at
+    else:
+        sort_column = PublishedJobCard.created_at
+    cards, next_cursor, prev_cursor = await get_cursor_paginated_results(
         db=db,
         query=query,
         cursor=cursor,
         page_size=20,
-        id_field=Job.id,
+        id_field=PublishedJobCard.job_id,
+        sort_field=sort_column,
+        sort_order=sort_order,
     )
 
-    # Load categories and set employer company name
-    for job in jobs:
-        cat_result = await db.execute(
-            select(Category)
-            .join(JobCategory)
-            .where(JobCategory.job_id == job.id)
+    if projection:
+        page = CursorPage[projection](
+            items=[project_card(card, projection) for card in cards],
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
         )
-        job.categories = [cat.name for cat in cat_result.scalars().all()]
-        # Set employer company name for response
-        if job.employer:
-            job.employer_company_name = job.employer.company_name
+    else:
+        page = CursorPage(
+            items=[card_to_public_response(card) for card in cards],
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
+        )
+    body = page.model_dump_json()
 
-    items = [job_to_public_response(job) for job in jobs]
+    if cache_key:
+        await store_public_jobs_page(cache_key, body)
+    else:
+        # Generation unavailable: fall back to a content-derived ETag
+        etag = make_etag(body)
 
-    return CursorPage(items=items, next_cursor=next_cursor)
+    return Response(content=body, media_type="application/json", headers=public_cache_headers(etag))
+
+
+@router.get("/jobs/facets", response_model=JobFacetsResponse)
+async def get_public_job_facets(
+    request: Request,
+    q: Optional[str] = Query(None),
+    location: Optional[str] = Query(None),
+    salary_min: Optional[float] = Query(None),
+    salary_max: Optional[float] = Query(None),
+    salary_currency: Optional[str] = Query(None, regex="^(MVR|USD)$"),
+    db: AsyncSession = Depends(get_read_db, scope="function"),
+):
+    """
+    Facet counts for the public job listing (public endpoint).
+
+    Accepts the same filters as GET /jobs and returns counts per category,
+    location, salary currency and salary band, computed in one grouped query.
+    Salary bands are keyed by each job's lowest offered salary in that currency.
+
+    Results share the listing cache generation, so they are invalidated whenever
+    the set of published jobs changes.
+    """
+    cache_params = {
+        "view": "facets",
+        "q": q,
+        "location": location.lower() if location else None,
+        "salary_min": salary_min,
+        "salary_max": salary_max,
+        "salary_currency": salary_currency,
+    }
+    cache_key = await get_public_jobs_page_key(cache_params)
+    if cache_key:
+        etag = make_etag(cache_key)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+
+        cached_body = await get_cached_public_jobs_page(cache_key)
+        if cached_body is not None:
+            return Response(
+                content=cached_body,
+                media_type="application/json",
+                headers=public_cache_headers(etag),
+            )
+
+    query = filter_public_jobs(
+        select(PublishedJobCard), q, location, salary_min, salary_max, salary_currency
+    )
+    facets = await get_facet_counts(db, query)
+    body = JobFacetsResponse(**facets).model_dump_json()
+
+    if cache_key:
+        await store_public_jobs_page(cache_key, body)
+    else:
+        etag = make_etag(body)
+
+    return Response(content=body, media_type="application/json", headers=public_cache_headers(etag))
 
 
 @router.get("/jobs/{job_id}", response_model=JobPublicResponse)
 async def get_public_job(
     job_id: uuid.UUID,
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db, scope="function"),
 ):
-    """Get a published job by ID (public endpoint)."""
+    """
+    Get a published job by ID (public endpoint).
+
+    The card's refresh timestamp provides the ETag, so a matching If-None-Match
+    returns 304 without reading the job body.
+    """
     result = await db.execute(
-        select(Job)
-        .options(selectinload(Job.employer), selectinload(Job.salaries))
-        .where(and_(Job.id == job_id, Job.status == "published"))
+        select(PublishedJobCard.refreshed_at).where(PublishedJobCard.job_id == job_id)
     )
-    job = result.scalar_one_or_none()
+    refreshed_at = result.scalar_one_or_none()
 
-    if not job:
+    if refreshed_at is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Job not found",
         )
 
-    # Load categories
-    cat_result = await db.execute(
-        select(Category)
-        .join(JobCategory)
-        .where(JobCategory.job_id == job.id)
-    )
-    job.categories = [cat.name for cat in cat_result.scalars().all()]
+    etag = make_etag(job_id, refreshed_at.isoformat())
+    if etag_matches(request, etag):
+        return not_modified(etag)
 
-    # Set employer company name for response
-    if job.employer:
-        job.employer_company_name = job.employer.company_name
+    card = await db.get(PublishedJobCard, job_id)
 
-    return job_to_public_response(job)
+    if not card:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found",
+        )
+
+    response.headers.update(public_cache_headers(etag))
+    return card_to_public_response(card)
 
 
 @router.post("/jobs/{job_id}/apply", response_model=ApplicationResponse, status_code=status.HTTP_201_CREATED)
 async def apply_to_job(
     job_id: uuid.UUID,
     data: ApplicationCreate,
-    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
     """Apply to a job (public endpoint)."""
@@ -339,4 +474,4 @@ async def apply_to_job(
         cover_letter_md=data.cover_letter_md,
         job_id=job_id,
     )
-    return await create_public_application(job_id, application_data, request, db)
\ No newline at end of file
+    return await create_public_application(job_id, application_data, db)
\ No newline at end of file
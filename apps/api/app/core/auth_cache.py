@@ -0,0 +1,185 @@
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Optional
+import hashlib
+import json
+import time
+import uuid
+from sqlalchemy import select
+import structlog
+
+from app.core.config import settings
+from app.core.metrics import AUTH_CACHE_REQUESTS
+from app.core.security import verify_token, is_token_blacklisted
+from app.db.models import Employer
+from app.db.session import read_only_session
+from app.utils.idempotency import get_redis
+
+logger = structlog.get_logger(__name__)
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire at a per-entry wall-clock time."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Any) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Any, value: Any, expires_at: float) -> None:
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Any) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# Verified access token claims, keyed by a hash of the token and kept until `exp`
+_token_claims = TTLCache(settings.AUTH_TOKEN_CACHE_SIZE)
+# Employer principals (no password hash), keyed by employer id
+_employer_principals = TTLCache(settings.EMPLOYER_PRINCIPAL_CACHE_SIZE)
+
+
+def _token_key(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+async def verify_token_cached(token: str) -> tuple[bool, Optional[dict], Optional[str]]:
+    """
+    verify_token with a cache of verified claims.
+
+    Repeat calls with the same token skip the RS256 signature check until the
+    token expires. Revocation is still checked on every call.
+    """
+    key = _token_key(token)
+    payload = _token_claims.get(key)
+    if payload is not None:
+        AUTH_CACHE_REQUESTS.labels(cache="token", result="hit").inc()
+        jti = payload.get("jti")
+        if jti and await is_token_blacklisted(jti):
+            _token_claims.pop(key)
+            logger.warning("JWT token is blacklisted", jti=jti)
+            return False, None, "Token has been revoked"
+        return True, payload, None
+
+    AUTH_CACHE_REQUESTS.labels(cache="token", result="miss").inc()
+    is_valid, payload, error_message = await verify_token(token)
+    if is_valid and payload and payload.get("exp"):
+        _token_claims.set(key, payload, float(payload["exp"]))
+    return is_valid, payload, error_message
+
+
+def forget_token(token: str) -> None:
+    """Drop a token's cached claims (on logout)."""
+    _token_claims.pop(_token_key(token))
+
+
+def _principal_key(employer_id: uuid.UUID) -> str:
+    return f"employer:principal:{employer_id}"
+
+
+def _employer_to_principal(employer: Employer) -> dict:
+    return {
+        "id": str(employer.id),
+        "company_name": employer.company_name,
+        "email": employer.email,
+        "contact_info": employer.contact_info,
+        "created_at": employer.created_at.isoformat(),
+    }
+
+
+def _principal_to_employer(principal: dict) -> Employer:
+    # A transient instance: callers that modify the employer must load it from the session
+    return Employer(
+        id=uuid.UUID(principal["id"]),
+        company_name=principal["company_name"],
+        email=principal["email"],
+        contact_info=principal["contact_info"],
+        created_at=datetime.fromisoformat(principal["created_at"]),
+    )
+
+
+async def get_employer_principal(employer_id: uuid.UUID) -> Optional[Employer]:
+    """
+    Load the authenticated employer, via the in-process and Redis principal caches.
+
+    On a cache miss the employer is read in its own short READ ONLY session on the
+    primary (a just-registered employer may not be on a replica yet), so routes on
+    read-only sessions never open a read-write one for authentication.
+
+    Returns a transient Employer without its password hash, or None if the
+    employer does not exist.
+    """
+    principal = _employer_principals.get(employer_id)
+    if principal is not None:
+        AUTH_CACHE_REQUESTS.labels(cache="principal_local", result="hit").inc()
+        return _principal_to_employer(principal)
+    AUTH_CACHE_REQUESTS.labels(cache="principal_local", result="miss").inc()
+
+    local_expires_at = time.time() + settings.EMPLOYER_PRINCIPAL_LOCAL_TTL_SECONDS
+    try:
+        r = await get_redis()
+        cached = await r.get(_principal_key(employer_id))
+    except Exception as e:
+        logger.error("Employer principal cache lookup failed", error=str(e))
+        cached = None
+    else:
+        AUTH_CACHE_REQUESTS.labels(
+            cache="principal_redis", result="hit" if cached is not None else "miss"
+        ).inc()
+
+    if cached is not None:
+        principal = json.loads(cached)
+        _employer_principals.set(employer_id, principal, local_expires_at)
+        return _principal_to_employer(principal)
+
+    # The session (and its connection) is closed before the Redis write
+    async with read_only_session() as db:
+        result = await db.execute(select(Employer).where(Employer.id == employer_id))
+        employer = result.scalar_one_or_none()
+    if employer is None:
+        return None
+
+    principal = _employer_to_principal(employer)
+    _employer_principals.set(employer_id, principal, local_expires_at)
+    try:
+        r = await get_redis()
+        await r.setex(
+            _principal_key(employer_id),
+            settings.EMPLOYER_PRINCIPAL_CACHE_TTL_SECONDS,
+            json.dumps(principal),
+        )
+    except Exception as e:
+        logger.error("Failed to cache employer principal", error=str(e))
+
+    return _principal_to_employer(principal)
+
+
+async def invalidate_employer_principal(employer_id: uuid.UUID) -> None:
+    """
+    Drop an employer's cached principal (after profile changes and on logout).
+
+    Other processes may serve their in-process copy for up to
+    EMPLOYER_PRINCIPAL_LOCAL_TTL_SECONDS.
+    """
+    _employer_principals.pop(employer_id)
+    try:
+        r = await get_redis()
+        await r.delete(_principal_key(employer_id))
+    except Exception as e:
+        logger.error("Failed to invalidate employer principal", error=str(e))
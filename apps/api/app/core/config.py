@@ -1,7 +1,40 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import field_validator
+from pydantic import BaseModel, field_validator
+from pathlib import Path
 from typing import List, Union
 import json
+import re
+
+# apps/api, so default file paths don't depend on the working directory
+API_DIR = Path(__file__).resolve().parents[2]
+
+
+class RateLimitPolicy(BaseModel):
+    """A rate limit applied by RateLimitMiddleware to requests matching a route."""
+
+    # Path template, e.g. "/api/v1/public/jobs/{job_id}", or "*" for every path
+    path: str
+    # HTTP methods, or ["*"] for all
+    methods: List[str] = ["GET"]
+    limit: int
+    window_seconds: int = 60
+    # Extra cost added when a query parameter is present, e.g. {"q": 4}
+    query_costs: dict[str, int] = {}
+    detail: str = "Too many requests"
+
+
+def _to_async_database_url(v: str) -> str:
+    """Convert postgresql:// to postgresql+asyncpg:// for async support."""
+    if v and v.startswith("postgresql://"):
+        url = v.replace("postgresql://", "postgresql+asyncpg://", 1)
+        # asyncpg doesn't support sslmode parameter, remove it while preserving other params
+        # SSL is negotiated automatically by asyncpg
+        url = re.sub(r'[?&]sslmode=[^&]*', '', url)
+        # Clean up any double & or trailing ?
+        url = re.sub(r'\?&', '?', url)
+        url = re.sub(r'\?$', '', url)
+        return url
+    return v
 
 
 class Settings(BaseSettings):
@@ -18,21 +51,61 @@ class Settings(BaseSettings):
     @classmethod
     def convert_database_url(cls, v: str) -> str:
         """Convert postgresql:// to postgresql+asyncpg:// for async support."""
-        if v and v.startswith("postgresql://"):
-            url = v.replace("postgresql://", "postgresql+asyncpg://", 1)
-            # asyncpg doesn't support sslmode parameter, remove it while preserving other params
-            # SSL is negotiated automatically by asyncpg
-            import re
-            url = re.sub(r'[?&]sslmode=[^&]*', '', url)
-            # Clean up any double & or trailing ?
-            url = re.sub(r'\?&', '?', url)
-            url = re.sub(r'\?$', '', url)
-            return url
-        return v
+        return _to_async_database_url(v)
+
+    # Read replicas for read-only endpoints - comma-separated string or JSON list.
+    # Empty means every query goes to DATABASE_URL.
+    DATABASE_REPLICA_URLS: Union[str, List[str]] = []
+
+    @field_validator("DATABASE_REPLICA_URLS", mode="before")
+    @classmethod
+    def parse_database_replica_urls(cls, v: Union[str, List[str]]) -> List[str]:
+        if isinstance(v, str):
+            if v.startswith("["):
+                v = json.loads(v)
+            else:
+                v = [url.strip() for url in v.split(",") if url.strip()]
+        return [_to_async_database_url(url) for url in v]
+
+    # Replicas are pinged every HEALTH_CHECK seconds and skipped while unreachable
+    # or more than MAX_LAG seconds behind the primary
+    DB_REPLICA_HEALTH_CHECK_SECONDS: float = 5
+    DB_REPLICA_MAX_LAG_SECONDS: float = 5
+    # Read-your-writes: after a successful write, the client's reads go to the
+    # primary for this long (tracked with a cookie)
+    DB_REPLICA_PRIMARY_PIN_SECONDS: int = 10
+    # Read-only sessions run READ ONLY transactions. DEFERRABLE upgrades them to
+    # SERIALIZABLE READ ONLY DEFERRABLE: a consistent snapshot that can never fail
+    # with a serialization error, but may wait briefly to start.
+    DB_READ_ONLY_DEFERRABLE: bool = False
+
+    # Database connection pool
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 30
+    # Connections older than this are replaced on checkout (0 disables)
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    # Connections opened at startup so the first requests don't pay for connecting
+    DB_POOL_WARMUP_CONNECTIONS: int = 5
+    # Prepared statement caches per connection (set to 0 behind PgBouncer in
+    # transaction pooling mode)
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    # Startup fails unless the database is at the Alembic head revision
+    # (`alembic upgrade head`); the application never creates tables itself
+    DB_SCHEMA_CHECK_ENABLED: bool = True
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
 
+    # Public job listing response cache (Redis, invalidated by generation counter)
+    PUBLIC_JOBS_CACHE_ENABLED: bool = True
+    PUBLIC_JOBS_CACHE_TTL_SECONDS: int = 300
+
+    # HTTP caching for public endpoints (browser/CDN)
+    PUBLIC_CACHE_MAX_AGE_SECONDS: int = 30
+    PUBLIC_CACHE_STALE_WHILE_REVALIDATE_SECONDS: int = 120
+
     # CORS - parse from comma-separated string or JSON
     CORS_ORIGINS: Union[str, List[str]] = "http://localhost:3000"
 
@@ -60,16 +133,97 @@ class Settings(BaseSettings):
 
     # JWT Key Paths - Can be overridden via environment variables
     # In production, use secure key management services (AWS KMS, HashiCorp Vault, etc.)
-    # Default paths are relative to project root, keys auto-generate if missing
-    JWKS_PRIVATE_KEY_PATH: str = "apps/api/keys/jwt-private.pem"  # File permissions: 600
-    JWKS_PUBLIC_KEY_PATH: str = "apps/api/keys/jwt-public.pem"    # File permissions: 644
+    # Default paths are in apps/api/keys (git-ignored), keys auto-generate if missing
+    JWKS_PRIVATE_KEY_PATH: str = str(API_DIR / "keys" / "jwt-private.pem")  # File permissions: 600
+    JWKS_PUBLIC_KEY_PATH: str = str(API_DIR / "keys" / "jwt-public.pem")    # File permissions: 644
     JWKS_KID: str = "jobsmv-key-1"
+    # Retired keys still accepted for verification during rotation, as a JSON
+    # object mapping kid -> public key PEM path
+    JWKS_PREVIOUS_PUBLIC_KEYS: dict[str, str] = {}
+    # Key files are checked for changes (mtime) at most this often
+    JWKS_RELOAD_INTERVAL_SECONDS: float = 5.0
     JWT_ACCESS_TOKEN_EXPIRE_HOURS: int = 24  # 24 hours for better user experience
     JWT_REFRESH_TOKEN_EXPIRE_DAYS: int = 30
 
+    # Rate limiting: clients denied recently are rejected in-process until their
+    # retry-after passes, without a Redis round trip
+    RATE_LIMIT_LOCAL_PRECHECK: bool = True
+    RATE_LIMIT_LOCAL_BLOCKS_MAX: int = 10000
+    RATE_LIMIT_ENABLED: bool = True
+    # Per-route policies (JSON object in the environment), keyed by policy name.
+    # Requests are limited per client IP. The first route policy matching a request
+    # applies, together with every "*" (global) policy. A request's cost is 1 plus
+    # the query_costs of the parameters it uses.
+    RATE_LIMIT_POLICIES: dict[str, RateLimitPolicy] = {
+        "register": RateLimitPolicy(
+            path="/api/v1/auth/register", methods=["POST"], limit=5, window_seconds=300,
+            detail="Too many registration attempts",
+        ),
+        "login": RateLimitPolicy(
+            path="/api/v1/auth/login", methods=["POST"], limit=10, window_seconds=60,
+            detail="Too many login attempts",
+        ),
+        "refresh": RateLimitPolicy(
+            path="/api/v1/auth/refresh", methods=["POST"], limit=30, window_seconds=60,
+            detail="Too many token refresh attempts",
+        ),
+        "apply": RateLimitPolicy(
+            path="/api/v1/public/jobs/{job_id}/apply", methods=["POST"], limit=5, window_seconds=300,
+            detail="Too many application attempts",
+        ),
+        "public_job_search": RateLimitPolicy(
+            path="/api/v1/public/jobs", limit=240, window_seconds=60,
+            query_costs={"q": 4, "salary_min": 2, "salary_max": 2, "salary_currency": 1},
+        ),
+        "public_job_facets": RateLimitPolicy(
+            path="/api/v1/public/jobs/facets", limit=120, window_seconds=60,
+            query_costs={"q": 4, "salary_min": 2, "salary_max": 2, "salary_currency": 1},
+        ),
+        "public_job": RateLimitPolicy(
+            path="/api/v1/public/jobs/{job_id}", limit=300, window_seconds=60,
+        ),
+    }
+
+    # Idempotency-Key support for write routes ("METHOD path-template")
+    IDEMPOTENCY_ROUTES: List[str] = [
+        "POST /api/v1/jobs",
+        "POST /api/v1/public/jobs/{job_id}/apply",
+        "POST /api/v1/auth/register",
+    ]
+    IDEMPOTENCY_TTL_SECONDS: int = 86400
+    # Lock held while the first request runs; duplicates wait up to LOCK_WAIT for it
+    IDEMPOTENCY_LOCK_TTL_SECONDS: int = 30
+    IDEMPOTENCY_LOCK_WAIT_SECONDS: int = 10
+    # Keyed request bodies are buffered to fingerprint them; larger ones get a 413
+    IDEMPOTENCY_MAX_BODY_BYTES: int = 1024 * 1024
+
     # Security
     SECRET_KEY: str = "change-me-in-production"
     BCRYPT_ROUNDS: int = 12
+    # bcrypt runs on a bounded thread pool off the event loop; calls beyond
+    # workers + queue depth are rejected with 429
+    HASH_EXECUTOR_WORKERS: int = 2
+    HASH_EXECUTOR_QUEUE_DEPTH: int = 16
+    # Accept pre selector/verifier refresh tokens (bcrypt-checked) so existing
+    # sessions rotate into the new format instead of logging everyone out. Turn
+    # off once JWT_REFRESH_TOKEN_EXPIRE_DAYS have passed since the new format was
+    # deployed: by then every legacy row has expired. Only the requesting
+    # employer's legacy rows are checked, at most LEGACY_SCAN_LIMIT of the newest,
+    # bounding the bcrypt work an invalid token can cause.
+    REFRESH_TOKEN_ACCEPT_LEGACY: bool = True
+    REFRESH_TOKEN_LEGACY_SCAN_LIMIT: int = 10
+
+    # Authentication caches: verified token claims are kept until the token's exp;
+    # employer principals are kept briefly in-process and a little longer in Redis
+    AUTH_TOKEN_CACHE_SIZE: int = 10000
+    # Local filter of revoked token IDs (synced from Redis via pub/sub). Memory is
+    # BLOOM_BITS / 8 bytes per generation; generations span the access token lifetime.
+    TOKEN_REVOCATION_BLOOM_BITS: int = 1 << 20
+    TOKEN_REVOCATION_BLOOM_HASHES: int = 7
+    TOKEN_REVOCATION_BLOOM_GENERATIONS: int = 4
+    EMPLOYER_PRINCIPAL_CACHE_SIZE: int = 10000
+    EMPLOYER_PRINCIPAL_LOCAL_TTL_SECONDS: int = 5
+    EMPLOYER_PRINCIPAL_CACHE_TTL_SECONDS: int = 60
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -1,10 +1,10 @@
 from typing import Optional
+import uuid
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import structlog
 
-from app.core.security import verify_token, blacklist_token
-from app.db.session import AsyncSession, get_db
+from app.core.auth_cache import verify_token_cached, get_employer_principal
 from app.db.models import Employer
 
 logger = structlog.get_logger(__name__)
@@ -14,11 +14,17 @@ security = HTTPBearer()
 
 async def get_current_employer(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db),
 ) -> Employer:
-    """Get the current employer from JWT token with enhanced validation."""
+    """
+    Get the current employer from JWT token with enhanced validation.
+
+    Verified claims and the employer principal are cached, so repeat calls with
+    the same token skip both the signature check and the database; a cache miss
+    reads the employer in a short read-only session of its own. The returned
+    employer is transient; handlers that modify it must load it from their session.
+    """
     token = credentials.credentials
-    is_valid, payload, error_message = verify_token(token)
+    is_valid, payload, error_message = await verify_token_cached(token)
 
     if not is_valid or payload is None:
         error_detail = error_message or "Invalid authentication credentials"
@@ -47,11 +53,18 @@ async def get_current_employer(
             detail="Insufficient permissions",
         )
 
-    # Fetch employer from database
-    from sqlalchemy import select
+    try:
+        employer_id = uuid.UUID(str(employer_id))
+    except ValueError:
+        logger.warning("JWT token has malformed employer_id claim")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
-    result = await db.execute(select(Employer).where(Employer.id == employer_id))
-    employer = result.scalar_one_or_none()
+    # Fetch employer from the principal cache, falling back to the database
+    employer = await get_employer_principal(employer_id)
 
     if employer is None:
         logger.warning("JWT token references non-existent employer", employer_id=employer_id)
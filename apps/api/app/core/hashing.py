@@ -0,0 +1,69 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+import asyncio
+import time
+from fastapi import HTTPException, status
+import structlog
+
+from app.core.config import settings
+from app.core.metrics import (
+    HASH_DURATION,
+    HASH_IN_FLIGHT,
+    HASH_QUEUE_WAIT,
+    HASH_REJECTED,
+)
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+# bcrypt releases the GIL while hashing, so a small thread pool keeps the event
+# loop responsive without the cost of a process pool.
+_executor = ThreadPoolExecutor(
+    max_workers=settings.HASH_EXECUTOR_WORKERS, thread_name_prefix="hash"
+)
+# Calls submitted and not yet finished (running or queued)
+_in_flight = 0
+
+
+async def run_in_hash_executor(fn: Callable[..., T], *args) -> T:
+    """
+    Run a password/token hashing function on the bounded hashing executor.
+
+    At most HASH_EXECUTOR_WORKERS calls run at once and HASH_EXECUTOR_QUEUE_DEPTH
+    more may wait; beyond that the request is rejected with 429 instead of
+    queueing indefinitely.
+    """
+    global _in_flight
+    if _in_flight >= settings.HASH_EXECUTOR_WORKERS + settings.HASH_EXECUTOR_QUEUE_DEPTH:
+        HASH_REJECTED.inc()
+        logger.warning("Hashing executor saturated", in_flight=_in_flight)
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Server busy, please retry",
+            headers={"Retry-After": "1"},
+        )
+
+    operation = fn.__name__
+    submitted_at = time.perf_counter()
+
+    def timed() -> T:
+        started_at = time.perf_counter()
+        HASH_QUEUE_WAIT.labels(operation=operation).observe(started_at - submitted_at)
+        try:
+            return fn(*args)
+        finally:
+            HASH_DURATION.labels(operation=operation).observe(time.perf_counter() - started_at)
+
+    _in_flight += 1
+    HASH_IN_FLIGHT.inc()
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_executor, timed)
+    finally:
+        _in_flight -= 1
+        HASH_IN_FLIGHT.dec()
+
+
+def shutdown_hash_executor() -> None:
+    """Stop the hashing executor's threads (application shutdown)."""
+    _executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,198 @@
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+import fcntl
+import os
+import stat
+import tempfile
+import threading
+import time
+from jose import jwk
+from jose.backends.base import Key
+import structlog
+
+from app.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+
+@contextmanager
+def _generation_lock(private_key_path: Path) -> Iterator[None]:
+    """Exclusive inter-process lock held while checking for and generating keys."""
+    lock_path = private_key_path.with_name(private_key_path.name + ".lock")
+    with open(lock_path, "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _write_atomic(path: Path, data: bytes, mode: int) -> None:
+    """Write a file via a temporary sibling and rename, so readers never see partial keys."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        os.fchmod(fd, mode)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def ensure_jwt_key_pair(private_key_path: Path, public_key_path: Path) -> None:
+    """
+    Generate an RSA key pair if either key file is missing.
+
+    Safe to call from several workers booting at once: generation happens under a
+    file lock and each key is written atomically with secure permissions (600 for
+    the private key, 644 for the public key).
+    """
+    if private_key_path.exists() and public_key_path.exists():
+        return
+
+    private_key_path.parent.mkdir(parents=True, exist_ok=True)
+    with _generation_lock(private_key_path):
+        # Another worker may have generated the keys while we waited for the lock
+        if private_key_path.exists() and public_key_path.exists():
+            return
+
+        logger.info("JWT keys not found, generating new RSA key pair",
+                   private_key_path=str(private_key_path),
+                   public_key_path=str(public_key_path))
+        from cryptography.hazmat.primitives.asymmetric import rsa
+        from cryptography.hazmat.primitives import serialization
+
+        private_key = rsa.generate_private_key(
+            public_exponent=65537,
+            key_size=2048,
+        )
+        public_key = private_key.public_key()
+
+        _write_atomic(
+            private_key_path,
+            private_key.private_bytes(
+                encoding=serialization.Encoding.PEM,
+                format=serialization.PrivateFormat.PKCS8,
+                encryption_algorithm=serialization.NoEncryption(),
+            ),
+            stat.S_IRUSR | stat.S_IWUSR,
+        )
+        _write_atomic(
+            public_key_path,
+            public_key.public_bytes(
+                encoding=serialization.Encoding.PEM,
+                format=serialization.PublicFormat.SubjectPublicKeyInfo,
+            ),
+            stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP | stat.S_IROTH,
+        )
+
+        logger.info("JWT keys generated successfully with secure permissions")
+
+
+class JWTKeyRing:
+    """
+    Process-wide cache of parsed JWT keys.
+
+    Keys are read and parsed once, then reloaded only when a key file's mtime
+    changes. File mtimes are checked at most every JWKS_RELOAD_INTERVAL_SECONDS,
+    so token operations normally do no filesystem I/O at all.
+
+    The current key pair (JWKS_KID) signs tokens. Public keys listed in
+    JWKS_PREVIOUS_PUBLIC_KEYS stay valid for verification during rotation.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._signing_key: Optional[Key] = None
+        self._verification_keys: dict[str, Key] = {}
+        self._mtimes: dict[str, float] = {}
+        self._next_check = 0.0
+
+    def _key_files(self) -> dict[str, Path]:
+        files = {
+            f"private:{settings.JWKS_KID}": Path(settings.JWKS_PRIVATE_KEY_PATH),
+            settings.JWKS_KID: Path(settings.JWKS_PUBLIC_KEY_PATH),
+        }
+        for kid, path in settings.JWKS_PREVIOUS_PUBLIC_KEYS.items():
+            files.setdefault(kid, Path(path))
+        return files
+
+    def _current_mtimes(self, files: dict[str, Path]) -> dict[str, float]:
+        mtimes = {}
+        for name, path in files.items():
+            try:
+                mtimes[name] = path.stat().st_mtime
+            except FileNotFoundError:
+                mtimes[name] = 0.0
+        return mtimes
+
+    def _load(self, files: dict[str, Path], mtimes: dict[str, float]) -> None:
+        algorithm = settings.JWT_ALGORITHM
+        signing_key = None
+        verification_keys = {}
+        for name, path in files.items():
+            if not mtimes[name]:
+                logger.warning("JWT key file not found", path=str(path))
+                continue
+            key = jwk.construct(path.read_bytes(), algorithm)
+            if name.startswith("private:"):
+                signing_key = key
+            else:
+                verification_keys[name] = key
+
+        self._signing_key = signing_key
+        self._verification_keys = verification_keys
+        self._mtimes = mtimes
+        logger.info("JWT key ring loaded", kids=sorted(verification_keys))
+
+    def refresh(self, force: bool = False) -> None:
+        """Reload the keys if any key file changed (or unconditionally with `force`)."""
+        now = time.monotonic()
+        if not force and now < self._next_check:
+            return
+
+        with self._lock:
+            if not force and now < self._next_check:
+                return
+            ensure_jwt_key_pair(
+                Path(settings.JWKS_PRIVATE_KEY_PATH), Path(settings.JWKS_PUBLIC_KEY_PATH)
+            )
+            files = self._key_files()
+            mtimes = self._current_mtimes(files)
+            if force or mtimes != self._mtimes:
+                self._load(files, mtimes)
+            self._next_check = now + settings.JWKS_RELOAD_INTERVAL_SECONDS
+
+    def signing_key(self) -> tuple[str, Key]:
+        """Return (kid, parsed private key) used to sign new tokens."""
+        self.refresh()
+        if self._signing_key is None:
+            raise RuntimeError("JWT signing key is not available")
+        return settings.JWKS_KID, self._signing_key
+
+    def verification_key(self, kid: Optional[str]) -> Optional[Key]:
+        """Return the parsed public key for `kid` (the current key if kid is missing)."""
+        self.refresh()
+        return self._verification_keys.get(kid or settings.JWKS_KID)
+
+    def jwks(self) -> dict:
+        """JSON Web Key Set with every key accepted for verification."""
+        self.refresh()
+        return {
+            "keys": [
+                {
+                    **key.to_dict(),
+                    "kid": kid,
+                    "use": "sig",
+                    "alg": settings.JWT_ALGORITHM,
+                }
+                for kid, key in self._verification_keys.items()
+            ]
+        }
+
+
+key_ring = JWTKeyRing()
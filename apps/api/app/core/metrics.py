@@ -0,0 +1,107 @@
+# Application-level Prometheus metrics. They are registered in the default
+# registry, so the Instrumentator's /metrics endpoint exports them.
+
+from prometheus_client import Counter, Gauge, Histogram
+
+PUBLIC_JOBS_CACHE_REQUESTS = Counter(
+    "jobsmv_public_jobs_cache_requests_total",
+    "Public job listing cache lookups",
+    ["result"],
+)
+
+AUTH_CACHE_REQUESTS = Counter(
+    "jobsmv_auth_cache_requests_total",
+    "Verified-token and employer principal cache lookups",
+    ["cache", "result"],
+)
+
+HASH_QUEUE_WAIT = Histogram(
+    "jobsmv_hash_queue_wait_seconds",
+    "Time hashing calls wait for a hashing executor thread",
+    ["operation"],
+)
+
+HASH_DURATION = Histogram(
+    "jobsmv_hash_duration_seconds",
+    "Time spent in password/token hashing calls",
+    ["operation"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
+HASH_IN_FLIGHT = Gauge(
+    "jobsmv_hash_in_flight",
+    "Hashing calls running or queued on the hashing executor",
+)
+
+HASH_REJECTED = Counter(
+    "jobsmv_hash_rejected_total",
+    "Hashing calls rejected because the hashing executor was saturated",
+)
+
+TOKEN_REVOCATION_CHECKS = Counter(
+    "jobsmv_token_revocation_checks_total",
+    "Access token revocation checks by outcome (local_negative needs no Redis call)",
+    ["result"],
+)
+
+RATE_LIMIT_DECISIONS = Counter(
+    "jobsmv_rate_limit_decisions_total",
+    "Rate limit decisions by policy",
+    ["policy", "decision"],
+)
+
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "jobsmv_db_pool_checkout_wait_seconds",
+    "Time spent waiting for a database connection from the pool",
+    ["pool"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+DB_POOL_CONNECTION_HOLD = Histogram(
+    "jobsmv_db_pool_connection_hold_seconds",
+    "Time a database connection stays checked out of the pool",
+    ["pool"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+DB_POOL_CHECKOUT_TIMEOUTS = Counter(
+    "jobsmv_db_pool_checkout_timeouts_total",
+    "Pool checkouts that gave up after DB_POOL_TIMEOUT_SECONDS",
+    ["pool"],
+)
+
+DB_POOL_OVERFLOW_EVENTS = Counter(
+    "jobsmv_db_pool_overflow_events_total",
+    "Checkouts that opened an overflow connection beyond DB_POOL_SIZE",
+    ["pool"],
+)
+
+DB_POOL_CHECKED_OUT = Gauge(
+    "jobsmv_db_pool_checked_out_connections",
+    "Database connections currently in use",
+    ["pool"],
+)
+
+DB_POOL_CHECKED_IN = Gauge(
+    "jobsmv_db_pool_idle_connections",
+    "Idle database connections held by the pool",
+    ["pool"],
+)
+
+DB_POOL_OVERFLOW = Gauge(
+    "jobsmv_db_pool_overflow_connections",
+    "Overflow connections currently open beyond DB_POOL_SIZE",
+    ["pool"],
+)
+
+DB_READ_ROUTING = Counter(
+    "jobsmv_db_read_routing_total",
+    "Read-only sessions by target (replica, primary_pinned, primary_fallback)",
+    ["target"],
+)
+
+STARTUP_PHASE_SECONDS = Gauge(
+    "jobsmv_startup_phase_seconds",
+    "Time this worker spent in each startup phase",
+    ["phase"],
+)
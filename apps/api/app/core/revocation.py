@@ -0,0 +1,167 @@
+from typing import Optional
+import asyncio
+import hashlib
+import json
+import time
+import structlog
+
+from app.core.config import settings
+from app.core.metrics import TOKEN_REVOCATION_CHECKS
+from app.utils.idempotency import get_redis
+
+logger = structlog.get_logger(__name__)
+
+# Revoked JTIs live in Redis under this prefix until the token would have expired.
+# Every revocation is also published so each worker can add it to its local filter.
+REVOKED_JTI_PREFIX = "revoked_jti:"
+REVOCATION_CHANNEL = "revoked_jti"
+
+
+class RotatingBloomFilter:
+    """
+    Fixed-size bloom filter whose entries age out.
+
+    Entries go into the newest of `generations` filters; a new filter is started
+    every `period` seconds and the oldest one is dropped, so an entry is kept for
+    at least (generations - 1) * period seconds. Memory is bounded by
+    generations * bits / 8 bytes regardless of how many entries are added.
+    """
+
+    def __init__(self, bits: int, hashes: int, generations: int, period: float) -> None:
+        self.bits = bits
+        self.hashes = hashes
+        self.generations = generations
+        self.period = period
+        self._filters: list[tuple[float, bytearray]] = [(time.time(), bytearray(bits // 8))]
+
+    def _positions(self, value: str) -> list[int]:
+        digest = hashlib.blake2b(value.encode("utf-8"), digest_size=8 * self.hashes).digest()
+        return [
+            int.from_bytes(digest[i * 8:(i + 1) * 8], "big") % self.bits
+            for i in range(self.hashes)
+        ]
+
+    def _rotate(self) -> None:
+        now = time.time()
+        while now - self._filters[-1][0] >= self.period:
+            self._filters.append((self._filters[-1][0] + self.period, bytearray(self.bits // 8)))
+            if len(self._filters) > self.generations:
+                self._filters.pop(0)
+
+    def add(self, value: str) -> None:
+        self._rotate()
+        current = self._filters[-1][1]
+        for position in self._positions(value):
+            current[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value: str) -> bool:
+        self._rotate()
+        positions = self._positions(value)
+        return any(
+            all(bits[position >> 3] & (1 << (position & 7)) for position in positions)
+            for _, bits in self._filters
+        )
+
+
+_revoked = RotatingBloomFilter(
+    bits=settings.TOKEN_REVOCATION_BLOOM_BITS,
+    hashes=settings.TOKEN_REVOCATION_BLOOM_HASHES,
+    generations=settings.TOKEN_REVOCATION_BLOOM_GENERATIONS,
+    # Generations together span the access token lifetime
+    period=settings.JWT_ACCESS_TOKEN_EXPIRE_HOURS * 3600
+    / (settings.TOKEN_REVOCATION_BLOOM_GENERATIONS - 1),
+)
+# True while the local filter is known to contain every revocation in Redis
+_synced = False
+_listener_task: Optional[asyncio.Task] = None
+
+
+async def revoke_token(jti: str, expires_at: float) -> None:
+    """Revoke a token until `expires_at` (unix time) across all workers."""
+    _revoked.add(jti)
+    ttl = int(expires_at - time.time()) + 1
+    if ttl <= 0:
+        return
+    r = await get_redis()
+    await r.setex(f"{REVOKED_JTI_PREFIX}{jti}", ttl, "1")
+    await r.publish(REVOCATION_CHANNEL, json.dumps({"jti": jti}))
+
+
+async def is_token_revoked(jti: str) -> bool:
+    """
+    Check whether a token has been revoked.
+
+    When the local filter is in sync, a negative answer needs no network round
+    trip; positives (possibly false) are confirmed against Redis, and treated as
+    revoked if Redis can't be reached. Without a synced filter every check goes
+    to Redis and fails open.
+    """
+    if _synced and jti not in _revoked:
+        TOKEN_REVOCATION_CHECKS.labels(result="local_negative").inc()
+        return False
+
+    try:
+        r = await get_redis()
+        revoked = bool(await r.exists(f"{REVOKED_JTI_PREFIX}{jti}"))
+    except Exception as e:
+        logger.error("Token revocation lookup failed", error=str(e))
+        TOKEN_REVOCATION_CHECKS.labels(result="error").inc()
+        # Without a synced filter there is nothing to go on; don't lock everyone out
+        return _synced
+
+    TOKEN_REVOCATION_CHECKS.labels(result="revoked" if revoked else "not_revoked").inc()
+    return revoked
+
+
+async def _load_revoked() -> None:
+    r = await get_redis()
+    async for key in r.scan_iter(match=f"{REVOKED_JTI_PREFIX}*", count=1000):
+        _revoked.add(key[len(REVOKED_JTI_PREFIX):])
+
+
+async def _listen() -> None:
+    global _synced
+    while True:
+        pubsub = None
+        try:
+            r = await get_redis()
+            pubsub = r.pubsub()
+            # Subscribe before loading existing revocations so none are missed
+            await pubsub.subscribe(REVOCATION_CHANNEL)
+            await _load_revoked()
+            _synced = True
+            logger.info("Token revocation filter synced")
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    _revoked.add(json.loads(message["data"])["jti"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Token revocation listener failed, retrying", error=str(e))
+        finally:
+            _synced = False
+            if pubsub is not None:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+        await asyncio.sleep(1)
+
+
+def start_revocation_listener() -> None:
+    """Start syncing the local revocation filter from Redis (application startup)."""
+    global _listener_task
+    if _listener_task is None:
+        _listener_task = asyncio.create_task(_listen())
+
+
+async def stop_revocation_listener() -> None:
+    """Stop the revocation listener (application shutdown)."""
+    global _listener_task
+    if _listener_task is not None:
+        _listener_task.cancel()
+        try:
+            await _listener_task
+        except asyncio.CancelledError:
+            pass
+        _listener_task = None
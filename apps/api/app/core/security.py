@@ -1,14 +1,16 @@
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 from jose import JWTError, jwt, ExpiredSignatureError
-from pathlib import Path
 import structlog
 import bcrypt
-import os
-import stat
+import hashlib
+import hmac
+import re
 import secrets
 
 from app.core.config import settings
+from app.core.keys import key_ring
+from app.core.revocation import revoke_token, is_token_revoked
 
 logger = structlog.get_logger(__name__)
 
@@ -33,71 +35,6 @@ def get_password_hash(password: str) -> str:
     return hashed.decode("utf-8")
 
 
-def load_jwt_keys() -> tuple[str, str]:
-    """
-    Load JWT private and public keys.
-
-    Automatically generates RSA key pair if keys don't exist.
-    Sets secure file permissions (600 for private, 644 for public key).
-    """
-    private_key_path = Path(settings.JWKS_PRIVATE_KEY_PATH)
-    public_key_path = Path(settings.JWKS_PUBLIC_KEY_PATH)
-
-    if not private_key_path.exists() or not public_key_path.exists():
-        logger.info("JWT keys not found, generating new RSA key pair",
-                   private_key_path=str(private_key_path),
-                   public_key_path=str(public_key_path))
-        from cryptography.hazmat.primitives.asymmetric import rsa
-        from cryptography.hazmat.primitives import serialization
-
-        # Generate new keys
-        private_key = rsa.generate_private_key(
-            public_exponent=65537,
-            key_size=2048,
-        )
-        public_key = private_key.public_key()
-
-        # Ensure keys directory exists
-        private_key_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Save private key with secure permissions (600)
-        with open(private_key_path, "wb") as f:
-            f.write(
-                private_key.private_bytes(
-                    encoding=serialization.Encoding.PEM,
-                    format=serialization.PrivateFormat.PKCS8,
-                    encryption_algorithm=serialization.NoEncryption(),
-                )
-            )
-        # Set private key permissions to 600 (owner read/write only)
-        os.chmod(private_key_path, stat.S_IRUSR | stat.S_IWUSR)
-
-        # Save public key with readable permissions (644)
-        with open(public_key_path, "wb") as f:
-            f.write(
-                public_key.public_bytes(
-                    encoding=serialization.Encoding.PEM,
-                    format=serialization.PublicFormat.SubjectPublicKeyInfo,
-                )
-            )
-        # Set public key permissions to 644 (owner read/write, group/other read)
-        os.chmod(public_key_path, stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP | stat.S_IROTH)
-
-        logger.info("JWT keys generated successfully with secure permissions")
-    else:
-        logger.debug("Loading existing JWT keys",
-                    private_key_path=str(private_key_path),
-                    public_key_path=str(public_key_path))
-
-    with open(private_key_path, "rb") as f:
-        private_key = f.read()
-
-    with open(public_key_path, "rb") as f:
-        public_key = f.read()
-
-    return private_key.decode(), public_key.decode()
-
-
 def create_access_token(
     data: dict,
     expires_delta: Optional[timedelta] = None,
@@ -122,14 +59,14 @@ def create_access_token(
     })
     to_encode.update({"aud": settings.JWT_AUD, "iss": settings.JWT_ISS})
 
-    private_key, _ = load_jwt_keys()
+    kid, private_key = key_ring.signing_key()
     encoded_jwt = jwt.encode(
-        to_encode, private_key, algorithm=settings.JWT_ALGORITHM, headers={"kid": settings.JWKS_KID}
+        to_encode, private_key, algorithm=settings.JWT_ALGORITHM, headers={"kid": kid}
     )
     return encoded_jwt
 
 
-def verify_token(token: str) -> tuple[bool, Optional[dict], Optional[str]]:
+async def verify_token(token: str) -> tuple[bool, Optional[dict], Optional[str]]:
     """
     Verify and decode a JWT token.
 
@@ -137,7 +74,11 @@ def verify_token(token: str) -> tuple[bool, Optional[dict], Optional[str]]:
         tuple: (is_valid, payload, error_message)
     """
     try:
-        _, public_key = load_jwt_keys()
+        # Pick the parsed public key by the token's kid (rotation keeps old kids valid)
+        public_key = key_ring.verification_key(jwt.get_unverified_header(token).get("kid"))
+        if public_key is None:
+            logger.warning("JWT signed with unknown key")
+            return False, None, "Token verification failed"
         payload = jwt.decode(
             token,
             public_key,
@@ -148,7 +89,7 @@ def verify_token(token: str) -> tuple[bool, Optional[dict], Optional[str]]:
 
         # Check if token is blacklisted (if implemented)
         jti = payload.get("jti")
-        if jti and is_token_blacklisted(jti):
+        if jti and await is_token_blacklisted(jti):
             logger.warning("JWT token is blacklisted", jti=jti)
             return False, None, "Token has been revoked"
 
@@ -165,18 +106,55 @@ def verify_token(token: str) -> tuple[bool, Optional[dict], Optional[str]]:
         return False, None, "Internal authentication error"
 
 
+# Refresh tokens use a "<selector>.<verifier>" format. The selector is stored in
+# plain text in an indexed column so a token is located with a single lookup; only
+# the verifier is secret and it is stored as a keyed HMAC rather than a bcrypt hash.
+REFRESH_TOKEN_SEPARATOR = "."
+# Legacy tokens were secrets.token_urlsafe(32): 43 URL-safe base64 characters
+LEGACY_REFRESH_TOKEN_PATTERN = re.compile(r"[A-Za-z0-9_-]{43}")
+
+
 def create_refresh_token() -> str:
-    """Create a random refresh token."""
-    return secrets.token_urlsafe(32)
+    """Create a random selector/verifier refresh token."""
+    selector = secrets.token_urlsafe(12)
+    verifier = secrets.token_urlsafe(32)
+    return f"{selector}{REFRESH_TOKEN_SEPARATOR}{verifier}"
+
 
+def split_refresh_token(token: str) -> tuple[Optional[str], str]:
+    """
+    Split a refresh token into its selector and verifier parts.
+
+    Legacy tokens (issued before the selector/verifier format) have no selector,
+    in which case (None, token) is returned.
+    """
+    selector, separator, verifier = token.partition(REFRESH_TOKEN_SEPARATOR)
+    if not separator or not selector or not verifier:
+        return None, token
+    return selector, verifier
+
+
+def hash_refresh_token(verifier: str) -> str:
+    """Hash a refresh token verifier for secure storage (HMAC-SHA256)."""
+    return hmac.new(
+        settings.SECRET_KEY.encode("utf-8"),
+        verifier.encode("utf-8"),
+        hashlib.sha256,
+    ).hexdigest()
+
+
+def verify_refresh_token(verifier: str, hashed_token: str) -> bool:
+    """Verify a refresh token verifier against its stored HMAC."""
+    return hmac.compare_digest(hash_refresh_token(verifier), hashed_token)
 
-def hash_refresh_token(token: str) -> str:
-    """Hash a refresh token for secure storage."""
-    return bcrypt.hashpw(token.encode("utf-8"), bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)).decode("utf-8")
 
+def is_legacy_refresh_token(token: str) -> bool:
+    """Whether `token` has the shape of a legacy (pre selector/verifier) refresh token."""
+    return LEGACY_REFRESH_TOKEN_PATTERN.fullmatch(token) is not None
 
-def verify_refresh_token(plain_token: str, hashed_token: str) -> bool:
-    """Verify a refresh token against its hash."""
+
+def verify_legacy_refresh_token(plain_token: str, hashed_token: str) -> bool:
+    """Verify a legacy (pre selector/verifier) refresh token against its bcrypt hash."""
     try:
         return bcrypt.checkpw(plain_token.encode("utf-8"), hashed_token.encode("utf-8"))
     except Exception as e:
@@ -184,24 +162,12 @@ def verify_refresh_token(plain_token: str, hashed_token: str) -> bool:
         return False
 
 
-# Token Blacklisting (in-memory for now, should be moved to Redis/database in production)
-_blacklisted_tokens = set()
-
-
-def blacklist_token(jti: str) -> None:
-    """Add a JWT token to the blacklist (logout functionality)."""
-    _blacklisted_tokens.add(jti)
+async def blacklist_token(jti: str, expires_at: float) -> None:
+    """Revoke a JWT token until it expires (logout functionality)."""
+    await revoke_token(jti, expires_at)
     logger.info("Token blacklisted", jti=jti)
 
 
-def is_token_blacklisted(jti: str) -> bool:
+async def is_token_blacklisted(jti: str) -> bool:
     """Check if a JWT token is blacklisted."""
-    return jti in _blacklisted_tokens
-
-
-def clear_expired_blacklisted_tokens() -> None:
-    """Clear expired tokens from blacklist (should be called periodically)."""
-    # In a production system, this would check database/redis for expired tokens
-    # For now, we'll keep all blacklisted tokens until restart
-    pass
-
+    return await is_token_revoked(jti)
@@ -0,0 +1,34 @@
+from contextlib import contextmanager
+from typing import Iterator
+import time
+import structlog
+
+from app.core.metrics import STARTUP_PHASE_SECONDS
+
+logger = structlog.get_logger(__name__)
+
+
+class StartupTimer:
+    """Times named startup phases and reports them once the application is up."""
+
+    def __init__(self) -> None:
+        self.phases: dict[str, float] = {}
+
+    def record(self, phase: str, seconds: float) -> None:
+        self.phases[phase] = seconds
+        STARTUP_PHASE_SECONDS.labels(phase=phase).set(seconds)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started_at)
+
+    def report(self) -> None:
+        logger.info(
+            "Startup complete",
+            total_seconds=round(sum(self.phases.values()), 4),
+            **{f"{name}_seconds": round(seconds, 4) for name, seconds in self.phases.items()},
+        )
@@ -1,13 +1,34 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 
 from app.core.config import settings
+from app.db.pool import InstrumentedAsyncAdaptedQueuePool, register_pool_metrics
 
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=False,
-    future=True,
-)
+
+def make_engine(url: str, pool_label: str = "primary") -> AsyncEngine:
+    """Create an engine with the configured pool settings and pool metrics."""
+    engine = create_async_engine(
+        url,
+        echo=False,
+        future=True,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS or -1,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args={
+            # asyncpg's own statement cache and SQLAlchemy's prepared statement cache
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        },
+    )
+    engine.pool.metrics_label = pool_label
+    register_pool_metrics(engine, pool_label)
+    return engine
+
+
+engine = make_engine(settings.DATABASE_URL)
 
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -0,0 +1,98 @@
+from typing import Optional
+from sqlalchemy import Select, String, case, cast, func, literal, literal_column, null, union_all, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import PublishedJobCard
+from app.db.read_model import SALARY_RANGE_COLUMNS
+
+# Salary band lower bounds per currency, applied to a job's lowest offered salary.
+# The last band is open-ended.
+SALARY_BANDS = {
+    "MVR": [0, 10000, 20000, 30000, 50000],
+    "USD": [0, 1000, 2000, 3000, 5000],
+}
+
+
+def _band_expression(column, bounds: list[int]):
+    """CASE expression mapping a salary range to the lower bound of its band."""
+    # Bounds are inlined rather than bound so the GROUP BY matches the select list
+    lower = func.lower(column)
+    return case(
+        *(
+            (lower < literal_column(str(upper)), literal_column(f"'{band}'"))
+            for band, upper in zip(bounds, bounds[1:])
+        ),
+        else_=literal_column(f"'{bounds[-1]}'"),
+    )
+
+
+async def get_facet_counts(db: AsyncSession, filtered: Select) -> dict:
+    """
+    Count filtered published job cards per category, location, currency and salary band.
+
+    `filtered` is a select over PublishedJobCard with the listing filters applied. All
+    facets are computed in a single UNION ALL statement over that set, returning
+    (facet, value, count) rows.
+    """
+    cards = filtered.with_only_columns(
+        PublishedJobCard.job_id,
+        PublishedJobCard.categories,
+        PublishedJobCard.location,
+        PublishedJobCard.salary_currencies,
+        *SALARY_RANGE_COLUMNS.values(),
+    ).cte("filtered_cards")
+
+    categories = select(func.unnest(cards.c.categories).label("value")).subquery()
+    currencies = select(func.unnest(cards.c.salary_currencies).label("value")).subquery()
+
+    parts = [
+        select(literal("total").label("facet"), cast(null(), String).label("value"), func.count()),
+        select(literal("category"), categories.c.value, func.count()).group_by(categories.c.value),
+        select(literal("location"), cards.c.location, func.count())
+        .where(cards.c.location.isnot(None))
+        .group_by(cards.c.location),
+        select(literal("currency"), currencies.c.value, func.count()).group_by(currencies.c.value),
+    ]
+    for currency, column in SALARY_RANGE_COLUMNS.items():
+        band = _band_expression(cards.c[column.key], SALARY_BANDS[currency])
+        parts.append(
+            select(literal(f"salary_band:{currency}"), band, func.count())
+            .where(cards.c[column.key].isnot(None))
+            .group_by(band)
+        )
+    # The total row has no FROM of its own
+    parts[0] = parts[0].select_from(cards)
+
+    result = await db.execute(union_all(*parts))
+
+    facets: dict = {
+        "total": 0,
+        "categories": [],
+        "locations": [],
+        "currencies": [],
+        "salary_bands": [],
+    }
+    for facet, value, count in result.all():
+        if facet == "total":
+            facets["total"] = count
+        elif facet == "category":
+            facets["categories"].append({"value": value, "count": count})
+        elif facet == "location":
+            facets["locations"].append({"value": value, "count": count})
+        elif facet == "currency":
+            facets["currencies"].append({"value": value, "count": count})
+        else:
+            currency = facet.split(":", 1)[1]
+            bounds = SALARY_BANDS[currency]
+            band_min = int(value)
+            index = bounds.index(band_min)
+            band_max: Optional[int] = bounds[index + 1] if index + 1 < len(bounds) else None
+            facets["salary_bands"].append(
+                {"currency": currency, "min": band_min, "max": band_max, "count": count}
+            )
+
+    # Most common values first, ties broken alphabetically
+    for name in ("categories", "locations", "currencies"):
+        facets[name].sort(key=lambda item: (-item["count"], item["value"]))
+    facets["salary_bands"].sort(key=lambda item: (item["currency"], item["min"]))
+    return facets
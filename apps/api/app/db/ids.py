@@ -0,0 +1,58 @@
+import os
+import random
+import threading
+import time
+import uuid
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+_COUNTER_BITS = 12
+_COUNTER_MAX = (1 << _COUNTER_BITS) - 1
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID version 7 (RFC 9562).
+
+    Layout: 48-bit Unix timestamp in milliseconds, version, a 12-bit counter
+    (rand_a), variant and 62 random bits. The counter starts at a random value
+    each millisecond and is incremented for further ids in the same millisecond,
+    so ids from one process are strictly increasing; new rows land at the right
+    edge of the primary key B-tree instead of at random pages.
+    """
+    global _last_ms, _counter
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            # Leave headroom so the counter rarely overflows within a millisecond
+            _counter = int.from_bytes(os.urandom(2), "big") & (_COUNTER_MAX >> 1)
+        else:
+            # Same millisecond (or the clock went backwards): keep increasing
+            _counter += 1
+            if _counter > _COUNTER_MAX:
+                _last_ms += 1
+                _counter = 0
+        timestamp_ms = _last_ms
+        counter = _counter
+
+    rand_b = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+    return _pack(timestamp_ms, counter, rand_b)
+
+
+def uuid7_at(timestamp_ms: int, rng: random.Random) -> uuid.UUID:
+    """UUIDv7 for a given time with random bits from `rng` (reproducible synthetic data)."""
+    return _pack(timestamp_ms, rng.getrandbits(_COUNTER_BITS), rng.getrandbits(62))
+
+
+def _pack(timestamp_ms: int, rand_a: int, rand_b: int) -> uuid.UUID:
+    value = (
+        (timestamp_ms & ((1 << 48) - 1)) << 80
+        | 0x7 << 76
+        | rand_a << 64
+        | 0b10 << 62
+        | rand_b
+    )
+    return uuid.UUID(int=value)
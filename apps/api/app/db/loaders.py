@@ -0,0 +1,64 @@
+from typing import Optional, Sequence
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+
+from app.db.models import Job, Category, JobCategory
+
+# Relationship loading shared by every job route. The employer is a many-to-one and
+# is joined into the main query; salaries are fetched in one IN query for the page.
+JOB_RELATION_OPTIONS = (
+    joinedload(Job.employer),
+    selectinload(Job.salaries),
+)
+
+
+def with_job_relations(query: Select) -> Select:
+    """Add the batched employer/salary loading options to a Job query."""
+    return query.options(*JOB_RELATION_OPTIONS)
+
+
+async def attach_job_details(db: AsyncSession, jobs: Sequence[Job]) -> None:
+    """
+    Populate `categories` and `employer_company_name` on a page of jobs.
+
+    Category names for all jobs are fetched with a single query, so a page of N
+    jobs costs one statement here instead of N.
+    """
+    if not jobs:
+        return
+
+    categories_by_job: dict = {job.id: [] for job in jobs}
+    result = await db.execute(
+        select(JobCategory.job_id, Category.name)
+        .join(Category, Category.id == JobCategory.category_id)
+        .where(JobCategory.job_id.in_(list(categories_by_job)))
+        .order_by(Category.name)
+    )
+    for job_id, name in result.all():
+        categories_by_job[job_id].append(name)
+
+    for job in jobs:
+        job.categories = categories_by_job[job.id]
+        # Set employer company name for response
+        if job.employer:
+            job.employer_company_name = job.employer.company_name
+
+
+async def load_jobs(db: AsyncSession, query: Select) -> list[Job]:
+    """Execute a Job query with relations loaded and details attached."""
+    result = await db.execute(with_job_relations(query))
+    jobs = list(result.scalars().all())
+    await attach_job_details(db, jobs)
+    return jobs
+
+
+async def load_job(db: AsyncSession, *criteria) -> Optional[Job]:
+    """Load a single job matching `criteria` with relations and details attached."""
+    query = (
+        select(Job)
+        .where(*criteria)
+        .execution_options(populate_existing=True)
+    )
+    jobs = await load_jobs(db, query)
+    return jobs[0] if jobs else None
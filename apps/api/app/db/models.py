@@ -1,10 +1,13 @@
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, Text, DateTime, ForeignKey, ARRAY, JSON, Enum, Boolean, DECIMAL
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
-import uuid
+from sqlalchemy import Column, String, Integer, Text, DateTime, ForeignKey, ARRAY, JSON, Enum, Boolean, DECIMAL, Index
+from sqlalchemy import DDL, FetchedValue, event
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR, NUMRANGE
+from sqlalchemy.orm import relationship, deferred
 
 from app.db.base import Base
+from app.db.ids import uuid7
+from app.db.search import SEARCH_VECTOR_TRIGGER_FUNCTION_SQL, search_vector_trigger_sql
 
 
 # Supported currencies for job salaries
@@ -16,7 +19,7 @@ class SupportedCurrency(str, Enum):
 class Employer(Base):
     __tablename__ = "employers"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     company_name = Column(String(255), nullable=False)
     email = Column(String(255), unique=True, nullable=False, index=True)
     password_hash = Column(String(255), nullable=False)
@@ -36,7 +39,7 @@ class Employer(Base):
 class Category(Base):
     __tablename__ = "categories"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name = Column(String(100), unique=True, nullable=False, index=True)
     description = Column(Text, nullable=True)
 
@@ -47,7 +50,7 @@ class Category(Base):
 class JobSalary(Base):
     __tablename__ = "job_salaries"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     job_id = Column(UUID(as_uuid=True), ForeignKey("jobs.id"), nullable=False, index=True)
     currency = Column(Enum("MVR", "USD", name="supported_currency"), nullable=False)
     amount_min = Column(DECIMAL(precision=15, scale=2), nullable=True)
@@ -62,11 +65,13 @@ class JobSalary(Base):
 class Job(Base):
     __tablename__ = "jobs"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     employer_id = Column(UUID(as_uuid=True), ForeignKey("employers.id"), nullable=False, index=True)
     title = Column(String(255), nullable=False, index=True)
     description_md = Column(Text, nullable=False)
     requirements_md = Column(Text, nullable=True)
+    # Plain-text summary of description_md, maintained on write for summary listings
+    excerpt = Column(Text, nullable=True)
     location = Column(String(255), nullable=True, index=True)
     is_salary_public = Column(Boolean, default=True, nullable=False)
     status = Column(
@@ -78,6 +83,10 @@ class Job(Base):
     tags = Column(ARRAY(String), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    # Weighted full-text vector maintained by the jobs_search_vector_trigger trigger
+    search_vector = deferred(
+        Column(TSVECTOR, nullable=True, server_default=FetchedValue(), server_onupdate=FetchedValue())
+    )
 
     # Relationships
     employer = relationship("Employer", back_populates="jobs")
@@ -85,6 +94,17 @@ class Job(Base):
     applications = relationship("Application", back_populates="job", cascade="all, delete-orphan")
     salaries = relationship("JobSalary", back_populates="job", cascade="all, delete-orphan")
 
+    # Keyset pagination index for employer listings: (filter, sort column, id).
+    # Published listings read published_job_cards, which carries its own indexes.
+    __table_args__ = (
+        Index("ix_jobs_employer_id_created_at_id", "employer_id", "created_at", "id"),
+        Index("ix_jobs_search_vector", "search_vector", postgresql_using="gin"),
+    )
+
+
+event.listen(Job.__table__, "after_create", DDL(SEARCH_VECTOR_TRIGGER_FUNCTION_SQL))
+event.listen(Job.__table__, "after_create", DDL(search_vector_trigger_sql("jobs")))
+
 
 class JobCategory(Base):
     __tablename__ = "job_categories"
@@ -96,13 +116,18 @@ class JobCategory(Base):
     job = relationship("Job", back_populates="job_categories")
     category = relationship("Category", back_populates="job_categories")
 
+    # Reverse of the primary key, for lookups by category
+    __table_args__ = (
+        Index("ix_job_categories_category_id_job_id", "category_id", "job_id"),
+    )
+
 
 class Application(Base):
     __tablename__ = "applications"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     employer_id = Column(UUID(as_uuid=True), ForeignKey("employers.id"), nullable=False, index=True)
-    job_id = Column(UUID(as_uuid=True), ForeignKey("jobs.id"), nullable=False, index=True)
+    job_id = Column(UUID(as_uuid=True), ForeignKey("jobs.id"), nullable=False)
     applicant_name = Column(String(255), nullable=False)
     applicant_email = Column(String(255), nullable=False, index=True)
     resume_url = Column(String(500), nullable=True)
@@ -121,12 +146,22 @@ class Application(Base):
     employer = relationship("Employer", back_populates="applications")
     job = relationship("Job", back_populates="applications")
 
+    # Keyset pagination indexes for per-job application listings (optionally by
+    # status), and a BRIN index for time-range scans
+    __table_args__ = (
+        Index("ix_applications_job_id_created_at_id", "job_id", "created_at", "id"),
+        Index("ix_applications_job_id_status_created_at_id", "job_id", "status", "created_at", "id"),
+        Index("ix_applications_created_at_brin", "created_at", postgresql_using="brin"),
+    )
+
 
 class RefreshToken(Base):
     __tablename__ = "refresh_tokens"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     employer_id = Column(UUID(as_uuid=True), ForeignKey("employers.id"), nullable=False, index=True)
+    # Public lookup part of "<selector>.<verifier>" tokens; NULL for legacy bcrypt-hashed tokens
+    selector = Column(String(32), unique=True, nullable=True, index=True)
     token_hash = Column(String(255), unique=True, nullable=False, index=True)
     expires_at = Column(DateTime, nullable=False, index=True)
     revoked = Column(Integer, default=0, nullable=False, index=True)  # 0=active, 1=revoked
@@ -135,3 +170,60 @@ class RefreshToken(Base):
 
     # Relationships
     employer = relationship("Employer", back_populates="refresh_tokens")
+
+
+class PublishedJobCard(Base):
+    """
+    Denormalized read model of a published job.
+
+    One row per published job holding everything public reads need (employer name,
+    category names, salaries as JSON, excerpt), so listing and detail pages read a
+    single row without joins. Maintained transactionally by app.db.read_model.
+    """
+
+    __tablename__ = "published_job_cards"
+
+    job_id = Column(UUID(as_uuid=True), ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True)
+    employer_id = Column(
+        UUID(as_uuid=True), ForeignKey("employers.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    employer_company_name = Column(String(255), nullable=True)
+    title = Column(String(255), nullable=False)
+    description_md = Column(Text, nullable=False)
+    requirements_md = Column(Text, nullable=True)
+    excerpt = Column(Text, nullable=True)
+    location = Column(String(255), nullable=True)
+    is_salary_public = Column(Boolean, nullable=False)
+    salaries = Column(JSON, nullable=False, default=list)  # Empty when salary is hidden
+    categories = Column(ARRAY(String), nullable=False, default=list)
+    tags = Column(ARRAY(String), nullable=True)
+    # Salary filter columns, computed from public salaries only (empty/NULL when
+    # the salary is hidden): the currencies present and, per currency, the
+    # [lowest min, highest max] envelope (NULL when any salary in that currency
+    # has an open bound)
+    salary_currencies = Column(postgresql.ARRAY(String), nullable=False, default=list)
+    salary_range_mvr = Column(NUMRANGE, nullable=True)
+    salary_range_usd = Column(NUMRANGE, nullable=True)
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+    refreshed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # Weighted full-text vector maintained by the shared search trigger
+    search_vector = deferred(
+        Column(TSVECTOR, nullable=True, server_default=FetchedValue(), server_onupdate=FetchedValue())
+    )
+
+    __table_args__ = (
+        Index("ix_published_job_cards_created_at_job_id", "created_at", "job_id"),
+        Index("ix_published_job_cards_updated_at_job_id", "updated_at", "job_id"),
+        Index("ix_published_job_cards_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_published_job_cards_salary_currencies", "salary_currencies", postgresql_using="gin"),
+        Index("ix_published_job_cards_salary_range_mvr", "salary_range_mvr", postgresql_using="gist"),
+        Index("ix_published_job_cards_salary_range_usd", "salary_range_usd", postgresql_using="gist"),
+    )
+
+
+event.listen(
+    PublishedJobCard.__table__,
+    "after_create",
+    DDL(search_vector_trigger_sql("published_job_cards")),
+)
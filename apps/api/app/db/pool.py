@@ -0,0 +1,71 @@
+import time
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.metrics import (
+    DB_POOL_CHECKED_IN,
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_CHECKOUT_TIMEOUTS,
+    DB_POOL_CHECKOUT_WAIT,
+    DB_POOL_CONNECTION_HOLD,
+    DB_POOL_OVERFLOW,
+    DB_POOL_OVERFLOW_EVENTS,
+)
+
+# Key in the connection record's info dict holding its checkout time
+_CHECKED_OUT_AT = "jobsmv_checked_out_at"
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that records how long checkouts wait for a connection.
+
+    The time covers waiting for a free connection and opening a new one, so it
+    separates pool saturation from query latency. Checkouts that open an
+    overflow connection (beyond pool_size) are counted too, and so is how long
+    each connection is held before being returned. Metrics are labelled with
+    `metrics_label` (the primary or a replica).
+    """
+
+    metrics_label = "primary"
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics_label = self.metrics_label
+        return pool
+
+    def _do_get(self):
+        started_at = time.perf_counter()
+        overflow_before = self.overflow()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            DB_POOL_CHECKOUT_TIMEOUTS.labels(pool=self.metrics_label).inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_WAIT.labels(pool=self.metrics_label).observe(time.perf_counter() - started_at)
+        if self.overflow() > max(overflow_before, 0):
+            DB_POOL_OVERFLOW_EVENTS.labels(pool=self.metrics_label).inc()
+        connection.info[_CHECKED_OUT_AT] = time.perf_counter()
+        return connection
+
+    def _do_return_conn(self, record):
+        checked_out_at = record.info.pop(_CHECKED_OUT_AT, None)
+        if checked_out_at is not None:
+            DB_POOL_CONNECTION_HOLD.labels(pool=self.metrics_label).observe(
+                time.perf_counter() - checked_out_at
+            )
+        super()._do_return_conn(record)
+
+
+def register_pool_metrics(engine: AsyncEngine, label: str = "primary") -> None:
+    """
+    Export the engine pool's in-use, idle and overflow connection counts as gauges.
+
+    The pool is looked up through the engine on every scrape: engine.dispose()
+    replaces it, and the gauges must follow the new one.
+    """
+    DB_POOL_CHECKED_OUT.labels(pool=label).set_function(lambda: engine.pool.checkedout())
+    DB_POOL_CHECKED_IN.labels(pool=label).set_function(lambda: engine.pool.checkedin())
+    DB_POOL_OVERFLOW.labels(pool=label).set_function(lambda: max(engine.pool.overflow(), 0))
@@ -0,0 +1,196 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Iterable, Optional
+import uuid
+from sqlalchemy import Numeric, String, select, delete, update, and_, or_, not_, cast, false, func, literal, null
+from sqlalchemy.dialects.postgresql import insert, ARRAY, Range
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.ext.asyncio import AsyncSession
+import structlog
+
+from app.db.models import Job, JobSalary, PublishedJobCard
+from app.db.loaders import load_jobs
+from app.utils.text import make_excerpt
+
+logger = structlog.get_logger(__name__)
+
+# Per-currency salary envelope columns on the read model
+SALARY_RANGE_COLUMNS = {
+    "MVR": PublishedJobCard.salary_range_mvr,
+    "USD": PublishedJobCard.salary_range_usd,
+}
+
+
+def _salary_to_json(salary: JobSalary) -> dict:
+    return {
+        "id": str(salary.id),
+        "currency": salary.currency,
+        "amount_min": float(salary.amount_min) if salary.amount_min is not None else None,
+        "amount_max": float(salary.amount_max) if salary.amount_max is not None else None,
+        "created_at": salary.created_at.isoformat(),
+        "updated_at": salary.updated_at.isoformat(),
+    }
+
+
+def _salary_envelope(salaries: list[JobSalary]) -> Optional[Range]:
+    """[lowest min, highest max] of a currency's salaries; None if any bound is open."""
+    if not salaries or any(s.amount_min is None or s.amount_max is None for s in salaries):
+        return None
+    lower = min(s.amount_min for s in salaries)
+    upper = max(max(s.amount_max for s in salaries), lower)
+    return Range(lower, upper, bounds="[]")
+
+
+def _card_values(job: Job, refreshed_at: datetime) -> dict:
+    # Filter columns only see public salaries, so filters and facets can't reveal hidden ones
+    public_salaries = list(job.salaries) if job.is_salary_public else []
+    return {
+        "job_id": job.id,
+        "employer_id": job.employer_id,
+        "employer_company_name": getattr(job, "employer_company_name", None),
+        "title": job.title,
+        "description_md": job.description_md,
+        "requirements_md": job.requirements_md,
+        "excerpt": job.excerpt if job.excerpt is not None else make_excerpt(job.description_md),
+        "location": job.location,
+        "is_salary_public": job.is_salary_public,
+        "salaries": [_salary_to_json(s) for s in public_salaries],
+        "categories": job.categories,
+        "tags": job.tags,
+        "salary_currencies": sorted({s.currency for s in public_salaries}),
+        **{
+            column.key: _salary_envelope([s for s in public_salaries if s.currency == currency])
+            for currency, column in SALARY_RANGE_COLUMNS.items()
+        },
+        "created_at": job.created_at,
+        "updated_at": job.updated_at,
+        "refreshed_at": refreshed_at,
+    }
+
+
+def salary_filter(
+    salary_min: Optional[float],
+    salary_max: Optional[float],
+    currency: Optional[str],
+) -> Optional[ColumnElement]:
+    """
+    Salary predicate on published job cards, backed by GIN/GiST indexes.
+
+    Only public salaries are projected into the card, so jobs with a hidden salary
+    behave like jobs without one.
+
+    - currency only: jobs with at least one salary in that currency
+    - range (either bound may be omitted): every salary in `currency` (or in every
+      currency when none is given) must lie within the range; open-ended salaries
+      never match. An inverted range (min > max) matches nothing.
+    """
+    if salary_min is None and salary_max is None:
+        if currency:
+            return PublishedJobCard.salary_currencies.contains([currency])
+        return None
+
+    if salary_min is not None and salary_max is not None and salary_min > salary_max:
+        # Postgres rejects a range whose lower bound exceeds the upper one
+        return false()
+
+    # A missing (NULL) bound leaves the range unbounded on that side
+    bounds = func.numrange(
+        *(
+            literal(Decimal(str(bound)), Numeric) if bound is not None else cast(null(), Numeric)
+            for bound in (salary_min, salary_max)
+        ),
+        literal("[]"),
+    )
+    if currency:
+        # A non-NULL envelope implies the job has salaries in this currency
+        return SALARY_RANGE_COLUMNS[currency].op("<@")(bounds)
+
+    # No currency selected: salaries in each currency present must match the range.
+    # Split by the job's first currency so every branch starts with an indexed
+    # condition (GiST <@ on that currency's envelope, or GIN = on an empty currency
+    # set) and the planner can BitmapOr the branches.
+    branches = [PublishedJobCard.salary_currencies == cast(literal("{}"), ARRAY(String))]
+    codes = list(SALARY_RANGE_COLUMNS)
+    for position, code in enumerate(codes):
+        earlier, later = codes[:position], codes[position + 1:]
+        conditions = [SALARY_RANGE_COLUMNS[code].op("<@")(bounds)]
+        if earlier:
+            conditions.append(not_(PublishedJobCard.salary_currencies.overlap(earlier)))
+        conditions.extend(
+            or_(
+                not_(PublishedJobCard.salary_currencies.contains([other])),
+                SALARY_RANGE_COLUMNS[other].op("<@")(bounds),
+            )
+            for other in later
+        )
+        branches.append(and_(*conditions))
+    return or_(*branches)
+
+
+async def sync_job_cards(db: AsyncSession, job_ids: Iterable[uuid.UUID]) -> None:
+    """
+    Bring the read model in line with the given jobs inside the caller's transaction.
+
+    Published jobs are upserted; cards of jobs that are no longer published (or no
+    longer exist) are removed. Pending ORM changes must be flushed first.
+    """
+    job_ids = list(job_ids)
+    if not job_ids:
+        return
+
+    jobs = await load_jobs(
+        db,
+        select(Job)
+        .where(Job.id.in_(job_ids), Job.status == "published")
+        .execution_options(populate_existing=True),
+    )
+    published_ids = {job.id for job in jobs}
+
+    stale_ids = [job_id for job_id in job_ids if job_id not in published_ids]
+    if stale_ids:
+        await db.execute(delete(PublishedJobCard).where(PublishedJobCard.job_id.in_(stale_ids)))
+
+    if jobs:
+        refreshed_at = datetime.utcnow()
+        stmt = insert(PublishedJobCard).values([_card_values(job, refreshed_at) for job in jobs])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[PublishedJobCard.job_id],
+            set_={
+                column: stmt.excluded[column]
+                for column in _card_values(jobs[0], refreshed_at)
+                if column != "job_id"
+            },
+        )
+        await db.execute(stmt)
+
+
+async def sync_employer_job_cards(
+    db: AsyncSession, employer_id: uuid.UUID, company_name: Optional[str]
+) -> None:
+    """Propagate an employer's company name to its published job cards."""
+    await db.execute(
+        update(PublishedJobCard)
+        .where(PublishedJobCard.employer_id == employer_id)
+        .values(employer_company_name=company_name, refreshed_at=datetime.utcnow())
+    )
+
+
+async def rebuild_job_cards(db: AsyncSession, batch_size: int = 500) -> int:
+    """
+    Rebuild the whole read model from the normalized tables.
+
+    Runs in the caller's transaction so readers see either the old or the new
+    projection. Returns the number of published jobs projected.
+    """
+    await db.execute(delete(PublishedJobCard))
+
+    result = await db.execute(
+        select(Job.id).where(Job.status == "published").order_by(Job.id)
+    )
+    job_ids = list(result.scalars().all())
+
+    for start in range(0, len(job_ids), batch_size):
+        await sync_job_cards(db, job_ids[start:start + batch_size])
+        logger.info("Rebuilt job cards", done=min(start + batch_size, len(job_ids)), total=len(job_ids))
+
+    return len(job_ids)
@@ -0,0 +1,170 @@
+from http.cookies import SimpleCookie
+from typing import Optional
+import asyncio
+import hashlib
+import hmac
+import time
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.datastructures import MutableHeaders
+import structlog
+
+from app.core.config import settings
+from app.db.base import make_engine
+
+logger = structlog.get_logger(__name__)
+
+# Set after a successful write; its value is "<unix time the pin expires>.<HMAC>",
+# signed so clients can't pin themselves to the primary indefinitely
+PRIMARY_PIN_COOKIE = "jobsmv_primary_pin"
+_WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+# Seconds since the replica last replayed a transaction, or 0 when it has replayed
+# everything it received (an idle primary produces no new transactions to replay)
+_REPLICATION_LAG_SQL = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+
+class ReplicaRouter:
+    """
+    Round-robin over the configured read replicas, skipping unhealthy ones.
+
+    A replica is unhealthy after a failed health check (unreachable, or lagging
+    more than DB_REPLICA_MAX_LAG_SECONDS) or a connection error during a request,
+    until a later health check succeeds. With no healthy replica, reads fall back
+    to the primary.
+    """
+
+    def __init__(self, urls: list[str]) -> None:
+        self.engines = [make_engine(url, f"replica{i}") for i, url in enumerate(urls)]
+        self._healthy = [True] * len(self.engines)
+        self._next = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def choose(self) -> Optional[AsyncEngine]:
+        """Return the next healthy replica engine, or None if there is none."""
+        for _ in range(len(self.engines)):
+            index = self._next
+            self._next = (self._next + 1) % len(self.engines)
+            if self._healthy[index]:
+                return self.engines[index]
+        return None
+
+    def mark_unhealthy(self, engine: AsyncEngine, reason: str) -> None:
+        index = self.engines.index(engine)
+        if self._healthy[index]:
+            logger.warning("Read replica marked unhealthy", replica=index, reason=reason)
+        self._healthy[index] = False
+
+    async def _check(self, index: int) -> None:
+        engine = self.engines[index]
+        try:
+            async with engine.connect() as conn:
+                lag = (await conn.execute(_REPLICATION_LAG_SQL)).scalar_one()
+        except Exception as e:
+            self.mark_unhealthy(engine, str(e))
+            return
+        if lag is not None and float(lag) > settings.DB_REPLICA_MAX_LAG_SECONDS:
+            self.mark_unhealthy(engine, f"replication lag {float(lag):.1f}s")
+            return
+        if not self._healthy[index]:
+            logger.info("Read replica healthy again", replica=index)
+        self._healthy[index] = True
+
+    async def _monitor(self) -> None:
+        while True:
+            await asyncio.gather(*(self._check(i) for i in range(len(self.engines))))
+            await asyncio.sleep(settings.DB_REPLICA_HEALTH_CHECK_SECONDS)
+
+    def start(self) -> None:
+        """Start the background health checks (application startup)."""
+        if self.engines and self._task is None:
+            self._task = asyncio.create_task(self._monitor())
+
+    async def stop(self) -> None:
+        """Stop health checks and close replica connections (application shutdown)."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for engine in self.engines:
+            await engine.dispose()
+
+
+replica_router = ReplicaRouter(settings.DATABASE_REPLICA_URLS)
+
+
+def _pin_signature(expires_at: str) -> str:
+    return hmac.new(
+        settings.SECRET_KEY.encode("utf-8"),
+        f"{PRIMARY_PIN_COOKIE}:{expires_at}".encode("utf-8"),
+        hashlib.sha256,
+    ).hexdigest()[:32]
+
+
+def make_primary_pin(expires_at: int) -> str:
+    """Signed primary pin cookie value expiring at `expires_at` (unix time)."""
+    return f"{expires_at}.{_pin_signature(str(expires_at))}"
+
+
+def is_pinned_to_primary(cookie_header: Optional[str]) -> bool:
+    """Whether the client wrote recently and must read from the primary."""
+    if not cookie_header:
+        return False
+    cookie = SimpleCookie()
+    try:
+        cookie.load(cookie_header)
+    except Exception:
+        return False
+    morsel = cookie.get(PRIMARY_PIN_COOKIE)
+    if morsel is None:
+        return False
+    expires_at, _, signature = morsel.value.partition(".")
+    if not hmac.compare_digest(signature, _pin_signature(expires_at)):
+        return False
+    try:
+        remaining = int(expires_at) - time.time()
+    except ValueError:
+        return False
+    # A validly signed pin can't outlive the configured pin time either
+    return 0 < remaining <= settings.DB_REPLICA_PRIMARY_PIN_SECONDS
+
+
+class PrimaryPinMiddleware:
+    """
+    Read-your-writes for replica reads.
+
+    Successful write requests set a short-lived cookie; while it is present,
+    get_read_db serves the client from the primary, so a newly created job shows
+    up immediately in the employer's own listings. Does nothing without replicas.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in _WRITE_METHODS
+            or not replica_router.engines
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_pin(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                pin_seconds = settings.DB_REPLICA_PRIMARY_PIN_SECONDS
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Set-Cookie",
+                    f"{PRIMARY_PIN_COOKIE}={make_primary_pin(int(time.time()) + pin_seconds)}; "
+                    f"Max-Age={pin_seconds}; Path=/; HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_pin)
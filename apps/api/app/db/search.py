@@ -0,0 +1,60 @@
+from sqlalchemy import Float, func, literal_column
+from sqlalchemy.sql.elements import ColumnElement
+
+# Text search configuration used for both indexing and querying
+SEARCH_CONFIG = "english"
+
+
+def weighted_search_vector_sql(prefix: str = "") -> str:
+    """
+    SQL expression for a job's weighted search vector.
+
+    Weights: title (A) > tags (B) > requirements (C) > description (D).
+    `prefix` qualifies the columns, e.g. "NEW." inside a trigger.
+    """
+    parts = [
+        (f"{prefix}title", "A"),
+        (f"array_to_string({prefix}tags, ' ')", "B"),
+        (f"{prefix}requirements_md", "C"),
+        (f"{prefix}description_md", "D"),
+    ]
+    return " || ".join(
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce({expr}, '')), '{weight}')"
+        for expr, weight in parts
+    )
+
+
+# Trigger function maintaining `search_vector` from the row's own title, tags,
+# requirements_md and description_md. It is shared by every table with those columns.
+SEARCH_VECTOR_TRIGGER_FUNCTION_SQL = f"""
+CREATE OR REPLACE FUNCTION jobs_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := {weighted_search_vector_sql("NEW.")};
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql
+"""
+
+
+def search_vector_trigger_sql(table_name: str) -> str:
+    """DDL for the trigger keeping `table_name.search_vector` up to date on write."""
+    return f"""
+CREATE TRIGGER {table_name}_search_vector_trigger
+BEFORE INSERT OR UPDATE OF title, tags, requirements_md, description_md ON {table_name}
+FOR EACH ROW EXECUTE FUNCTION jobs_search_vector_update()
+"""
+
+
+def search_query(q: str) -> ColumnElement:
+    """Parse user input with websearch syntax ("quoted phrases", OR, -exclusions)."""
+    return func.websearch_to_tsquery(literal_column(f"'{SEARCH_CONFIG}'::regconfig"), q)
+
+
+def search_matches(vector_column: ColumnElement, q: str) -> ColumnElement:
+    """Predicate matching rows whose search vector satisfies the query (GIN-indexed)."""
+    return vector_column.op("@@")(search_query(q))
+
+
+def search_rank(vector_column: ColumnElement, q: str) -> ColumnElement:
+    """Relevance score for `sort_by=relevance`, honouring the field weights."""
+    return func.ts_rank_cd(vector_column, search_query(q), type_=Float)
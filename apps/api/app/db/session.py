@@ -1,8 +1,16 @@
-from typing import AsyncGenerator
-from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import AsyncGenerator, AsyncIterator
+import asyncio
+from fastapi import Depends, Request
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
-from app.db.base import AsyncSessionLocal, engine, Base
+from app.core.config import settings
+from app.core.metrics import DB_READ_ROUTING
+from app.db.base import AsyncSessionLocal, engine
+from app.db.replicas import is_pinned_to_primary, replica_router
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -18,8 +26,122 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
-async def init_db() -> None:
-    """Initialize database tables."""
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+async def release_connection(db: AsyncSession) -> None:
+    """
+    End the session's transaction so its connection goes back to the pool.
 
+    Call before slow work that doesn't need the database (password hashing,
+    Redis calls). Commits anything pending; loaded objects stay usable
+    (expire_on_commit=False) and the next statement checks out a connection again.
+    """
+    await db.commit()
+
+
+@lru_cache(maxsize=None)
+def _read_only_bind(target: AsyncEngine) -> AsyncEngine:
+    """`target` with READ ONLY (optionally DEFERRABLE) transactions."""
+    options = {"postgresql_readonly": True}
+    if settings.DB_READ_ONLY_DEFERRABLE:
+        # DEFERRABLE only has an effect on SERIALIZABLE READ ONLY transactions
+        options.update(isolation_level="SERIALIZABLE", postgresql_deferrable=True)
+    return target.execution_options(**options)
+
+
+@asynccontextmanager
+async def read_only_session(target: AsyncEngine = engine) -> AsyncIterator[AsyncSession]:
+    """
+    Session for reads only, in a READ ONLY transaction.
+
+    Nothing is flushed or committed: the transaction is rolled back and the
+    connection returned to the pool when the block exits. Writes fail in the
+    database.
+    """
+    async with AsyncSessionLocal(bind=_read_only_bind(target)) as session:
+        yield session
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for a read-only session (see read_only_session).
+
+    Served by a healthy read replica when DATABASE_REPLICA_URLS is set, unless the
+    client wrote recently (primary pin cookie). Falls back to the primary.
+
+    Use with Depends(get_read_db, scope="function") so the connection is released
+    when the handler returns, before the response is sent.
+    """
+    replica = None
+    if replica_router.engines:
+        if is_pinned_to_primary(request.headers.get("cookie")):
+            DB_READ_ROUTING.labels(target="primary_pinned").inc()
+        else:
+            replica = replica_router.choose()
+            DB_READ_ROUTING.labels(
+                target="replica" if replica is not None else "primary_fallback"
+            ).inc()
+
+    async with read_only_session(replica if replica is not None else engine) as session:
+        try:
+            yield session
+        except (exc.OperationalError, exc.InterfaceError, OSError) as e:
+            if replica is not None:
+                # Take the replica out of rotation until a health check passes
+                replica_router.mark_unhealthy(replica, str(e))
+            raise
+
+
+async def get_primary_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for a read-only session on the primary (health checks)."""
+    async with read_only_session() as session:
+        yield session
+
+
+# Alembic scripts (apps/api/alembic), resolved independently of the working directory
+ALEMBIC_SCRIPT_LOCATION = Path(__file__).resolve().parents[2] / "alembic"
+
+
+class SchemaRevisionError(RuntimeError):
+    """The database schema is not at the Alembic head revision."""
+
+
+def get_alembic_heads() -> set[str]:
+    """Head revision(s) of the migration scripts shipped with this build."""
+    from alembic.script import ScriptDirectory
+
+    return set(ScriptDirectory(str(ALEMBIC_SCRIPT_LOCATION)).get_heads())
+
+
+async def check_schema_revision() -> str:
+    """
+    Verify that the database has been migrated to the Alembic head.
+
+    One query against alembic_version; the schema itself is owned by Alembic
+    (`alembic upgrade head`) and never created or altered at startup. Returns
+    the current revision, or raises SchemaRevisionError.
+    """
+    heads = get_alembic_heads()
+    try:
+        async with engine.connect() as conn:
+            result = await conn.execute(text("SELECT version_num FROM alembic_version"))
+            current = set(result.scalars().all())
+    except exc.ProgrammingError as e:
+        raise SchemaRevisionError(
+            "Database has no alembic_version table; run `alembic upgrade head`"
+        ) from e
+
+    if current != heads:
+        raise SchemaRevisionError(
+            f"Database is at revision {', '.join(sorted(current)) or 'none'} but the "
+            f"application expects {', '.join(sorted(heads))}; run `alembic upgrade head`"
+        )
+    return ", ".join(sorted(current))
+
+
+async def warm_up_pool(connections: int) -> None:
+    """Open `connections` pooled connections concurrently so they sit idle, ready for use."""
+
+    async def touch() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(touch() for _ in range(connections)))
@@ -1,3 +1,8 @@
+import time
+
+# Import time of the application (framework, models, routers) for the startup report
+_imports_started_at = time.perf_counter()
+
 import asyncio
 from contextlib import asynccontextmanager
 
@@ -8,23 +13,56 @@ import structlog
 
 from app.core.config import settings
 from app.core.logging import setup_logging
-from app.db.session import init_db
+from app.core.keys import key_ring
+from app.core.hashing import shutdown_hash_executor
+from app.core.revocation import start_revocation_listener, stop_revocation_listener
+from app.core.startup import StartupTimer
+from app.db.session import check_schema_revision, warm_up_pool
+from app.db.replicas import PrimaryPinMiddleware, replica_router
+from app.utils.rate_limit import RateLimitMiddleware
+from app.utils.idempotency import IdempotencyMiddleware, get_redis
 from app.api.v1 import auth, employers, jobs, categories, public, health, jwks
 from app.api.v1.applications import router as applications_router
 
 logger = structlog.get_logger(__name__)
 
+startup_timer = StartupTimer()
+startup_timer.record("imports", time.perf_counter() - _imports_started_at)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     # Startup
     logger.info("Starting application", version=settings.APP_VERSION)
-    await init_db()
-    logger.info("Database initialized")
+    if settings.DB_SCHEMA_CHECK_ENABLED:
+        with startup_timer.phase("schema_check"):
+            revision = await check_schema_revision()
+        logger.info("Database schema is up to date", revision=revision)
+    warmup = min(settings.DB_POOL_WARMUP_CONNECTIONS, settings.DB_POOL_SIZE)
+    if warmup > 0:
+        with startup_timer.phase("pool_warmup"):
+            await warm_up_pool(warmup)
+        logger.info("Database pool warmed up", connections=warmup)
+    # Generate (if needed) and parse the JWT keys before serving requests
+    with startup_timer.phase("key_loading"):
+        key_ring.refresh(force=True)
+    with startup_timer.phase("redis_connect"):
+        try:
+            r = await get_redis()
+            await r.ping()
+        except Exception as e:
+            # Redis-backed features fail open, so don't block startup on it
+            logger.error("Redis unavailable at startup", error=str(e))
+    start_revocation_listener()
+    replica_router.start()
+    startup_timer.report()
     yield
     # Shutdown
     logger.info("Shutting down application")
+    await stop_revocation_listener()
+    await replica_router.stop()
+    shutdown_hash_executor()
 
 
 app = FastAPI(
@@ -40,6 +78,18 @@ app = FastAPI(
 # Setup logging
 setup_logging()
 
+# Idempotency-Key replay for write routes (IDEMPOTENCY_ROUTES). Runs inside the
+# rate limiter, so replays still count against the caller's limits.
+app.add_middleware(IdempotencyMiddleware)
+
+# Read-your-writes when reads go to replicas: pins a client to the primary for
+# DB_REPLICA_PRIMARY_PIN_SECONDS after a successful write
+app.add_middleware(PrimaryPinMiddleware)
+
+# Per-route rate limits (RATE_LIMIT_POLICIES). Added before CORS so that
+# throttled responses still carry CORS headers.
+app.add_middleware(RateLimitMiddleware)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
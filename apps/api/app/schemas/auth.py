@@ -1,3 +1,5 @@
+import uuid
+
 from pydantic import BaseModel, EmailStr, ConfigDict
 
 
@@ -28,6 +30,8 @@ class TokenResponse(BaseModel):
 
 class RefreshTokenRequest(BaseModel):
     refresh_token: str
+    # From TokenResponse; only needed to look up legacy (pre selector/verifier) tokens
+    employer_id: uuid.UUID | None = None
 
     model_config = ConfigDict(extra="forbid")
 
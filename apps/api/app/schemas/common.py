@@ -21,6 +21,7 @@ class CursorPage(BaseModel, Generic[T]):
 
     items: list[T]
     next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
 
     model_config = ConfigDict(extra="forbid")
 
@@ -77,6 +77,7 @@ class JobResponse(JobBase):
     id: uuid.UUID
     employer_id: uuid.UUID
     employer_company_name: Optional[str] = None
+    excerpt: Optional[str] = None
     status: str
     categories: Optional[list[str]] = None
     salaries: List[JobSalaryResponse] = []
@@ -86,6 +87,26 @@ class JobResponse(JobBase):
     model_config = ConfigDict(extra="forbid", from_attributes=True)
 
 
+class JobSummaryResponse(BaseModel):
+    """Lean listing representation: the excerpt replaces the markdown bodies."""
+
+    id: uuid.UUID
+    employer_id: uuid.UUID
+    employer_company_name: Optional[str] = None
+    title: str
+    excerpt: Optional[str] = None
+    location: Optional[str] = None
+    is_salary_public: bool
+    salaries: List[JobSalaryResponse] = []
+    status: str
+    categories: Optional[list[str]] = None
+    tags: Optional[list[str]] = None
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(extra="forbid", from_attributes=True)
+
+
 class JobPublicResponse(BaseModel):
     id: uuid.UUID
     employer_id: uuid.UUID
@@ -93,6 +114,28 @@ class JobPublicResponse(BaseModel):
     title: str
     description_md: str
     requirements_md: Optional[str] = None
+    excerpt: Optional[str] = None
+    location: Optional[str] = None
+    is_salary_public: bool
+    salary_hidden: Optional[bool] = None
+    salaries: List[JobSalaryResponse] = []
+    status: str
+    categories: Optional[list[str]] = None
+    tags: Optional[list[str]] = None
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(extra="forbid", from_attributes=True)
+
+
+class JobPublicSummaryResponse(BaseModel):
+    """Lean public listing representation: the excerpt replaces the markdown bodies."""
+
+    id: uuid.UUID
+    employer_id: uuid.UUID
+    employer_company_name: Optional[str] = None
+    title: str
+    excerpt: Optional[str] = None
     location: Optional[str] = None
     is_salary_public: bool
     salary_hidden: Optional[bool] = None
@@ -105,3 +148,25 @@ class JobPublicResponse(BaseModel):
 
     model_config = ConfigDict(extra="forbid", from_attributes=True)
 
+
+
+class FacetCount(BaseModel):
+    value: str
+    count: int
+
+
+class SalaryBandCount(BaseModel):
+    currency: SupportedCurrency
+    min: float
+    max: Optional[float] = None
+    count: int
+
+
+class JobFacetsResponse(BaseModel):
+    total: int
+    categories: List[FacetCount] = []
+    locations: List[FacetCount] = []
+    currencies: List[FacetCount] = []
+    salary_bands: List[SalaryBandCount] = []
+
+    model_config = ConfigDict(extra="forbid")
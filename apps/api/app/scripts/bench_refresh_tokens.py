@@ -0,0 +1,192 @@
+"""Compare the cost of validating selector/verifier and legacy refresh tokens.
+
+Usage: python -m app.scripts.bench_refresh_tokens [--legacy-rows N] [--runs R]
+                                                  [--table-sizes 1000,10000,100000]
+
+Measures the hashing work /auth/refresh does per request, without a database:
+one HMAC check for a selector/verifier token, and the bcrypt scan a legacy token
+causes over N outstanding legacy rows. The worst case is an invalid token, which
+is checked against every scanned row; with the scan capped at
+REFRESH_TOKEN_LEGACY_SCAN_LIMIT rows that cost is bounded whatever N is.
+
+With --table-sizes, also calls the /auth/refresh handler against the configured
+database while refresh_tokens is grown to each size with other employers'
+selector and legacy rows, and prints the median latency per size. The rows are
+deleted afterwards.
+"""
+import argparse
+import asyncio
+from datetime import datetime, timedelta
+import secrets
+import statistics
+import time
+from typing import Awaitable, Callable
+import uuid
+
+import bcrypt
+from fastapi import HTTPException
+from sqlalchemy import delete, insert, text
+
+from app.api.v1.auth import refresh_token
+from app.core.config import settings
+from app.core.security import (
+    create_refresh_token,
+    hash_refresh_token,
+    split_refresh_token,
+    verify_legacy_refresh_token,
+    verify_refresh_token,
+)
+from app.db.models import Employer, RefreshToken
+from app.db.session import AsyncSessionLocal
+from app.schemas.auth import RefreshTokenRequest
+
+FILLER_BATCH = 10_000
+
+
+def _median_ms(fn: Callable[[], object], runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def hashing(legacy_rows: int, runs: int) -> None:
+    token = create_refresh_token()
+    _, verifier = split_refresh_token(token)
+    stored = hash_refresh_token(verifier)
+    new_ms = _median_ms(lambda: verify_refresh_token(verifier, stored), max(runs, 1000))
+
+    print(f"Hashing {legacy_rows} legacy tokens at {settings.BCRYPT_ROUNDS} bcrypt rounds...")
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    legacy_hashes = [
+        bcrypt.hashpw(secrets.token_urlsafe(32).encode(), salt).decode() for _ in range(legacy_rows)
+    ]
+    invalid = secrets.token_urlsafe(32)
+    capped = legacy_hashes[:settings.REFRESH_TOKEN_LEGACY_SCAN_LIMIT]
+
+    def scan(hashes: list[str]) -> None:
+        for hashed in hashes:
+            verify_legacy_refresh_token(invalid, hashed)
+
+    uncapped_ms = _median_ms(lambda: scan(legacy_hashes), runs)
+    capped_ms = _median_ms(lambda: scan(capped), runs)
+
+    print(f"{'selector/verifier (HMAC)':<40} {new_ms:>10.4f} ms")
+    print(f"{f'invalid legacy token, {legacy_rows} rows':<40} {uncapped_ms:>10.1f} ms")
+    print(f"{f'invalid legacy token, capped at {len(capped)}':<40} {capped_ms:>10.1f} ms")
+
+
+async def _median_async_ms(prepare: Callable[[], Awaitable[str]], call, runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        token = await prepare()
+        start = time.perf_counter()
+        await call(token)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+async def _add_filler(db, employer_ids: list[uuid.UUID], count: int) -> None:
+    """Other employers' tokens, half selector/verifier and half legacy (never checked)."""
+    expires_at = datetime.utcnow() + timedelta(days=settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS)
+    for start in range(0, count, FILLER_BATCH):
+        rows = []
+        for number in range(start, min(start + FILLER_BATCH, count)):
+            legacy = number % 2 == 1
+            rows.append(
+                {
+                    "employer_id": employer_ids[number % len(employer_ids)],
+                    "selector": None if legacy else secrets.token_urlsafe(12),
+                    "token_hash": secrets.token_hex(32),
+                    "expires_at": expires_at,
+                }
+            )
+        await db.execute(insert(RefreshToken), rows)
+    await db.commit()
+
+
+async def table_growth(table_sizes: list[int], runs: int) -> None:
+    async with AsyncSessionLocal() as db:
+        target = Employer(company_name="Bench", email="bench-target@example.mv", password_hash="x")
+        others = [
+            Employer(company_name="Bench", email=f"bench-{number}@example.mv", password_hash="x")
+            for number in range(100)
+        ]
+        db.add_all([target, *others])
+        await db.commit()
+        employer_ids = [employer.id for employer in others]
+        target_id = target.id
+        salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+
+        async def store(legacy: bool) -> str:
+            token = secrets.token_urlsafe(32) if legacy else create_refresh_token()
+            selector, verifier = split_refresh_token(token)
+            if legacy:
+                token_hash = bcrypt.hashpw(token.encode(), salt).decode()
+            else:
+                token_hash = hash_refresh_token(verifier)
+            db.add(
+                RefreshToken(
+                    employer_id=target_id,
+                    selector=selector,
+                    token_hash=token_hash,
+                    expires_at=datetime.utcnow() + timedelta(days=1),
+                )
+            )
+            await db.commit()
+            return token
+
+        async def call(token: str) -> None:
+            try:
+                request = RefreshTokenRequest(refresh_token=token, employer_id=target_id)
+                await refresh_token(request, db=db)
+            except HTTPException:
+                pass
+
+        async def store_selector() -> str:
+            return await store(legacy=False)
+
+        async def store_legacy() -> str:
+            return await store(legacy=True)
+
+        async def invalid_legacy() -> str:
+            return secrets.token_urlsafe(32)
+
+        print(f"{'rows':>10} {'selector ms':>12} {'legacy ms':>10} {'invalid legacy ms':>18}")
+        try:
+            # The target employer keeps a full scan's worth of outstanding legacy rows
+            for _ in range(settings.REFRESH_TOKEN_LEGACY_SCAN_LIMIT):
+                await store(legacy=True)
+            rows = 0
+            for size in sorted(table_sizes):
+                await _add_filler(db, employer_ids, size - rows)
+                rows = size
+                await db.execute(text("ANALYZE refresh_tokens"))
+                await db.commit()
+                selector_ms = await _median_async_ms(store_selector, call, runs)
+                legacy_ms = await _median_async_ms(store_legacy, call, runs)
+                invalid_ms = await _median_async_ms(invalid_legacy, call, runs)
+                print(f"{size:>10} {selector_ms:>12.2f} {legacy_ms:>10.1f} {invalid_ms:>18.1f}")
+        finally:
+            ids = [target_id, *employer_ids]
+            await db.rollback()
+            await db.execute(delete(RefreshToken).where(RefreshToken.employer_id.in_(ids)))
+            await db.execute(delete(Employer).where(Employer.id.in_(ids)))
+            await db.commit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--legacy-rows", type=int, default=100, help="outstanding legacy tokens")
+    parser.add_argument("--runs", type=int, default=3, help="timed runs per case (median reported)")
+    parser.add_argument(
+        "--table-sizes",
+        type=lambda value: [int(size) for size in value.split(",")],
+        help="comma-separated refresh_tokens sizes to time the handler at (needs a database)",
+    )
+    args = parser.parse_args()
+    hashing(args.legacy_rows, args.runs)
+    if args.table_sizes:
+        asyncio.run(table_growth(args.table_sizes, args.runs))
@@ -0,0 +1,102 @@
+"""Compare the old salary filter subqueries with the read-model range predicates.
+
+Usage: python -m app.scripts.bench_salary_filter [--runs N]
+
+Runs each case against the configured database with EXPLAIN (ANALYZE, FORMAT
+JSON) and prints the median execution time, the matching row count and the
+scan nodes used, for the pre-read-model query over jobs/job_salaries and for
+salary_filter() over published_job_cards. Load realistic volumes first, e.g.
+python -m app.scripts.seed --scale 20.
+"""
+import argparse
+import asyncio
+import json
+import statistics
+from typing import Optional
+
+from sqlalchemy import Select, and_, func, or_, select, text
+from sqlalchemy.dialects import postgresql
+
+from app.db.models import Job, JobSalary, PublishedJobCard
+from app.db.read_model import salary_filter
+from app.db.session import AsyncSessionLocal
+
+# (label, salary_min, salary_max, currency)
+CASES = [
+    ("currency only", None, None, "USD"),
+    ("range in MVR", 10_000, 30_000, "MVR"),
+    ("range in USD", 1_000, 3_000, "USD"),
+    ("range, any currency", 10_000, 30_000, None),
+]
+
+
+def old_query(salary_min: Optional[float], salary_max: Optional[float], currency: Optional[str]) -> Select:
+    """The listing filter as it was before the read model: subqueries over job_salaries."""
+    query = select(Job.id).where(Job.status == "published")
+    if currency:
+        with_currency = select(JobSalary.job_id).where(JobSalary.currency == currency).distinct()
+        query = query.where(Job.id.in_(select(with_currency.c.job_id)))
+    if salary_min is not None and salary_max is not None:
+        non_matching = select(JobSalary.job_id).where(
+            and_(
+                JobSalary.currency == currency if currency else True,
+                or_(
+                    JobSalary.amount_min < salary_min,
+                    JobSalary.amount_max > salary_max,
+                    JobSalary.amount_min.is_(None),
+                    JobSalary.amount_max.is_(None),
+                ),
+            )
+        ).subquery()
+        query = query.where(~Job.id.in_(select(non_matching.c.job_id)))
+    return query
+
+
+def new_query(salary_min: Optional[float], salary_max: Optional[float], currency: Optional[str]) -> Select:
+    query = select(PublishedJobCard.job_id)
+    predicate = salary_filter(salary_min, salary_max, currency)
+    if predicate is not None:
+        query = query.where(predicate)
+    return query
+
+
+def _scan_nodes(plan: dict) -> list[str]:
+    nodes = []
+    if "Scan" in plan["Node Type"]:
+        nodes.append(f"{plan['Node Type']} {plan.get('Index Name') or plan.get('Relation Name', '')}".strip())
+    for child in plan.get("Plans", []):
+        nodes.extend(_scan_nodes(child))
+    return nodes
+
+
+async def measure(db, query: Select, runs: int) -> tuple[float, int, list[str]]:
+    sql = str(query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    timings = []
+    for _ in range(runs):
+        result = await db.execute(text(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql}"))
+        explain = result.scalar_one()
+        if isinstance(explain, str):
+            explain = json.loads(explain)
+        timings.append(explain[0]["Execution Time"])
+    count = (await db.execute(select(func.count()).select_from(query.subquery()))).scalar_one()
+    return statistics.median(timings), count, _scan_nodes(explain[0]["Plan"])
+
+
+async def main(runs: int) -> None:
+    async with AsyncSessionLocal() as db:
+        await db.execute(text("ANALYZE jobs, job_salaries, published_job_cards"))
+        print(f"{'case':<22} {'old ms':>9} {'new ms':>9} {'speedup':>8}  rows old/new")
+        for label, salary_min, salary_max, currency in CASES:
+            old_ms, old_rows, _ = await measure(db, old_query(salary_min, salary_max, currency), runs)
+            new_ms, new_rows, new_nodes = await measure(db, new_query(salary_min, salary_max, currency), runs)
+            speedup = old_ms / new_ms if new_ms else float("inf")
+            print(f"{label:<22} {old_ms:>9.2f} {new_ms:>9.2f} {speedup:>7.1f}x  {old_rows}/{new_rows}")
+            print(f"{'':<22} new plan: {', '.join(new_nodes)}")
+        await db.rollback()
+    print("\nRow counts differ where jobs hide their salary: the read model only filters on public salaries.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20, help="EXPLAIN ANALYZE runs per query (median reported)")
+    asyncio.run(main(parser.parse_args().runs))
@@ -0,0 +1,21 @@
+"""Rebuild the published_job_cards read model from the normalized tables.
+
+Usage: python -m app.scripts.rebuild_job_cards
+"""
+import asyncio
+
+from app.db.session import AsyncSessionLocal
+from app.db.read_model import rebuild_job_cards
+from app.utils.cache import bump_public_jobs_generation
+
+
+async def main():
+    async with AsyncSessionLocal() as db:
+        count = await rebuild_job_cards(db)
+        await db.commit()
+    await bump_public_jobs_generation()
+    print(f"Rebuilt {count} published job cards")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,10 +1,16 @@
-"""Seed script for populating sample data."""
+"""Seed script for populating sample data.
+
+Usage: python -m app.scripts.seed [--scale N [--seed S] [--workers W]]
+"""
+import argparse
 import asyncio
 from sqlalchemy import select
 from app.db.session import AsyncSessionLocal
 from app.db.models import Employer, Job, Category, JobCategory, Application, JobSalary
+from app.db.ids import uuid7
 from app.core.security import get_password_hash
-import uuid
+from app.db.read_model import rebuild_job_cards
+from app.utils.text import make_excerpt
 import random
 
 # Maldivian employers data
@@ -271,7 +277,7 @@ async def seed():
 
             if not employer:
                 employer = Employer(
-                    id=uuid.uuid4(),
+                    id=uuid7(),
                     company_name=emp_data["company_name"],
                     email=emp_data["email"],
                     password_hash=get_password_hash(emp_data["password"]),
@@ -308,7 +314,7 @@ async def seed():
             category = result.scalar_one_or_none()
             if not category:
                 category = Category(
-                    id=uuid.uuid4(),
+                    id=uuid7(),
                     name=cat_data["name"],
                     description=cat_data["description"],
                 )
@@ -646,10 +652,11 @@ async def seed():
                     is_salary_public = job_data.get("is_salary_public", True)
 
                 job = Job(
-                    id=uuid.uuid4(),
+                    id=uuid7(),
                     employer_id=employer.id,
                     title=job_data["title"],
                     description_md=job_data["description_md"],
+                    excerpt=make_excerpt(job_data["description_md"]),
                     requirements_md=job_data.get("requirements_md"),
                     location=job_data.get("location"),
                     is_salary_public=is_salary_public,
@@ -662,7 +669,7 @@ async def seed():
                 # Create salary entries
                 for salary_data in salaries_data:
                     salary = JobSalary(
-                        id=uuid.uuid4(),
+                        id=uuid7(),
                         job_id=job.id,
                         currency=salary_data["currency"],  # Use string value directly
                         amount_min=salary_data.get("amount_min"),
@@ -703,7 +710,7 @@ async def seed():
                 applicant_idx = i % len(applicant_names)
                 
                 application = Application(
-                    id=uuid.uuid4(),
+                    id=uuid7(),
                     employer_id=job.employer_id,
                     job_id=job.id,
                     applicant_name=applicant_names[applicant_idx],
@@ -721,6 +728,10 @@ async def seed():
                 db.add(application)
                 print(f"Created application from {application.applicant_name} for {job.title}")
 
+        # Project published jobs into the public read model
+        await db.flush()
+        await rebuild_job_cards(db)
+
         await db.commit()
         print(f"\nDatabase seeded successfully!")
         print(f"- {len(employers)} employers")
@@ -730,13 +741,27 @@ async def seed():
 
 
 if __name__ == "__main__":
-    # First validate the seed data structure
-    validate_seed_data()
-
-    # Then try to run the actual seeding
-    try:
-        asyncio.run(seed())
-    except Exception as e:
-        print(f"\n⚠️  Database seeding failed due to environment setup: {e}")
-        print("✅ But the seed data has been successfully updated with Maldivian job listings!")
-
+    parser = argparse.ArgumentParser(description="Seed the database with sample data.")
+    parser.add_argument(
+        "--scale", type=int, default=None,
+        help="Load N x (20 employers, 500 jobs, 20,000 applications) of synthetic data via COPY "
+             "instead of the demo data",
+    )
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for --scale (default 1)")
+    parser.add_argument("--workers", type=int, default=4, help="Parallel COPY streams for --scale (default 4)")
+    args = parser.parse_args()
+
+    if args.scale:
+        from app.scripts.synthetic import generate
+
+        asyncio.run(generate(args.scale, seed=args.seed, workers=args.workers))
+    else:
+        # First validate the seed data structure
+        validate_seed_data()
+
+        # Then try to run the actual seeding
+        try:
+            asyncio.run(seed())
+        except Exception as e:
+            print(f"\n⚠️  Database seeding failed due to environment setup: {e}")
+            print("✅ But the seed data has been successfully updated with Maldivian job listings!")
@@ -0,0 +1,557 @@
+"""Deterministic large-scale synthetic data for load tests and EXPLAIN checks.
+
+Usage: python -m app.scripts.seed --scale N [--seed S] [--workers W]
+
+Scale 1 is 20 employers, 500 jobs and 20,000 applications; every table grows
+linearly with N (scale 100 gives 2 million applications). Rows are streamed
+with asyncpg COPY over several connections at once, and the same seed always
+produces the same rows whatever the number of workers. Run it against a
+migrated database; it refuses to load the same seed twice.
+"""
+import asyncio
+import bisect
+import json
+import random
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import AsyncIterator, Callable, Iterator, Optional
+import asyncpg
+
+from app.api.v1.public import MALDIVES_LOCATIONS
+from app.core.config import settings
+from app.core.security import get_password_hash
+from app.db.ids import uuid7_at
+from app.db.read_model import rebuild_job_cards
+from app.db.session import AsyncSessionLocal
+from app.scripts.seed import categories_data
+from app.utils.cache import bump_public_jobs_generation
+from app.utils.text import make_excerpt
+
+EMPLOYERS_PER_SCALE = 20
+JOBS_PER_SCALE = 500
+APPLICATIONS_PER_SCALE = 20_000
+
+# Rows are generated in fixed-size blocks, each from its own seeded RNG, so the
+# output doesn't depend on how blocks are spread over workers
+JOB_BLOCK_ROWS = 5_000
+APPLICATION_BLOCK_ROWS = 50_000
+# Progress is counted, and other COPY streams get a turn, every this many rows
+STREAM_BATCH_ROWS = 5_000
+
+# Data covers the year up to this (fixed, for reproducibility) date
+PERIOD_END = datetime(2026, 10, 1)
+PERIOD_DAYS = 365
+MVR_PER_USD = Decimal("15.42")
+
+SECTORS = {
+    "tourism": {
+        "companies": [
+            "{island} Island Resort & Spa", "{island} Beach Retreat", "{island} Lagoon Villas",
+            "{island} Dive Centre", "{atoll} Tours & Travels", "{island} Guest House",
+        ],
+        "categories": ["Hospitality & Tourism", "Food & Beverage", "Travel & Tourism"],
+        "titles": [
+            "Front Office Manager", "Guest Relations Officer", "Sous Chef", "Commis Chef",
+            "Bartender", "Dive Instructor", "Housekeeping Supervisor", "Spa Therapist",
+            "Butler", "Reservations Agent", "Boat Captain", "Watersports Instructor",
+            "Restaurant Manager", "Marine Biologist", "Night Auditor",
+        ],
+        "tags": [
+            "hospitality", "guest-services", "resort", "customer-service", "culinary",
+            "diving", "housekeeping", "spa", "island-life", "shift-work", "luxury", "marine",
+        ],
+        "mvr_salary": (8_000, 40_000),
+        "usd_share": 0.6,
+    },
+    "civil": {
+        "companies": [
+            "{island} Council", "{atoll} Atoll Council", "{atoll} Regional Hospital",
+            "{island} School", "{island} Health Centre", "{atoll} Magistrate Court",
+        ],
+        "categories": ["Government Administration", "Healthcare Services", "Education"],
+        "titles": [
+            "Administrative Officer", "Council Secretary", "Staff Nurse", "Medical Officer",
+            "Primary Teacher", "Lab Technician", "Pharmacist", "Accounts Officer",
+            "Project Coordinator", "Community Health Worker", "Records Clerk",
+        ],
+        "tags": [
+            "public-service", "administration", "healthcare", "education", "policy",
+            "community", "nursing", "teaching", "records", "government",
+        ],
+        "mvr_salary": (7_000, 30_000),
+        "usd_share": 0.05,
+    },
+    "private": {
+        "companies": [
+            "{island} Trading Pvt Ltd", "{atoll} Construction Pvt Ltd", "{island} Fisheries Pvt Ltd",
+            "{atoll} Logistics Pvt Ltd", "{island} Digital Solutions Pvt Ltd", "{atoll} Finance Pvt Ltd",
+        ],
+        "categories": [
+            "Banking & Finance", "Construction & Engineering", "Telecommunications",
+            "Information Technology",
+        ],
+        "titles": [
+            "Software Engineer", "Network Engineer", "Accountant", "Relationship Manager",
+            "Site Engineer", "Quantity Surveyor", "Sales Executive", "Logistics Coordinator",
+            "Customer Service Representative", "Data Analyst", "Electrician", "Marketing Officer",
+        ],
+        "tags": [
+            "finance", "engineering", "it", "sales", "logistics", "construction",
+            "customer-service", "analytics", "telecom", "full-time",
+        ],
+        "mvr_salary": (10_000, 60_000),
+        "usd_share": 0.2,
+    },
+}
+SECTOR_WEIGHTS = {"tourism": 5, "civil": 2, "private": 3}
+GENERAL_CATEGORIES = ["Human Resources", "Operations & Management"]
+
+JOB_STATUSES = ["published", "closed", "draft"]
+JOB_STATUS_WEIGHTS = [75, 15, 10]
+APPLICATION_STATUSES = ["new", "screening", "interview", "offer", "hired", "rejected"]
+APPLICATION_STATUS_WEIGHTS = [40, 25, 15, 5, 5, 10]
+
+FIRST_NAMES = [
+    "Ahmed", "Mohamed", "Aishath", "Fathimath", "Ibrahim", "Hassan", "Mariyam", "Ali",
+    "Hawwa", "Ismail", "Aminath", "Hussain", "Shifa", "Nashid", "Zeena", "Ahusan",
+    "Mausoom", "Shiuna", "Yoosuf", "Raufa", "Priya", "Rahul", "Nimal", "Sarah", "John",
+]
+LAST_NAMES = [
+    "Ibrahim", "Mohamed", "Rasheed", "Hassan", "Saeed", "Naseem", "Shareef", "Waheed",
+    "Latheef", "Manik", "Didi", "Zahir", "Adam", "Sharma", "Perera", "Smith",
+]
+EMAIL_DOMAINS = ["gmail.com", "outlook.com", "yahoo.com", "dhivehinet.net.mv", "raajje.mv"]
+
+DESCRIPTION_SENTENCES = [
+    "You will work closely with a small, friendly team and report to the department head.",
+    "The role involves rotating shifts, including weekends and public holidays.",
+    "We offer accommodation, meals and annual leave tickets for island-based staff.",
+    "Training and career development opportunities are provided.",
+    "You will be responsible for maintaining high standards of service and safety.",
+    "The position includes occasional travel between islands.",
+    "Our team serves customers across the atolls and values local knowledge.",
+    "Service charge and performance bonuses apply.",
+]
+REQUIREMENTS = [
+    "Relevant diploma or degree",
+    "2+ years of experience in a similar role",
+    "Fluency in English; Dhivehi preferred",
+    "Strong communication skills",
+    "Ability to work on a remote island",
+    "Valid work permit (expatriate applicants)",
+    "Computer literacy (MS Office)",
+    "Attention to detail and good time management",
+    "Customer-focused attitude",
+    "Willingness to work shifts",
+]
+NOTES = [
+    "Strong technical background", "Good cultural fit", "Needs more experience",
+    "Excellent communication skills", "Shortlisted for second interview", "Salary expectation too high",
+]
+
+EMPLOYER_COLUMNS = ["id", "company_name", "email", "password_hash", "contact_info", "created_at"]
+JOB_COLUMNS = [
+    "id", "employer_id", "title", "description_md", "requirements_md", "excerpt", "location",
+    "is_salary_public", "status", "tags", "created_at", "updated_at",
+]
+SALARY_COLUMNS = ["id", "job_id", "currency", "amount_min", "amount_max", "created_at", "updated_at"]
+JOB_CATEGORY_COLUMNS = ["job_id", "category_id"]
+APPLICATION_COLUMNS = [
+    "id", "employer_id", "job_id", "applicant_name", "applicant_email", "resume_url",
+    "cover_letter_md", "status", "notes", "created_at", "updated_at",
+]
+
+
+@dataclass
+class SyntheticEmployer:
+    id: uuid.UUID
+    company_name: str
+    sector: str
+    island: str
+    atoll: str
+
+
+@dataclass
+class SyntheticJob:
+    id: uuid.UUID
+    employer: SyntheticEmployer
+    title: str
+    created_ms: int
+    status: str
+
+
+def _rng(seed: int, *parts) -> random.Random:
+    return random.Random(":".join(str(part) for part in (seed, *parts)))
+
+
+def _to_datetime(ms: int) -> datetime:
+    return datetime(1970, 1, 1) + timedelta(milliseconds=ms)
+
+
+def _ms(dt: datetime) -> int:
+    return int((dt - datetime(1970, 1, 1)).total_seconds() * 1000)
+
+
+PERIOD_END_MS = _ms(PERIOD_END)
+PERIOD_START_MS = PERIOD_END_MS - PERIOD_DAYS * 86_400_000
+
+
+class Progress:
+    """Row counters per table, printed with rows/second while loading."""
+
+    def __init__(self) -> None:
+        self.started_at = time.perf_counter()
+        self.totals: dict[str, Optional[int]] = {}
+        self.done: dict[str, int] = {}
+
+    def track(self, table: str, total: Optional[int] = None) -> None:
+        self.totals[table] = total
+        self.done.setdefault(table, 0)
+
+    def advance(self, table: str, rows: int) -> None:
+        self.done[table] += rows
+
+    def print(self) -> None:
+        elapsed = max(time.perf_counter() - self.started_at, 1e-9)
+        parts = []
+        for table, done in self.done.items():
+            total = self.totals.get(table)
+            parts.append(f"{table} {done:,}" + (f"/{total:,}" if total else ""))
+        print(f"  [{elapsed:7.1f}s] " + ", ".join(parts) + f" ({sum(self.done.values()) / elapsed:,.0f} rows/s)")
+
+    async def report(self, interval: float = 2.0) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            self.print()
+
+
+async def _stream(rows: Iterator[tuple], table: str, progress: Progress) -> AsyncIterator[tuple]:
+    count = 0
+    for row in rows:
+        yield row
+        count += 1
+        if count == STREAM_BATCH_ROWS:
+            progress.advance(table, count)
+            count = 0
+            # Let the other COPY streams generate their next batch
+            await asyncio.sleep(0)
+    progress.advance(table, count)
+
+
+async def _copy(
+    pool: asyncpg.Pool,
+    table: str,
+    columns: list[str],
+    blocks: list[Callable[[], Iterator[tuple]]],
+    progress: Progress,
+) -> None:
+    """COPY the rows of `blocks`, in order, into `table` over one connection."""
+
+    def rows() -> Iterator[tuple]:
+        for block in blocks:
+            yield from block()
+
+    async with pool.acquire() as conn:
+        await conn.copy_records_to_table(
+            table, columns=columns, records=_stream(rows(), table, progress)
+        )
+
+
+def _parallel_copies(pool, table, columns, blocks, progress, streams: int) -> list:
+    """One COPY per stream, with the blocks dealt out round-robin."""
+    return [
+        _copy(pool, table, columns, blocks[stream::streams], progress)
+        for stream in range(streams)
+        if blocks[stream::streams]
+    ]
+
+
+def plan_employers(seed: int, count: int) -> list[SyntheticEmployer]:
+    rng = _rng(seed, "employers")
+    sectors = list(SECTOR_WEIGHTS)
+    employers = []
+    for _ in range(count):
+        sector = rng.choices(sectors, weights=list(SECTOR_WEIGHTS.values()))[0]
+        location = rng.choice(MALDIVES_LOCATIONS)
+        island = rng.choice(location["islands"])
+        company_name = rng.choice(SECTORS[sector]["companies"]).format(
+            island=island, atoll=location["atoll"]
+        )
+        created_ms = rng.randrange(PERIOD_START_MS - 365 * 86_400_000, PERIOD_START_MS)
+        employers.append(
+            SyntheticEmployer(uuid7_at(created_ms, rng), company_name, sector, island, location["atoll"])
+        )
+    return employers
+
+
+def plan_jobs(seed: int, count: int, employers: list[SyntheticEmployer]) -> list[SyntheticJob]:
+    """Jobs in creation order; a few employers post most of them."""
+    rng = _rng(seed, "jobs")
+    employer_weights = [rng.paretovariate(1.5) for _ in employers]
+    chosen = rng.choices(employers, weights=employer_weights, k=count)
+    created = sorted(rng.randrange(PERIOD_START_MS, PERIOD_END_MS) for _ in range(count))
+    statuses = rng.choices(JOB_STATUSES, weights=JOB_STATUS_WEIGHTS, k=count)
+    return [
+        SyntheticJob(
+            uuid7_at(created_ms, rng),
+            employer,
+            rng.choice(SECTORS[employer.sector]["titles"]),
+            created_ms,
+            status,
+        )
+        for employer, created_ms, status in zip(chosen, created, statuses)
+    ]
+
+
+def employer_rows(seed: int, employers: list[SyntheticEmployer], password_hash: str) -> Iterator[tuple]:
+    rng = _rng(seed, "employer_rows")
+    for index, employer in enumerate(employers):
+        slug = "".join(ch for ch in employer.company_name.lower() if ch.isalnum())[:40]
+        contact_info = {
+            "phone": f"+960-{rng.randrange(300, 800)}-{rng.randrange(1000, 10000)}",
+            "website": f"https://{slug}.mv",
+        }
+        yield (
+            employer.id,
+            employer.company_name,
+            # Seed in the address so several seeds can share a database
+            f"careers.{seed}.{index}@{slug}.mv",
+            password_hash,
+            json.dumps(contact_info),
+            _to_datetime(employer.id.int >> 80),
+        )
+
+
+def job_rows(seed: int, block: int, jobs: list[SyntheticJob]) -> Iterator[tuple]:
+    rng = _rng(seed, "job_rows", block)
+    for job in jobs:
+        employer = job.employer
+        # Mostly at the employer's island, sometimes elsewhere in the country
+        if rng.random() < 0.7:
+            location = f"{employer.island}, {employer.atoll}"
+        else:
+            location = rng.choice(MALDIVES_LOCATIONS)["atoll"]
+        description = (
+            f"{employer.company_name} is looking for a {job.title} to join our team in "
+            f"{employer.island}.\n\n" + " ".join(rng.sample(DESCRIPTION_SENTENCES, k=rng.randint(2, 5)))
+        )
+        requirements = "\n".join(f"- {item}" for item in rng.sample(REQUIREMENTS, k=rng.randint(3, 6)))
+        created_at = _to_datetime(job.created_ms)
+        updated_at = _to_datetime(min(job.created_ms + rng.randrange(0, 10 * 86_400_000), PERIOD_END_MS))
+        yield (
+            job.id,
+            employer.id,
+            job.title,
+            description,
+            requirements,
+            make_excerpt(description),
+            location,
+            rng.random() < 0.85,
+            job.status,
+            rng.sample(SECTORS[employer.sector]["tags"], k=rng.randint(3, 5)),
+            created_at,
+            updated_at,
+        )
+
+
+def _to_usd(amount_mvr: Decimal) -> Decimal:
+    # Rounded to the nearest 50 dollars
+    return (amount_mvr / MVR_PER_USD / 50).quantize(Decimal(1)) * 50
+
+
+def salary_rows(seed: int, block: int, jobs: list[SyntheticJob]) -> Iterator[tuple]:
+    """MVR salaries for most jobs, plus a USD equivalent mostly in tourism."""
+    rng = _rng(seed, "salary_rows", block)
+    for job in jobs:
+        sector = SECTORS[job.employer.sector]
+        if rng.random() < 0.1:
+            continue
+        low, high = sector["mvr_salary"]
+        amount_min = Decimal(rng.randrange(low, high, 500))
+        # Some ranges are open-ended ("from MVR 15,000")
+        amount_max = None if rng.random() < 0.08 else amount_min + rng.randrange(2_000, 20_000, 500)
+        created_at = _to_datetime(job.created_ms)
+        yield (uuid7_at(job.created_ms, rng), job.id, "MVR", amount_min, amount_max, created_at, created_at)
+        if rng.random() < sector["usd_share"]:
+            yield (
+                uuid7_at(job.created_ms, rng),
+                job.id,
+                "USD",
+                _to_usd(amount_min),
+                None if amount_max is None else _to_usd(amount_max),
+                created_at,
+                created_at,
+            )
+
+
+def job_category_rows(
+    seed: int, block: int, jobs: list[SyntheticJob], category_ids: dict[str, uuid.UUID]
+) -> Iterator[tuple]:
+    rng = _rng(seed, "job_category_rows", block)
+    for job in jobs:
+        names = rng.sample(SECTORS[job.employer.sector]["categories"], k=rng.randint(1, 2))
+        if rng.random() < 0.15:
+            names.append(rng.choice(GENERAL_CATEGORIES))
+        for name in names:
+            yield (job.id, category_ids[name])
+
+
+def _recent_jobs(open_jobs: list[SyntheticJob]) -> float:
+    # Mean distance (in jobs) from the newest listing: about two weeks' worth
+    return max(1.0, len(open_jobs) * 14 / PERIOD_DAYS)
+
+
+def application_rows(
+    seed: int,
+    block: int,
+    count: int,
+    start_ms: int,
+    end_ms: int,
+    open_jobs: list[SyntheticJob],
+    open_job_created: list[int],
+) -> Iterator[tuple]:
+    """
+    `count` applications spread evenly over [start_ms, end_ms), in time order.
+
+    Each goes to one of the jobs created shortly before it, like real traffic
+    that favours recent listings.
+    """
+    rng = _rng(seed, "application_rows", block)
+    recent_jobs = _recent_jobs(open_jobs)
+    step = (end_ms - start_ms) / count
+    for i in range(count):
+        created_ms = int(start_ms + (i + rng.random()) * step)
+        newest = max(bisect.bisect_right(open_job_created, created_ms), 1) - 1
+        offset = int(rng.expovariate(1 / recent_jobs))
+        job = open_jobs[newest - offset if offset <= newest else rng.randint(0, newest)]
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        application_id = uuid7_at(created_ms, rng)
+        yield (
+            application_id,
+            job.employer.id,
+            job.id,
+            f"{first} {last}",
+            f"{first}.{last}{rng.randrange(1, 1000)}@{rng.choice(EMAIL_DOMAINS)}".lower(),
+            f"https://files.jobs.mv/resumes/{application_id}.pdf" if rng.random() < 0.7 else None,
+            (
+                f"I am applying for the {job.title} position at {job.employer.company_name}. "
+                f"I have {rng.randint(1, 15)} years of relevant experience."
+            ) if rng.random() < 0.6 else None,
+            rng.choices(APPLICATION_STATUSES, weights=APPLICATION_STATUS_WEIGHTS)[0],
+            rng.choice(NOTES) if rng.random() < 0.2 else None,
+            _to_datetime(created_ms),
+            _to_datetime(min(created_ms + rng.randrange(0, 7 * 86_400_000), PERIOD_END_MS)),
+        )
+
+
+async def _ensure_categories(conn: asyncpg.Connection, seed: int) -> dict[str, uuid.UUID]:
+    rng = _rng(seed, "categories")
+    await conn.executemany(
+        "INSERT INTO categories (id, name, description) VALUES ($1, $2, $3) ON CONFLICT (name) DO NOTHING",
+        [(uuid7_at(PERIOD_START_MS, rng), c["name"], c["description"]) for c in categories_data],
+    )
+    return {row["name"]: row["id"] for row in await conn.fetch("SELECT id, name FROM categories")}
+
+
+async def generate(scale: int, seed: int = 1, workers: int = 4) -> None:
+    """Load scale * (20 employers, 500 jobs, 20,000 applications) with their related rows."""
+    employer_count = EMPLOYERS_PER_SCALE * scale
+    job_count = JOBS_PER_SCALE * scale
+    application_count = APPLICATIONS_PER_SCALE * scale
+    print(
+        f"Generating synthetic data: scale {scale}, seed {seed}, {workers} workers "
+        f"({employer_count:,} employers, {job_count:,} jobs, {application_count:,} applications)"
+    )
+
+    employers = plan_employers(seed, employer_count)
+    jobs = plan_jobs(seed, job_count, employers)
+    job_blocks = [
+        (block, jobs[start:start + JOB_BLOCK_ROWS])
+        for block, start in enumerate(range(0, len(jobs), JOB_BLOCK_ROWS))
+    ]
+    open_jobs = [job for job in jobs if job.status != "draft"]
+    open_job_created = [job.created_ms for job in open_jobs]
+
+    dsn = settings.DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://", 1)
+    pool = await asyncpg.create_pool(dsn, min_size=1, max_size=workers + 2)
+    progress = Progress()
+    reporter = asyncio.create_task(progress.report())
+    try:
+        async with pool.acquire() as conn:
+            first_email = next(employer_rows(seed, employers[:1], ""))[2]
+            if await conn.fetchval("SELECT 1 FROM employers WHERE email = $1", first_email):
+                raise SystemExit(f"Synthetic data for seed {seed} is already loaded")
+            category_ids = await _ensure_categories(conn, seed)
+
+        # One shared hash: every synthetic employer's password is "demo123"
+        password_hash = get_password_hash("demo123")
+
+        # Parents first: each COPY commits on its own, and children reference them
+        progress.track("employers", employer_count)
+        await _copy(
+            pool, "employers", EMPLOYER_COLUMNS,
+            [lambda: employer_rows(seed, employers, password_hash)], progress,
+        )
+
+        progress.track("jobs", job_count)
+        await asyncio.gather(*_parallel_copies(
+            pool, "jobs", JOB_COLUMNS,
+            [lambda b=b, js=js: job_rows(seed, b, js) for b, js in job_blocks],
+            progress, workers,
+        ))
+
+        progress.track("job_salaries")
+        progress.track("job_categories")
+        progress.track("applications", application_count)
+        application_blocks = []
+        if open_jobs:
+            # Start once a couple of weeks' worth of jobs exist to apply to
+            start_ms = open_job_created[min(int(_recent_jobs(open_jobs)), len(open_jobs) - 1)]
+            block_count = -(-application_count // APPLICATION_BLOCK_ROWS)
+            span = (PERIOD_END_MS - start_ms) / block_count
+            for block in range(block_count):
+                count = min(APPLICATION_BLOCK_ROWS, application_count - block * APPLICATION_BLOCK_ROWS)
+                application_blocks.append(
+                    lambda b=block, n=count: application_rows(
+                        seed, b, n, int(start_ms + b * span), int(start_ms + (b + 1) * span),
+                        open_jobs, open_job_created,
+                    )
+                )
+        await asyncio.gather(
+            _copy(
+                pool, "job_salaries", SALARY_COLUMNS,
+                [lambda b=b, js=js: salary_rows(seed, b, js) for b, js in job_blocks], progress,
+            ),
+            _copy(
+                pool, "job_categories", JOB_CATEGORY_COLUMNS,
+                [lambda b=b, js=js: job_category_rows(seed, b, js, category_ids) for b, js in job_blocks],
+                progress,
+            ),
+            *_parallel_copies(pool, "applications", APPLICATION_COLUMNS, application_blocks, progress, workers),
+        )
+        reporter.cancel()
+        progress.print()
+
+        print("Rebuilding published job cards...")
+        async with AsyncSessionLocal() as db:
+            cards = await rebuild_job_cards(db)
+            await db.commit()
+        await bump_public_jobs_generation()
+
+        print("Analyzing tables...")
+        async with pool.acquire() as conn:
+            await conn.execute(
+                "ANALYZE employers, jobs, job_salaries, job_categories, applications, published_job_cards"
+            )
+    finally:
+        reporter.cancel()
+        await pool.close()
+
+    elapsed = time.perf_counter() - progress.started_at
+    print(f"\nSynthetic data loaded in {elapsed:.1f}s:")
+    for table, done in progress.done.items():
+        print(f"- {done:,} {table}")
+    print(f"- {cards:,} published job cards")
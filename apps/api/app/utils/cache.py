@@ -0,0 +1,118 @@
+import asyncio
+import hashlib
+import json
+from typing import Any, Optional
+import structlog
+
+from app.core.config import settings
+from app.core.metrics import PUBLIC_JOBS_CACHE_REQUESTS
+from app.utils.idempotency import get_redis
+
+logger = structlog.get_logger(__name__)
+
+# Every cached public listing page is keyed under the current generation. Changing a
+# published job bumps the generation, so all earlier pages become unreachable at once
+# and expire via their TTL.
+PUBLIC_JOBS_GENERATION_KEY = "public_jobs:generation"
+
+
+def normalize_query_params(params: dict[str, Any]) -> dict[str, Any]:
+    """Normalize listing query parameters so equivalent requests share a cache entry."""
+    normalized = {}
+    for name, value in params.items():
+        if value is None:
+            continue
+        if isinstance(value, str):
+            value = " ".join(value.split())
+            if not value:
+                continue
+        if isinstance(value, float):
+            value = repr(value)
+        normalized[name] = value
+    return normalized
+
+
+def public_jobs_cache_key(generation: int, params: dict[str, Any]) -> str:
+    """Build the cache key for a listing page from its generation and normalized query."""
+    digest = hashlib.sha256(
+        json.dumps(normalize_query_params(params), sort_keys=True).encode()
+    ).hexdigest()
+    return f"public_jobs:v{generation}:{digest}"
+
+
+async def get_public_jobs_generation() -> int:
+    """Return the current public listing generation (0 if never bumped)."""
+    r = await get_redis()
+    generation = await r.get(PUBLIC_JOBS_GENERATION_KEY)
+    return int(generation) if generation else 0
+
+
+async def _incr_public_jobs_generation() -> None:
+    try:
+        r = await get_redis()
+        await r.incr(PUBLIC_JOBS_GENERATION_KEY)
+    except Exception as e:
+        logger.error("Failed to bump public jobs cache generation", error=str(e))
+
+
+async def _bump_after_replica_lag() -> None:
+    await asyncio.sleep(
+        settings.DB_REPLICA_MAX_LAG_SECONDS + settings.DB_REPLICA_HEALTH_CHECK_SECONDS
+    )
+    await _incr_public_jobs_generation()
+
+
+_pending_bumps: set[asyncio.Task] = set()
+
+
+async def bump_public_jobs_generation() -> None:
+    """Invalidate all cached public listing pages."""
+    await _incr_public_jobs_generation()
+    if settings.DATABASE_REPLICA_URLS:
+        # Pages read from a lagging replica right after the change could be cached
+        # under the new generation; bump again once replicas have caught up
+        task = asyncio.create_task(_bump_after_replica_lag())
+        _pending_bumps.add(task)
+        task.add_done_callback(_pending_bumps.discard)
+
+
+async def get_public_jobs_page_key(params: dict[str, Any]) -> Optional[str]:
+    """
+    Return the cache key for a listing page under the current generation.
+
+    The key doubles as the page's validator for ETags. Returns None if Redis is
+    unavailable.
+    """
+    try:
+        return public_jobs_cache_key(await get_public_jobs_generation(), params)
+    except Exception as e:
+        logger.error("Public jobs generation lookup failed", error=str(e))
+        return None
+
+
+async def get_cached_public_jobs_page(key: str) -> Optional[str]:
+    """Look up a cached listing page by key."""
+    if not settings.PUBLIC_JOBS_CACHE_ENABLED:
+        return None
+
+    try:
+        r = await get_redis()
+        body = await r.get(key)
+    except Exception as e:
+        logger.error("Public jobs cache lookup failed", error=str(e))
+        return None
+
+    PUBLIC_JOBS_CACHE_REQUESTS.labels(result="hit" if body is not None else "miss").inc()
+    return body
+
+
+async def store_public_jobs_page(key: str, body: str) -> None:
+    """Store a serialized listing page under its cache key."""
+    if not settings.PUBLIC_JOBS_CACHE_ENABLED:
+        return
+
+    try:
+        r = await get_redis()
+        await r.setex(key, settings.PUBLIC_JOBS_CACHE_TTL_SECONDS, body)
+    except Exception as e:
+        logger.error("Failed to store public jobs page", error=str(e))
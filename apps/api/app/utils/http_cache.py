@@ -0,0 +1,39 @@
+import hashlib
+from typing import Any
+from fastapi import Request, Response, status
+
+from app.core.config import settings
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a strong ETag from the values that identify a representation."""
+    digest = hashlib.sha256("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match header matches `etag`."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so ignore any W/ prefix
+    candidates = {value.strip().removeprefix("W/") for value in header.split(",")}
+    return etag in candidates
+
+
+def public_cache_headers(etag: str) -> dict[str, str]:
+    """ETag and Cache-Control headers for public, CDN-cacheable responses."""
+    return {
+        "ETag": etag,
+        "Cache-Control": (
+            f"public, max-age={settings.PUBLIC_CACHE_MAX_AGE_SECONDS}, "
+            f"stale-while-revalidate={settings.PUBLIC_CACHE_STALE_WHILE_REVALIDATE_SECONDS}"
+        ),
+    }
+
+
+def not_modified(etag: str) -> Response:
+    """Return a 304 Not Modified response carrying the current cache headers."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=public_cache_headers(etag))
@@ -1,7 +1,14 @@
+import asyncio
+import base64
 import hashlib
 import json
-from typing import Optional
+import secrets
+import time
+import zlib
+from typing import NamedTuple, Optional
 import redis.asyncio as redis
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse, Response
 import structlog
 
 from app.core.config import settings
@@ -10,6 +17,18 @@ logger = structlog.get_logger(__name__)
 
 redis_client: Optional[redis.Redis] = None
 
+IDEMPOTENCY_KEY_HEADER = "idempotency-key"
+IDEMPOTENCY_KEY_MAX_LENGTH = 255
+# Bodies larger than this are stored zlib-compressed
+_COMPRESS_THRESHOLD = 1024
+# Only delete a lock we still own
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
 
 async def get_redis() -> redis.Redis:
     """Get Redis client instance."""
@@ -19,25 +38,230 @@ async def get_redis() -> redis.Redis:
     return redis_client
 
 
-async def check_idempotency_key(
-    key: str, employer_id: str
-) -> Optional[tuple[int, dict]]:
+class StoredResponse(NamedTuple):
+    fingerprint: str
+    status_code: int
+    media_type: Optional[str]
+    body: bytes
+
+
+def _cache_key(key: str, owner: str) -> str:
+    return f"idempotency:{owner}:{key}"
+
+
+async def check_idempotency_key(key: str, owner: str) -> Optional[StoredResponse]:
     """Check if idempotency key exists and return cached response."""
     r = await get_redis()
-    cache_key = f"idempotency:{employer_id}:{key}"
-    cached = await r.get(cache_key)
-    if cached:
-        data = json.loads(cached)
-        return data.get("status_code"), data.get("response")
-    return None
+    cached = await r.get(_cache_key(key, owner))
+    if not cached:
+        return None
+    data = json.loads(cached)
+    if "z" in data:
+        body = zlib.decompress(base64.b64decode(data["z"]))
+    else:
+        body = data["b"].encode("utf-8")
+    return StoredResponse(data["f"], data["s"], data.get("t"), body)
 
 
 async def store_idempotency_key(
-    key: str, employer_id: str, status_code: int, response: dict, ttl: int = 3600
+    key: str, owner: str, response: StoredResponse, ttl: Optional[int] = None
 ) -> None:
     """Store idempotency key with response."""
+    data = {"f": response.fingerprint, "s": response.status_code}
+    if response.media_type:
+        data["t"] = response.media_type
+    if len(response.body) <= _COMPRESS_THRESHOLD:
+        try:
+            data["b"] = response.body.decode("utf-8")
+        except UnicodeDecodeError:
+            pass
+    if "b" not in data:
+        data["z"] = base64.b64encode(zlib.compress(response.body)).decode("ascii")
+
     r = await get_redis()
-    cache_key = f"idempotency:{employer_id}:{key}"
-    data = json.dumps({"status_code": status_code, "response": response})
-    await r.setex(cache_key, ttl, data)
+    await r.setex(
+        _cache_key(key, owner),
+        ttl or settings.IDEMPOTENCY_TTL_SECONDS,
+        json.dumps(data, separators=(",", ":")),
+    )
+
+
+async def _body_too_large(scope, receive, send) -> None:
+    response = JSONResponse(
+        {"detail": "Request body too large for an Idempotency-Key request"}, status_code=413
+    )
+    await response(scope, receive, send)
+
+
+def _replay(stored: StoredResponse) -> Response:
+    response = Response(
+        content=stored.body, status_code=stored.status_code, media_type=stored.media_type
+    )
+    response.headers["Idempotent-Replayed"] = "true"
+    return response
+
+
+class IdempotencyMiddleware:
+    """
+    Makes write routes safe to retry with an Idempotency-Key header.
+
+    Applies to IDEMPOTENCY_ROUTES. The first request with a key runs normally and
+    its response is stored for IDEMPOTENCY_TTL_SECONDS; later requests with the
+    same key and an identical request (method, path, query and body fingerprint)
+    get the stored status and body replayed. A short Redis lock makes concurrent
+    duplicates wait for the first result instead of executing. Keys are scoped to
+    the caller's credentials, or to the client IP for anonymous routes. Keyed
+    requests with bodies over IDEMPOTENCY_MAX_BODY_BYTES are rejected with 413.
+    """
+
+    def __init__(self, app, routes: Optional[list[str]] = None) -> None:
+        # Local import: rate_limit imports get_redis from this module
+        from app.utils.rate_limit import compile_path_template
+
+        self.app = app
+        self.routes = []
+        for route in settings.IDEMPOTENCY_ROUTES if routes is None else routes:
+            method, _, path = route.partition(" ")
+            self.routes.append((method.upper(), compile_path_template(path)))
+
+    def _applies(self, scope) -> bool:
+        return any(
+            scope["method"] == method and pattern.match(scope["path"])
+            for method, pattern in self.routes
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._applies(scope):
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        key = headers.get(IDEMPOTENCY_KEY_HEADER)
+        if key is None:
+            await self.app(scope, receive, send)
+            return
+        if not key or len(key) > IDEMPOTENCY_KEY_MAX_LENGTH:
+            response = JSONResponse({"detail": "Invalid Idempotency-Key header"}, status_code=400)
+            await response(scope, receive, send)
+            return
+
+        # Read the whole body to fingerprint it, then hand it on to the app. It is held
+        # in memory, so bodies over IDEMPOTENCY_MAX_BODY_BYTES are rejected up front.
+        max_body = settings.IDEMPOTENCY_MAX_BODY_BYTES
+        content_length = headers.get("content-length", "")
+        if content_length.isdigit() and int(content_length) > max_body:
+            await _body_too_large(scope, receive, send)
+            return
+        parts = []
+        size = 0
+        more_body = True
+        while more_body:
+            message = await receive()
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > max_body:
+                await _body_too_large(scope, receive, send)
+                return
+            parts.append(chunk)
+            more_body = message.get("more_body", False)
+        body = b"".join(parts)
+
+        body_sent = False
+
+        async def replay_receive():
+            nonlocal body_sent
+            if body_sent:
+                # Body already delivered: pass through (e.g. http.disconnect)
+                return await receive()
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        fingerprint = hashlib.sha256(
+            b"\n".join([
+                scope["method"].encode(),
+                scope["path"].encode(),
+                scope.get("query_string", b""),
+                body,
+            ])
+        ).hexdigest()
+        authorization = headers.get("authorization")
+        if authorization:
+            owner = hashlib.sha256(authorization.encode()).hexdigest()[:32]
+        else:
+            owner = scope["client"][0] if scope.get("client") else "unknown"
+
+        try:
+            response = await self._stored_or_lock(key, owner, fingerprint)
+        except Exception as e:
+            # Fail open - run the request without idempotency if Redis is unavailable
+            logger.error("Idempotency check failed", error=str(e))
+            await self.app(scope, replay_receive, send)
+            return
+
+        if isinstance(response, Response):
+            await response(scope, receive, send)
+            return
+
+        lock_token = response
+        status_code = 500
+        media_type = None
+        chunks = []
+
+        async def capture_send(message):
+            nonlocal status_code, media_type
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                media_type = Headers(raw=message["headers"]).get("content-type")
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, replay_receive, capture_send)
+            # Server errors and conflicts are worth retrying, so they aren't stored
+            if status_code < 500 and status_code not in (409, 429):
+                try:
+                    stored = StoredResponse(fingerprint, status_code, media_type, b"".join(chunks))
+                    await store_idempotency_key(key, owner, stored)
+                except Exception as e:
+                    logger.error("Failed to store idempotent response", error=str(e))
+        finally:
+            await self._release_lock(key, owner, lock_token)
+
+    async def _stored_or_lock(self, key: str, owner: str, fingerprint: str):
+        """Return a Response to send (replay or conflict), or the lock token if we run."""
+        r = await get_redis()
+        lock_key = f"{_cache_key(key, owner)}:lock"
+        lock_token = secrets.token_hex(8)
+        deadline = time.monotonic() + settings.IDEMPOTENCY_LOCK_WAIT_SECONDS
+
+        while True:
+            stored = await check_idempotency_key(key, owner)
+            if stored is not None:
+                if stored.fingerprint != fingerprint:
+                    return JSONResponse(
+                        {"detail": "Idempotency-Key was used for a different request"},
+                        status_code=422,
+                    )
+                return _replay(stored)
+
+            if await r.set(
+                lock_key, lock_token, nx=True, px=settings.IDEMPOTENCY_LOCK_TTL_SECONDS * 1000
+            ):
+                return lock_token
+
+            # A duplicate is in flight: wait for its result
+            if time.monotonic() >= deadline:
+                return JSONResponse(
+                    {"detail": "A request with this Idempotency-Key is still in progress"},
+                    status_code=409,
+                    headers={"Retry-After": "1"},
+                )
+            await asyncio.sleep(0.05)
 
+    async def _release_lock(self, key: str, owner: str, lock_token: str) -> None:
+        try:
+            r = await get_redis()
+            await r.eval(_RELEASE_LOCK_SCRIPT, 1, f"{_cache_key(key, owner)}:lock", lock_token)
+        except Exception as e:
+            logger.error("Failed to release idempotency lock", error=str(e))
@@ -1,63 +1,142 @@
 import base64
+import hashlib
+import hmac
 import json
+from datetime import datetime
 from typing import Optional, Any
-from sqlalchemy import Select
+from sqlalchemy import Select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.elements import ColumnElement
 import uuid
 import structlog
 
+from app.core.config import settings
+
 logger = structlog.get_logger(__name__)
 
+# Cursors are "<payload>.<signature>": a compact base64url JSON payload holding the
+# sort key tuple of the boundary row and a truncated HMAC so clients can't forge seeks.
+_CURSOR_SIGNATURE_BYTES = 12
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _b64decode(value: str) -> bytes:
+    # Add padding if needed
+    padding = 4 - len(value) % 4
+    if padding != 4:
+        value += "=" * padding
+    return base64.urlsafe_b64decode(value.encode())
+
+
+def _sign(payload: str) -> str:
+    digest = hmac.new(
+        settings.SECRET_KEY.encode("utf-8"), payload.encode("utf-8"), hashlib.sha256
+    ).digest()
+    return _b64encode(digest[:_CURSOR_SIGNATURE_BYTES])
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
 
 def encode_cursor(data: dict[str, Any]) -> str:
-    """Encode cursor data to base64url string."""
-    json_str = json.dumps(data, sort_keys=True)
-    encoded = base64.urlsafe_b64encode(json_str.encode()).decode()
-    return encoded.rstrip("=")
+    """Encode cursor data to a signed base64url string."""
+    json_str = json.dumps(data, sort_keys=True, separators=(",", ":"), default=_json_default)
+    payload = _b64encode(json_str.encode())
+    return f"{payload}.{_sign(payload)}"
 
 
 def decode_cursor(cursor: str) -> Optional[dict[str, Any]]:
-    """Decode cursor from base64url string."""
+    """Decode and verify a cursor produced by encode_cursor."""
     try:
-        # Add padding if needed
-        padding = 4 - len(cursor) % 4
-        if padding != 4:
-            cursor += "=" * padding
-        decoded = base64.urlsafe_b64decode(cursor.encode())
-        return json.loads(decoded.decode())
+        payload, _, signature = cursor.partition(".")
+        if not hmac.compare_digest(signature, _sign(payload)):
+            logger.warning("Cursor signature mismatch")
+            return None
+        return json.loads(_b64decode(payload).decode())
     except Exception as e:
         logger.warning("Failed to decode cursor", error=str(e))
         return None
 
 
+def _coerce_key(value: Any, column: ColumnElement) -> Any:
+    """Convert a JSON-decoded cursor value back to the column's Python type."""
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is uuid.UUID:
+        return uuid.UUID(value)
+    return value
+
+
+def _make_cursor(sort_value: Any, id_value: Any, backward: bool) -> str:
+    data: dict[str, Any] = {"k": [sort_value, id_value]}
+    if backward:
+        data["b"] = 1
+    return encode_cursor(data)
+
+
 def apply_cursor_pagination(
     query: Select,
     cursor: Optional[str] = None,
-    id_field: Optional[InstrumentedAttribute] = None,
-) -> Select:
+    sort_field: Optional[ColumnElement] = None,
+    id_field: Optional[ColumnElement] = None,
+    sort_order: str = "desc",
+) -> tuple[Select, Optional[str]]:
     """
-    Apply cursor pagination filter to a query.
-    
+    Apply keyset ordering and the cursor seek predicate to a query.
+
+    Rows are ordered by (sort_field, id_field) in `sort_order`, and the cursor's
+    key tuple is compared with a row-value comparison so the seek can use a
+    composite (sort_field, id) index.
+
     Args:
-        query: SQLAlchemy select query
+        query: SQLAlchemy select query (without ordering)
         cursor: Optional cursor string from previous request
-        id_field: Field to use for cursor comparison (must be provided)
-    
+        sort_field: Column or expression the results are ordered by
+        id_field: Unique tie-breaker column (must be provided)
+        sort_order: "asc" or "desc"
+
     Returns:
-        Modified query with cursor filter applied
+        Tuple of (modified query, seek direction: None, "forward" or "backward")
     """
-    if cursor and id_field:
+    sort_field = sort_field if sort_field is not None else id_field
+    descending = sort_order == "desc"
+    backward = False
+    seek = None
+
+    if cursor:
         cursor_data = decode_cursor(cursor)
-        if cursor_data and "last_id" in cursor_data:
+        if cursor_data and "k" in cursor_data:
             try:
-                last_id = uuid.UUID(cursor_data["last_id"])
-                query = query.where(id_field > last_id)
+                sort_value, id_value = cursor_data["k"]
+                key = tuple_(_coerce_key(sort_value, sort_field), _coerce_key(id_value, id_field))
+                backward = bool(cursor_data.get("b"))
+                # Forward pages continue past the key in ORDER BY direction; backward
+                # pages walk the other way and are reversed after fetching.
+                if descending != backward:
+                    query = query.where(tuple_(sort_field, id_field) < key)
+                else:
+                    query = query.where(tuple_(sort_field, id_field) > key)
+                seek = "backward" if backward else "forward"
             except (ValueError, TypeError) as e:
                 logger.warning("Invalid cursor format", error=str(e))
                 # Continue without cursor filter
-    
-    return query
+
+    if descending != backward:
+        query = query.order_by(sort_field.desc(), id_field.desc())
+    else:
+        query = query.order_by(sort_field.asc(), id_field.asc())
+
+    return query, seek
 
 
 async def get_cursor_paginated_results(
@@ -65,43 +144,56 @@ async def get_cursor_paginated_results(
     query: Select,
     cursor: Optional[str] = None,
     page_size: int = 20,
-    id_field: Optional[InstrumentedAttribute] = None,
-) -> tuple[list[Any], Optional[str]]:
+    id_field: Optional[ColumnElement] = None,
+    sort_field: Optional[ColumnElement] = None,
+    sort_order: str = "desc",
+) -> tuple[list[Any], Optional[str], Optional[str]]:
     """
-    Execute a cursor-paginated query and return results with next cursor.
-    
+    Execute a keyset-paginated query and return results with next/previous cursors.
+
     Args:
         db: Database session
-        query: SQLAlchemy select query (should already have ordering applied)
+        query: SQLAlchemy select query (ordering is applied here)
         cursor: Optional cursor string from previous request
         page_size: Number of items per page (default: 20)
-        id_field: Field to use for cursor comparison (must be provided)
-    
+        id_field: Unique tie-breaker column (must be provided)
+        sort_field: Column or expression to order by (defaults to id_field)
+        sort_order: "asc" or "desc" (default: "desc")
+
     Returns:
-        Tuple of (items, next_cursor)
+        Tuple of (items, next_cursor, prev_cursor)
     """
-    # Apply cursor filter
-    if cursor and id_field:
-        query = apply_cursor_pagination(query, cursor, id_field)
-    
-    # Fetch one extra to check if there are more results
-    query = query.limit(page_size + 1)
-    
+    sort_field = sort_field if sort_field is not None else id_field
+    query, seek = apply_cursor_pagination(query, cursor, sort_field, id_field, sort_order)
+    backward = seek == "backward"
+
+    # Select the sort key alongside each entity so cursors can be built for any
+    # sort expression, then fetch one extra row to check if there are more results
+    query = query.add_columns(sort_field.label("cursor_sort_key")).limit(page_size + 1)
+
     result = await db.execute(query)
-    items = result.scalars().all()
-    
-    # Check if there are more results
-    has_more = len(items) > page_size
-    items = items[:page_size]
-    
-    # Generate next cursor
+    rows = result.all()
+
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    if backward:
+        rows.reverse()
+
+    items = [row[0] for row in rows]
     next_cursor = None
-    if has_more and items:
-        # Use the last item's id for the cursor
-        last_item = items[-1]
-        last_id = getattr(last_item, "id", None)
-        if last_id:
-            next_cursor = encode_cursor({"last_id": str(last_id)})
-    
-    return items, next_cursor
+    prev_cursor = None
+
+    if rows:
+        first, last = rows[0], rows[-1]
+        id_key = id_field.key
+        # A backward page was reached from a later page, so a next page always exists
+        if has_more or backward:
+            next_cursor = _make_cursor(
+                last.cursor_sort_key, getattr(last[0], id_key), backward=False
+            )
+        if (backward and has_more) or seek == "forward":
+            prev_cursor = _make_cursor(
+                first.cursor_sort_key, getattr(first[0], id_key), backward=True
+            )
 
+    return items, next_cursor, prev_cursor
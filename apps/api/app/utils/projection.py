@@ -0,0 +1,59 @@
+from functools import lru_cache
+from typing import Optional
+from fastapi import HTTPException, status
+from pydantic import BaseModel, create_model
+
+
+@lru_cache(maxsize=256)
+def projection_model(model: type[BaseModel], fields: frozenset[str]) -> type[BaseModel]:
+    """Response model with only `fields` of `model`, in the model's field order."""
+    return create_model(
+        f"{model.__name__}Projection",
+        __config__=model.model_config,
+        **{
+            name: (info.annotation, info)
+            for name, info in model.model_fields.items()
+            if name in fields
+        },
+    )
+
+
+def normalize_fields(fields: Optional[str]) -> Optional[str]:
+    """Canonical form of a `fields` parameter (sorted, deduplicated), e.g. for cache keys."""
+    if not fields:
+        return None
+    return ",".join(sorted({name.strip() for name in fields.split(",")} - {""}))
+
+
+def resolve_projection(
+    view: Optional[str],
+    fields: Optional[str],
+    full_model: type[BaseModel],
+    summary_model: type[BaseModel],
+) -> Optional[type[BaseModel]]:
+    """
+    Resolve the `view` and `fields` query parameters to a response model.
+
+    Args:
+        view: "full" (default) or "summary"
+        fields: Optional comma-separated field names, selected from the view's model
+        full_model: Model of the full representation
+        summary_model: Model of the summary representation
+
+    Returns:
+        The response model to project onto, or None for the full representation
+    """
+    base = summary_model if view == "summary" else full_model
+    if not fields:
+        return None if base is full_model else base
+
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested - set(base.model_fields)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+        )
+    # Items are always identifiable
+    requested.add("id")
+    return projection_model(base, frozenset(requested))
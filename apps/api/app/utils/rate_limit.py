@@ -1,44 +1,250 @@
-from typing import Optional
-import redis.asyncio as redis
-import structlog
+from typing import NamedTuple, Optional
+from urllib.parse import parse_qs
+import math
+import re
 import time
+from starlette.datastructures import MutableHeaders
+from starlette.responses import JSONResponse
+import structlog
 
-from app.core.config import settings
+from app.core.config import settings, RateLimitPolicy
+from app.core.metrics import RATE_LIMIT_DECISIONS
 from app.utils.idempotency import get_redis
 
 logger = structlog.get_logger(__name__)
 
+# GCRA (generic cell rate algorithm): each key stores only its theoretical arrival
+# time (TAT) in milliseconds. A request costing `cost` is allowed if, after pushing
+# the TAT forward by cost * emission interval, it is at most `burst` intervals ahead
+# of now. Uses the Redis server clock, so every worker shares one time base.
+#
+# Several limits can be checked in one call: the request is allowed only if every
+# key allows it, and TATs are only updated in that case.
+#
+# KEYS = keys, ARGV = emission interval (ms), burst, cost for each key in turn
+# Returns {allowed (0/1), remaining, retry_after_ms} for each key, flattened
+GCRA_SCRIPT = """
+local time = redis.call("TIME")
+local now = tonumber(time[1]) * 1000 + tonumber(time[2]) / 1000
 
-async def check_rate_limit(
-    identifier: str, limit: int = 100, window_seconds: int = 60
-) -> tuple[bool, int]:
-    """
-    Check rate limit using sliding window log algorithm.
-    Returns (is_allowed, remaining_requests).
+local results = {}
+local new_tats = {}
+local all_allowed = true
+for i, key in ipairs(KEYS) do
+    local emission = tonumber(ARGV[i * 3 - 2])
+    local burst = tonumber(ARGV[i * 3 - 1])
+    local cost = tonumber(ARGV[i * 3])
+
+    local tat = tonumber(redis.call("GET", key)) or now
+    if tat < now then
+        tat = now
+    end
+
+    local new_tat = tat + emission * cost
+    local allow_at = new_tat - emission * burst
+    if allow_at > now then
+        all_allowed = false
+        table.insert(results, 0)
+        table.insert(results, 0)
+        table.insert(results, math.ceil(allow_at - now))
+    else
+        new_tats[i] = new_tat
+        table.insert(results, 1)
+        table.insert(results, math.floor((now - allow_at) / emission))
+        table.insert(results, 0)
+    end
+end
+
+if all_allowed then
+    for i, key in ipairs(KEYS) do
+        redis.call("SET", key, tostring(new_tats[i]), "PX", math.ceil(new_tats[i] - now))
+    end
+end
+return results
+"""
+
+
+class RateLimitResult(NamedTuple):
+    allowed: bool
+    remaining: int
+    retry_after: float  # seconds until the request would be allowed (0 if allowed)
+
+
+_gcra_script = None
+# identifier -> monotonic time until which it is known to be over the limit.
+# TATs only move forward, so a denial stays valid until its retry-after passes.
+_local_blocks: dict[str, float] = {}
+
+
+def _locally_blocked(identifier: str) -> float:
+    """Return the remaining local block for `identifier` in seconds (0 if none)."""
+    blocked_until = _local_blocks.get(identifier)
+    if blocked_until is None:
+        return 0.0
+    remaining = blocked_until - time.monotonic()
+    if remaining <= 0:
+        del _local_blocks[identifier]
+        return 0.0
+    return remaining
+
+
+def _block_locally(identifier: str, retry_after: float) -> None:
+    if len(_local_blocks) >= settings.RATE_LIMIT_LOCAL_BLOCKS_MAX:
+        # Drop expired blocks; if still full, forget the oldest ones
+        now = time.monotonic()
+        for key in [k for k, until in _local_blocks.items() if until <= now]:
+            del _local_blocks[key]
+        while len(_local_blocks) >= settings.RATE_LIMIT_LOCAL_BLOCKS_MAX:
+            del _local_blocks[next(iter(_local_blocks))]
+    _local_blocks[identifier] = time.monotonic() + retry_after
+
+
+async def rate_limit_many(
+    checks: list[tuple[str, int, int, int]],
+) -> list[RateLimitResult]:
     """
-    r = await get_redis()
-    key = f"rate_limit:{identifier}"
-    now = time.time()
-    window_start = now - window_seconds
+    Apply several GCRA limits to one request in a single atomic round trip.
 
-    try:
-        # Remove old entries (older than window_seconds ago)
-        await r.zremrangebyscore(key, "-inf", window_start)
+    Args:
+        checks: (identifier, limit, window_seconds, cost) for each limit
 
-        # Count current requests in the window
-        current = await r.zcard(key)
+    Returns:
+        One result per check. The request is allowed only if every result is;
+        when any limit denies it, no limit is charged.
+    """
+    global _gcra_script
 
-        if current >= limit:
-            return False, 0
+    if settings.RATE_LIMIT_LOCAL_PRECHECK:
+        # Identifiers denied recently are rejected in-process without calling Redis
+        blocked = [_locally_blocked(identifier) for identifier, _, _, _ in checks]
+        if any(blocked):
+            return [RateLimitResult(not blocked_for, 0, blocked_for) for blocked_for in blocked]
 
-        # Add current request with current timestamp as score
-        await r.zadd(key, {str(now): now})
-        await r.expire(key, window_seconds)
+    keys = []
+    args = []
+    for identifier, limit, window_seconds, cost in checks:
+        keys.append(f"rate_limit:{identifier}")
+        args.extend([window_seconds * 1000 / limit, limit, cost])
 
-        remaining = limit - current - 1
-        return True, remaining
+    try:
+        r = await get_redis()
+        if _gcra_script is None:
+            _gcra_script = r.register_script(GCRA_SCRIPT)
+        reply = await _gcra_script(keys=keys, args=args)
     except Exception as e:
-        logger.error("Rate limit check failed", error=str(e), identifier=identifier)
+        logger.error("Rate limit check failed", error=str(e), keys=keys)
         # Fail open - allow request if Redis is unavailable
-        return True, limit
+        return [RateLimitResult(True, limit, 0.0) for _, limit, _, _ in checks]
+
+    results = []
+    for (identifier, limit, window_seconds, cost), offset in zip(checks, range(0, len(reply), 3)):
+        allowed, remaining, retry_after_ms = reply[offset:offset + 3]
+        if allowed:
+            results.append(RateLimitResult(True, int(remaining), 0.0))
+            continue
+        if settings.RATE_LIMIT_LOCAL_PRECHECK:
+            # Only block locally for as long as even a single-cost request would be denied
+            single_retry_ms = retry_after_ms - window_seconds * 1000 / limit * (cost - 1)
+            if single_retry_ms > 0:
+                _block_locally(identifier, single_retry_ms / 1000)
+        results.append(RateLimitResult(False, 0, math.ceil(retry_after_ms) / 1000))
+    return results
+
+
+async def rate_limit(
+    identifier: str, limit: int = 100, window_seconds: int = 60, cost: int = 1
+) -> RateLimitResult:
+    """
+    Apply a GCRA rate limit of `limit` requests per `window_seconds`.
+
+    Runs as one atomic Lua script (a single round trip, O(1) memory per key).
+    """
+    results = await rate_limit_many([(identifier, limit, window_seconds, cost)])
+    return results[0]
+
+
+def compile_path_template(template: str) -> re.Pattern:
+    """Compile a path template like /jobs/{job_id} to an anchored regex."""
+    parts = re.split(r"(\{[^}]+\})", template)
+    pattern = "".join("[^/]+" if part.startswith("{") else re.escape(part) for part in parts)
+    return re.compile(f"^{pattern}/?$")
+
+
+class RateLimitMiddleware:
+    """
+    ASGI middleware applying the RATE_LIMIT_POLICIES table per client IP.
+
+    The first route policy matching the request's method and path applies, along
+    with every global ("*") policy; all of them are checked in one Redis round
+    trip. Throttled requests get 429 with Retry-After; allowed ones carry
+    X-RateLimit-Remaining.
+    """
+
+    def __init__(self, app, policies: Optional[dict[str, RateLimitPolicy]] = None) -> None:
+        self.app = app
+        policies = settings.RATE_LIMIT_POLICIES if policies is None else policies
+        self.global_policies = []
+        self.route_policies = []
+        for name, policy in policies.items():
+            methods = {method.upper() for method in policy.methods}
+            if policy.path == "*":
+                self.global_policies.append((name, policy, methods))
+            else:
+                self.route_policies.append((name, policy, methods, compile_path_template(policy.path)))
+
+    def _match(self, method: str, path: str) -> list[tuple[str, RateLimitPolicy]]:
+        matched = [
+            (name, policy)
+            for name, policy, methods in self.global_policies
+            if "*" in methods or method in methods
+        ]
+        for name, policy, methods, pattern in self.route_policies:
+            if ("*" in methods or method in methods) and pattern.match(path):
+                matched.append((name, policy))
+                break
+        return matched
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.RATE_LIMIT_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        policies = self._match(scope["method"], scope["path"])
+        if not policies:
+            await self.app(scope, receive, send)
+            return
+
+        client_ip = scope["client"][0] if scope.get("client") else "unknown"
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        checks = []
+        for name, policy in policies:
+            cost = 1 + sum(
+                extra for param, extra in policy.query_costs.items() if query.get(param)
+            )
+            checks.append((f"{name}:{client_ip}", policy.limit, policy.window_seconds, cost))
+
+        results = await rate_limit_many(checks)
+
+        for (name, policy), result in zip(policies, results):
+            if not result.allowed:
+                RATE_LIMIT_DECISIONS.labels(policy=name, decision="throttled").inc()
+                logger.info("Request throttled", policy=name, client_ip=client_ip)
+                response = JSONResponse(
+                    {"detail": policy.detail},
+                    status_code=429,
+                    headers={"Retry-After": str(max(1, math.ceil(result.retry_after)))},
+                )
+                await response(scope, receive, send)
+                return
+
+        for name, _ in policies:
+            RATE_LIMIT_DECISIONS.labels(policy=name, decision="allowed").inc()
+        remaining = str(min(result.remaining for result in results))
+
+        async def send_with_remaining(message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-RateLimit-Remaining"] = remaining
+            await send(message)
 
+        await self.app(scope, receive, send_with_remaining)
@@ -0,0 +1,19 @@
+import re
+from typing import Optional
+
+EXCERPT_LENGTH = 280
+
+_MARKDOWN_LINK = re.compile(r"!?\[([^\]]*)\]\([^)]*\)")
+_MARKDOWN_BLOCK_PREFIX = re.compile(r"^\s*(?:#{1,6}|[-*+]|\d+\.|>)\s+", re.MULTILINE)
+_MARKDOWN_EMPHASIS = re.compile(r"[*_`~]+")
+
+
+def make_excerpt(markdown: Optional[str], max_length: int = EXCERPT_LENGTH) -> str:
+    """Plain-text excerpt of a markdown body, cut at a word boundary."""
+    text = _MARKDOWN_LINK.sub(r"\1", markdown or "")
+    text = _MARKDOWN_BLOCK_PREFIX.sub("", text)
+    text = _MARKDOWN_EMPHASIS.sub("", text)
+    text = " ".join(text.split())
+    if len(text) <= max_length:
+        return text
+    return text[:max_length].rsplit(" ", 1)[0] + "…"
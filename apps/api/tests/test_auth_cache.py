@@ -0,0 +1,82 @@
+from contextlib import asynccontextmanager
+from datetime import datetime
+import inspect
+import uuid
+
+import fakeredis
+import pytest
+
+from app.core import auth_cache
+from app.core.auth_cache import get_employer_principal, invalidate_employer_principal
+from app.core.employer import get_current_employer
+from app.db.models import Employer
+from app.db.session import get_db
+
+
+class FakeResult:
+    def __init__(self, row):
+        self.row = row
+
+    def scalar_one_or_none(self):
+        return self.row
+
+
+class FakeSession:
+    def __init__(self, employer):
+        self.employer = employer
+        self.statements = 0
+
+    async def execute(self, statement):
+        self.statements += 1
+        return FakeResult(self.employer)
+
+
+@pytest.fixture
+def sessions(monkeypatch):
+    """Sessions opened by the principal lookup, with an in-memory Redis."""
+    opened = []
+    employer = Employer(
+        id=uuid.uuid4(), company_name="Atoll Dive Centre", email="hr@dive.mv",
+        password_hash="secret", contact_info=None, created_at=datetime(2026, 1, 1),
+    )
+
+    @asynccontextmanager
+    async def read_only_session():
+        session = FakeSession(employer)
+        opened.append(session)
+        yield session
+
+    redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+
+    async def get_redis():
+        return redis
+
+    monkeypatch.setattr(auth_cache, "read_only_session", read_only_session)
+    monkeypatch.setattr(auth_cache, "get_redis", get_redis)
+    auth_cache._employer_principals.clear()
+    yield employer, opened
+    auth_cache._employer_principals.clear()
+
+
+def test_current_employer_does_not_depend_on_a_read_write_session():
+    parameters = inspect.signature(get_current_employer).parameters.values()
+    assert all(getattr(p.default, "dependency", None) is not get_db for p in parameters)
+
+
+async def test_principal_miss_reads_through_a_read_only_session(sessions):
+    employer, opened = sessions
+
+    principal = await get_employer_principal(employer.id)
+    assert principal.id == employer.id
+    assert principal.password_hash is None
+    assert [session.statements for session in opened] == [1]
+
+    # Served from the in-process cache, then from Redis once that is dropped
+    await get_employer_principal(employer.id)
+    auth_cache._employer_principals.clear()
+    await get_employer_principal(employer.id)
+    assert len(opened) == 1
+
+    await invalidate_employer_principal(employer.id)
+    await get_employer_principal(employer.id)
+    assert len(opened) == 2
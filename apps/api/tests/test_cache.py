@@ -0,0 +1,126 @@
+from types import SimpleNamespace
+
+import fakeredis
+from fastapi import FastAPI
+import httpx
+import pytest
+
+from app.api.v1 import public
+from app.db.session import get_read_db
+from app.utils import cache as cache_module
+from app.utils.cache import (
+    bump_public_jobs_generation,
+    get_public_jobs_page_key,
+    normalize_query_params,
+    public_jobs_cache_key,
+)
+from app.utils.http_cache import make_etag
+
+
+class ListingSession:
+    """Read session whose listing query returns no rows; counts queries."""
+
+    def __init__(self):
+        self.queries = 0
+
+    async def execute(self, query):
+        self.queries += 1
+        return SimpleNamespace(all=lambda: [])
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+
+    async def get_redis():
+        return client
+
+    monkeypatch.setattr(cache_module, "get_redis", get_redis)
+    return client
+
+
+@pytest.fixture
+def redis_down(monkeypatch):
+    async def get_redis():
+        raise ConnectionError("redis down")
+
+    monkeypatch.setattr(cache_module, "get_redis", get_redis)
+
+
+@pytest.fixture
+def session():
+    return ListingSession()
+
+
+@pytest.fixture
+def client(session):
+    app = FastAPI()
+    app.include_router(public.router, prefix="/public")
+    app.dependency_overrides[get_read_db] = lambda: session
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+def test_equivalent_queries_share_a_key():
+    variants = [
+        {"q": "sous chef", "location": "male", "salary_min": 10000.0, "cursor": None},
+        {"cursor": None, "salary_min": 1e4, "location": "male", "q": "  sous   chef "},
+        {"q": "sous chef", "location": "male", "salary_min": 10000.0, "fields": ""},
+        {"q": "sous chef", "location": "male", "salary_min": 10000.0},
+    ]
+
+    assert len({public_jobs_cache_key(3, params) for params in variants}) == 1
+    normalized = {"q": "sous chef", "location": "male", "salary_min": "10000.0"}
+    assert normalize_query_params(variants[1]) == normalized
+
+
+def test_different_queries_or_generations_get_different_keys():
+    params = {"q": "sous chef", "sort_order": "desc"}
+
+    ascending = {**params, "sort_order": "asc"}
+    assert public_jobs_cache_key(3, params) != public_jobs_cache_key(3, ascending)
+    assert public_jobs_cache_key(3, params) != public_jobs_cache_key(4, params)
+
+
+async def test_bump_changes_every_key(redis):
+    queries = [{"q": "chef"}, {"location": "male", "view": "summary"}, {"view": "facets"}]
+    before = [await get_public_jobs_page_key(params) for params in queries]
+
+    await bump_public_jobs_generation()
+
+    after = [await get_public_jobs_page_key(params) for params in queries]
+    assert all(key.startswith("public_jobs:v0:") for key in before)
+    assert all(key.startswith("public_jobs:v1:") for key in after)
+    assert not set(before) & set(after)
+
+
+async def test_bump_survives_redis_failure(redis_down):
+    await bump_public_jobs_generation()
+
+
+async def test_redis_failure_returns_no_key(redis_down):
+    assert await get_public_jobs_page_key({"q": "chef"}) is None
+
+
+async def test_listing_is_served_uncached_when_redis_is_down(redis_down, session, client):
+    async with client:
+        first = await client.get("/public/jobs", params={"q": "chef"})
+        second = await client.get("/public/jobs", params={"q": "chef"})
+
+    assert (first.status_code, second.status_code) == (200, 200)
+    assert first.json() == {"items": [], "next_cursor": None, "prev_cursor": None}
+    # Both requests went to the database, with an ETag derived from the body
+    assert session.queries == 2
+    assert first.headers["ETag"] == make_etag(first.text)
+
+
+async def test_listing_is_served_from_the_cache_until_a_bump(redis, session, client):
+    async with client:
+        await client.get("/public/jobs", params={"q": "chef"})
+        cached = await client.get("/public/jobs", params={"q": " chef "})
+        assert session.queries == 1
+
+        await bump_public_jobs_generation()
+        await client.get("/public/jobs", params={"q": "chef"})
+
+    assert cached.status_code == 200
+    assert session.queries == 2
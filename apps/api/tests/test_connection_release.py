@@ -0,0 +1,71 @@
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+from fastapi import HTTPException
+from prometheus_client import REGISTRY
+import pytest
+from sqlalchemy.util import greenlet_spawn
+
+from app.api.v1 import auth
+from app.core import hashing
+from app.core.config import settings
+from app.core.hashing import run_in_hash_executor
+from app.core.security import get_password_hash
+from app.db.base import engine
+from app.db.models import Employer
+from app.db.pool import InstrumentedAsyncAdaptedQueuePool
+from app.schemas.auth import LoginRequest
+
+
+async def test_pool_records_how_long_connections_are_held():
+    pool = InstrumentedAsyncAdaptedQueuePool(MagicMock, pool_size=1, max_overflow=0)
+    pool.metrics_label = "hold_test"
+
+    connection = await greenlet_spawn(pool.connect)
+    await asyncio.sleep(0.05)
+    await greenlet_spawn(connection.close)
+
+    labels = {"pool": "hold_test"}
+    assert REGISTRY.get_sample_value("jobsmv_db_pool_connection_hold_seconds_count", labels) == 1
+    assert REGISTRY.get_sample_value("jobsmv_db_pool_connection_hold_seconds_sum", labels) >= 0.05
+
+
+async def test_saturated_hash_executor_rejects_with_429(monkeypatch):
+    monkeypatch.setattr(settings, "HASH_EXECUTOR_QUEUE_DEPTH", 1)
+    capacity = settings.HASH_EXECUTOR_WORKERS + 1
+    release = threading.Event()
+
+    def slow_hash() -> str:
+        release.wait(5)
+        return "hashed"
+
+    rejected_before = REGISTRY.get_sample_value("jobsmv_hash_rejected_total") or 0
+    running = [asyncio.create_task(run_in_hash_executor(slow_hash)) for _ in range(capacity)]
+    await asyncio.sleep(0)
+
+    with pytest.raises(HTTPException) as raised:
+        await run_in_hash_executor(slow_hash)
+    assert raised.value.status_code == 429
+    assert raised.value.headers == {"Retry-After": "1"}
+    assert REGISTRY.get_sample_value("jobsmv_hash_rejected_total") == rejected_before + 1
+
+    release.set()
+    assert await asyncio.gather(*running) == ["hashed"] * capacity
+    assert hashing._in_flight == 0
+
+
+async def test_login_returns_its_connection_before_hashing(db, monkeypatch):
+    db.add(Employer(company_name="Resort", email="hr@resort.mv", password_hash=get_password_hash("pw-123456")))
+    await db.commit()
+    checked_out_while_hashing = []
+
+    async def record_and_fail(fn, *args):
+        checked_out_while_hashing.append(engine.pool.checkedout())
+        return False
+
+    monkeypatch.setattr(auth, "run_in_hash_executor", record_and_fail)
+    with pytest.raises(HTTPException):
+        await auth.login(LoginRequest(email="hr@resort.mv", password="wrong-password"), db=db)
+
+    assert checked_out_while_hashing == [0]
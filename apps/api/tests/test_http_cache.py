@@ -0,0 +1,134 @@
+from datetime import datetime
+from types import SimpleNamespace
+import uuid
+
+import fakeredis
+from fastapi import FastAPI
+import httpx
+import pytest
+from starlette.requests import Request
+
+from app.api.v1 import public
+from app.core.config import settings
+from app.db.session import get_read_db
+from app.utils import cache as cache_module
+from app.utils.http_cache import etag_matches, make_etag, not_modified
+
+ETAG = make_etag("job", 1)
+CACHE_CONTROL = (
+    f"public, max-age={settings.PUBLIC_CACHE_MAX_AGE_SECONDS}, "
+    f"stale-while-revalidate={settings.PUBLIC_CACHE_STALE_WHILE_REVALIDATE_SECONDS}"
+)
+
+
+def _request(if_none_match=None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match is not None else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+class PublicSession:
+    """Read session returning a card timestamp for lookups and no listing rows."""
+
+    def __init__(self, refreshed_at=None):
+        self.refreshed_at = refreshed_at
+        self.queries = 0
+        self.cards_loaded = 0
+
+    async def execute(self, query):
+        self.queries += 1
+        return SimpleNamespace(all=lambda: [], scalar_one_or_none=lambda: self.refreshed_at)
+
+    async def get(self, model, key):
+        self.cards_loaded += 1
+        return None
+
+
+def _revalidate(client, path, etag, params=None):
+    return client.get(path, params=params, headers={"If-None-Match": etag})
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+
+    async def get_redis():
+        return client
+
+    monkeypatch.setattr(cache_module, "get_redis", get_redis)
+    return client
+
+
+@pytest.fixture
+def session():
+    return PublicSession(refreshed_at=datetime(2026, 1, 1, 12, 0))
+
+
+@pytest.fixture
+def client(session):
+    app = FastAPI()
+    app.include_router(public.router, prefix="/public")
+    app.dependency_overrides[get_read_db] = lambda: session
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.parametrize(
+    "header",
+    [ETAG, f"W/{ETAG}", "*", f'"other", {ETAG}', f'"other",W/{ETAG} , "third"'],
+)
+def test_matching_if_none_match(header):
+    assert etag_matches(_request(header), ETAG)
+
+
+@pytest.mark.parametrize("header", [None, "", '"other"', f'"other", W/"{ETAG}"', ETAG.strip('"')])
+def test_non_matching_if_none_match(header):
+    assert not etag_matches(_request(header), ETAG)
+
+
+def test_not_modified_carries_cache_headers():
+    response = not_modified(ETAG)
+
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["ETag"] == ETAG
+    assert response.headers["Cache-Control"] == CACHE_CONTROL
+
+
+async def test_listing_revalidation_returns_304(redis, session, client):
+    async with client:
+        first = await client.get("/public/jobs", params={"q": "chef"})
+        etag = first.headers["ETag"]
+        revalidated = await _revalidate(client, "/public/jobs", etag, {"q": "chef"})
+        stale = await _revalidate(client, "/public/jobs", '"old"', {"q": "chef"})
+
+    assert first.status_code == 200
+    assert first.headers["Cache-Control"] == CACHE_CONTROL
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["ETag"] == first.headers["ETag"]
+    assert revalidated.headers["Cache-Control"] == CACHE_CONTROL
+    # A non-matching ETag is served from the page cache, not the database
+    assert stale.status_code == 200
+    assert stale.json() == first.json()
+    assert session.queries == 1
+
+
+async def test_job_revalidation_returns_304_without_loading_the_card(session, client):
+    job_id = uuid.uuid4()
+    etag = make_etag(job_id, session.refreshed_at.isoformat())
+
+    async with client:
+        revalidated = await _revalidate(client, f"/public/jobs/{job_id}", f"W/{etag}")
+
+    assert revalidated.status_code == 304
+    assert revalidated.headers["ETag"] == etag
+    assert revalidated.headers["Cache-Control"] == CACHE_CONTROL
+    assert session.cards_loaded == 0
+
+
+async def test_job_with_a_stale_etag_loads_the_card(session, client):
+    async with client:
+        response = await _revalidate(client, f"/public/jobs/{uuid.uuid4()}", '"old"')
+
+    # The stub has no card to load, so the full read ends in a 404
+    assert response.status_code == 404
+    assert session.cards_loaded == 1
@@ -0,0 +1,188 @@
+import asyncio
+import json
+
+import fakeredis
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, PlainTextResponse
+from starlette.routing import Route
+
+from app.core.config import settings
+from app.utils import idempotency as idempotency_module
+from app.utils.idempotency import (
+    IdempotencyMiddleware,
+    StoredResponse,
+    check_idempotency_key,
+    store_idempotency_key,
+)
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+
+    async def get_redis():
+        return client
+
+    monkeypatch.setattr(idempotency_module, "get_redis", get_redis)
+    return client
+
+
+class Items:
+    """Endpoint counting executions; ?status= and ?size= shape the response."""
+
+    def __init__(self):
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def endpoint(self, request):
+        self.calls += 1
+        await self.release.wait()
+        status_code = int(request.query_params.get("status", 201))
+        size = int(request.query_params.get("size", 0))
+        if size:
+            return PlainTextResponse("x" * size, status_code=status_code)
+        body = await request.body()
+        return JSONResponse({"call": self.calls, "echo": body.decode()}, status_code=status_code)
+
+
+@pytest.fixture
+def items():
+    return Items()
+
+
+@pytest.fixture
+def client(items):
+    routes = [Route("/items", items.endpoint, methods=["POST"])]
+    app = IdempotencyMiddleware(Starlette(routes=routes), routes=["POST /items"])
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+def _post(client, key="key-1", body="{}", params=None):
+    return client.post("/items", content=body, params=params, headers={"Idempotency-Key": key})
+
+
+async def test_replays_the_stored_status_and_body(redis, items, client):
+    async with client:
+        first = await _post(client)
+        second = await _post(client)
+
+    assert items.calls == 1
+    assert (second.status_code, second.json()) == (201, first.json())
+    assert second.headers["Idempotent-Replayed"] == "true"
+    assert second.headers["content-type"] == "application/json"
+    assert "Idempotent-Replayed" not in first.headers
+
+
+async def test_same_key_for_a_different_request_is_422(redis, items, client):
+    async with client:
+        await _post(client, body='{"title": "Chef"}')
+        mismatch = await _post(client, body='{"title": "Waiter"}')
+
+    assert mismatch.status_code == 422
+    assert items.calls == 1
+
+
+async def test_concurrent_duplicate_waits_then_replays(redis, items, client):
+    items.release.clear()
+    async with client:
+        first = asyncio.create_task(_post(client))
+        await asyncio.sleep(0.05)
+        duplicate = asyncio.create_task(_post(client))
+        await asyncio.sleep(0.1)
+        # The duplicate is waiting on the lock, not running the endpoint
+        assert items.calls == 1
+        items.release.set()
+        first, duplicate = await first, await duplicate
+
+    assert items.calls == 1
+    assert duplicate.json() == first.json()
+    assert duplicate.headers["Idempotent-Replayed"] == "true"
+
+
+async def test_duplicate_gets_409_after_the_lock_wait(redis, items, client, monkeypatch):
+    monkeypatch.setattr(settings, "IDEMPOTENCY_LOCK_WAIT_SECONDS", 0)
+    items.release.clear()
+    async with client:
+        first = asyncio.create_task(_post(client))
+        await asyncio.sleep(0.05)
+        duplicate = await _post(client)
+        items.release.set()
+        await first
+
+    assert duplicate.status_code == 409
+    assert duplicate.headers["Retry-After"] == "1"
+    assert items.calls == 1
+
+
+@pytest.mark.parametrize("status_code", [500, 503, 409, 429])
+async def test_retryable_responses_are_not_stored(redis, items, client, status_code):
+    async with client:
+        first = await _post(client, params={"status": status_code})
+        retry = await _post(client, params={"status": status_code})
+
+    assert (first.status_code, retry.status_code) == (status_code, status_code)
+    assert items.calls == 2
+    assert "Idempotent-Replayed" not in retry.headers
+    # The lock was released after each attempt
+    assert await redis.keys("idempotency:*") == []
+
+
+async def test_large_response_round_trips_compressed(redis, items, client):
+    async with client:
+        first = await _post(client, params={"size": 5000})
+        second = await _post(client, params={"size": 5000})
+
+    assert items.calls == 1
+    assert second.text == first.text == "x" * 5000
+    assert second.headers["content-type"].startswith("text/plain")
+    (stored_key,) = await redis.keys("idempotency:*")
+    stored = json.loads(await redis.get(stored_key))
+    assert "z" in stored and "b" not in stored
+    assert len(await redis.get(stored_key)) < 1000
+
+
+async def test_binary_body_round_trips(redis):
+    response = StoredResponse("fp", 200, "application/octet-stream", b"\xff\x00\xfe")
+    await store_idempotency_key("k", "owner", response)
+
+    assert await check_idempotency_key("k", "owner") == response
+
+
+async def test_fails_open_when_redis_is_down(items, client, monkeypatch):
+    async def get_redis():
+        raise ConnectionError("redis down")
+
+    monkeypatch.setattr(idempotency_module, "get_redis", get_redis)
+    async with client:
+        first = await _post(client, body='{"a": 1}')
+        second = await _post(client, body='{"a": 1}')
+
+    assert (first.status_code, second.status_code) == (201, 201)
+    assert items.calls == 2
+    # The buffered body still reaches the endpoint
+    assert second.json()["echo"] == '{"a": 1}'
+
+
+async def test_oversized_body_is_rejected_with_413(redis, items, client, monkeypatch):
+    monkeypatch.setattr(settings, "IDEMPOTENCY_MAX_BODY_BYTES", 16)
+    async with client:
+        too_large = await _post(client, body="x" * 17)
+        within = await _post(client, key="key-2", body="x" * 16)
+        unkeyed = await client.post("/items", content="x" * 17)
+
+        async def chunks():
+            for _ in range(3):
+                yield b"x" * 8
+
+        # Streamed without a Content-Length: rejected once the limit is crossed
+        streamed = await _post(client, key="key-3", body=chunks())
+
+    assert too_large.status_code == 413
+    assert streamed.status_code == 413
+    assert within.status_code == 201
+    # Without an Idempotency-Key the body isn't buffered or limited here
+    assert unkeyed.status_code == 201
+    assert items.calls == 2
@@ -0,0 +1,63 @@
+import random
+import threading
+import uuid
+
+from app.db import ids
+from app.db.ids import uuid7, uuid7_at
+
+
+def test_layout_follows_rfc_9562():
+    value = uuid7()
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+
+
+def test_timestamp_is_the_current_unix_millisecond(monkeypatch):
+    monkeypatch.setattr(ids, "_last_ms", 0)
+    monkeypatch.setattr(ids.time, "time_ns", lambda: 1_700_000_000_123_456_789)
+
+    assert uuid7().int >> 80 == 1_700_000_000_123
+
+
+def test_ids_are_strictly_increasing_within_a_millisecond(monkeypatch):
+    monkeypatch.setattr(ids.time, "time_ns", lambda: 1_700_000_000_000_000_000)
+    monkeypatch.setattr(ids, "_last_ms", 0)
+
+    values = [uuid7() for _ in range(10_000)]
+    # More ids than the 12-bit counter holds: the timestamp moves ahead to stay monotonic
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+    assert values[-1].int >> 80 > values[0].int >> 80
+
+
+def test_ids_stay_increasing_when_the_clock_goes_backwards(monkeypatch):
+    monkeypatch.setattr(ids, "_last_ms", 0)
+    monkeypatch.setattr(ids.time, "time_ns", lambda: 1_700_000_001_000_000_000)
+    first = uuid7()
+    monkeypatch.setattr(ids.time, "time_ns", lambda: 1_700_000_000_000_000_000)
+
+    assert uuid7() > first
+
+
+def test_ids_are_unique_across_threads():
+    values = []
+
+    def generate():
+        values.extend(uuid7() for _ in range(2_000))
+
+    threads = [threading.Thread(target=generate) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(values)) == 8_000
+
+
+def test_uuid7_at_is_reproducible():
+    first = [uuid7_at(1_700_000_000_000, random.Random(42)) for _ in range(3)]
+    second = [uuid7_at(1_700_000_000_000, random.Random(42)) for _ in range(3)]
+
+    assert first == second
+    assert first[0].version == 7
+    assert first[0].int >> 80 == 1_700_000_000_000
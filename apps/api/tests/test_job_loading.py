@@ -0,0 +1,73 @@
+"""Job routes load a page's relationships in a fixed number of statements."""
+from contextlib import contextmanager
+
+from sqlalchemy import event, select
+
+from app.api.v1.jobs import list_jobs
+from app.db.base import engine
+from app.db.loaders import load_jobs
+from app.db.models import Category, Employer, Job, JobCategory, JobSalary
+
+
+@contextmanager
+def count_statements():
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+async def _employer_with_jobs(db, count: int) -> Employer:
+    employer = Employer(company_name="Island Resort", email="hr@resort.mv", password_hash="x")
+    categories = [Category(name="Hospitality"), Category(name="Food & Beverage")]
+    db.add_all([employer, *categories])
+    await db.flush()
+    for number in range(count):
+        job = Job(
+            employer_id=employer.id,
+            title=f"Job {number}",
+            description_md="Role description",
+            status="published",
+            salaries=[
+                JobSalary(currency="MVR", amount_min=10_000, amount_max=20_000),
+                JobSalary(currency="USD", amount_min=700, amount_max=1_300),
+            ],
+        )
+        db.add(job)
+        await db.flush()
+        db.add_all(JobCategory(job_id=job.id, category_id=category.id) for category in categories)
+    await db.commit()
+    db.expunge_all()
+    return employer
+
+
+async def test_list_jobs_page_uses_three_statements(db):
+    employer = await _employer_with_jobs(db, 25)
+
+    with count_statements() as statements:
+        page = await list_jobs(
+            cursor=None, q=None, location=None, status=None, view="full", fields=None,
+            employer=employer, db=db,
+        )
+
+    assert len(page.items) == 20
+    assert all(len(item.salaries) == 2 and len(item.categories) == 2 for item in page.items)
+    assert all(item.employer_company_name == "Island Resort" for item in page.items)
+    # Page (employer joined in), salaries (one IN query), categories (one IN query)
+    assert len(statements) == 3, statements
+
+
+async def test_load_jobs_statement_count_does_not_grow_with_jobs(db):
+    await _employer_with_jobs(db, 20)
+
+    with count_statements() as statements:
+        jobs = await load_jobs(db, select(Job))
+
+    assert len(jobs) == 20
+    assert len(statements) == 3, statements
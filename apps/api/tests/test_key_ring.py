@@ -0,0 +1,89 @@
+import os
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwt
+import pytest
+
+from app.core import keys
+from app.core.config import settings
+from app.core.keys import JWTKeyRing
+
+
+def _write_public_key(path) -> None:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    path.write_bytes(
+        private_key.public_key().public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+    )
+
+
+@pytest.fixture
+def key_files(tmp_path, monkeypatch):
+    private_path, public_path = tmp_path / "jwt-private.pem", tmp_path / "jwt-public.pem"
+    monkeypatch.setattr(settings, "JWKS_PRIVATE_KEY_PATH", str(private_path))
+    monkeypatch.setattr(settings, "JWKS_PUBLIC_KEY_PATH", str(public_path))
+    monkeypatch.setattr(settings, "JWKS_PREVIOUS_PUBLIC_KEYS", {})
+    monkeypatch.setattr(settings, "JWKS_RELOAD_INTERVAL_SECONDS", 0)
+    return private_path, public_path
+
+
+@pytest.fixture
+def parse_count(monkeypatch):
+    calls = []
+    construct = keys.jwk.construct
+
+    def counting_construct(*args, **kwargs):
+        calls.append(args)
+        return construct(*args, **kwargs)
+
+    monkeypatch.setattr(keys.jwk, "construct", counting_construct)
+    return calls
+
+
+def test_keys_are_generated_and_parsed_once(key_files, parse_count):
+    private_path, public_path = key_files
+    ring = JWTKeyRing()
+
+    kid, signing_key = ring.signing_key()
+    for _ in range(10):
+        ring.signing_key()
+        ring.verification_key(kid)
+
+    assert kid == settings.JWKS_KID
+    assert oct(os.stat(private_path).st_mode & 0o777) == "0o600"
+    assert len(parse_count) == 2  # private + public, no re-parsing
+
+    token = jwt.encode({"sub": "x"}, signing_key, algorithm=settings.JWT_ALGORITHM, headers={"kid": kid})
+    assert jwt.decode(token, ring.verification_key(kid), algorithms=[settings.JWT_ALGORITHM]) == {"sub": "x"}
+
+
+def test_changed_key_files_are_reloaded(key_files, parse_count):
+    private_path, public_path = key_files
+    ring = JWTKeyRing()
+    ring.signing_key()
+    old_public = ring.verification_key(None).to_dict()
+
+    # Rotate the key pair on disk with a newer mtime
+    private_path.unlink()
+    public_path.unlink()
+    keys.ensure_jwt_key_pair(private_path, public_path)
+    mtime = private_path.stat().st_mtime + 10
+    os.utime(private_path, (mtime, mtime))
+    os.utime(public_path, (mtime, mtime))
+
+    assert ring.verification_key(None).to_dict() != old_public
+    assert len(parse_count) == 4
+
+
+def test_previous_keys_stay_valid_for_verification(key_files, tmp_path, monkeypatch):
+    previous = tmp_path / "retired.pem"
+    _write_public_key(previous)
+    monkeypatch.setattr(settings, "JWKS_PREVIOUS_PUBLIC_KEYS", {"old-key": str(previous)})
+    ring = JWTKeyRing()
+
+    assert ring.verification_key("old-key") is not None
+    assert ring.verification_key("unknown") is None
+    assert {key["kid"] for key in ring.jwks()["keys"]} == {settings.JWKS_KID, "old-key"}
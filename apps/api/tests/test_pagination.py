@@ -0,0 +1,189 @@
+from collections import namedtuple
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+import uuid
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.db.models import Job
+from app.utils.pagination import (
+    _b64decode,
+    _b64encode,
+    apply_cursor_pagination,
+    decode_cursor,
+    encode_cursor,
+    get_cursor_paginated_results,
+)
+
+Row = namedtuple("Row", ["job", "cursor_sort_key"])
+START = datetime(2026, 1, 1)
+LATER = START + timedelta(hours=1)
+
+
+def _sql(query) -> str:
+    return " ".join(str(query.compile(dialect=postgresql.dialect())).split())
+
+
+def _cursor(created_at: datetime, backward: bool = False) -> str:
+    data = {"k": [created_at, str(uuid.uuid4())]}
+    if backward:
+        data["b"] = 1
+    return encode_cursor(data)
+
+
+class StubSession:
+    """Returns the given rows for the one query it is asked to run."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    async def execute(self, query):
+        self.queries.append(query)
+        return SimpleNamespace(all=lambda: list(self.rows))
+
+
+def _rows(count: int) -> list[Row]:
+    # In ORDER BY direction of a descending listing, as the database returns them
+    created = [START - timedelta(minutes=number) for number in range(count)]
+    return [Row(SimpleNamespace(id=uuid.uuid4(), created_at=at), at) for at in created]
+
+
+async def _page(rows, cursor=None, page_size=3):
+    db = StubSession(rows)
+    items, next_cursor, prev_cursor = await get_cursor_paginated_results(
+        db, select(Job), cursor=cursor, page_size=page_size,
+        id_field=Job.id, sort_field=Job.created_at, sort_order="desc",
+    )
+    return db, items, _decoded(next_cursor), _decoded(prev_cursor)
+
+
+def _decoded(cursor):
+    return decode_cursor(cursor) if cursor else None
+
+
+def test_cursor_round_trip():
+    job_id = uuid.uuid4()
+    cursor = encode_cursor({"k": [START, job_id], "b": 1})
+
+    assert decode_cursor(cursor) == {"k": [START.isoformat(), str(job_id)], "b": 1}
+
+
+def test_tampered_payload_is_rejected():
+    payload, signature = encode_cursor({"k": [START, "a"]}).split(".")
+    forged = _b64encode(_b64decode(payload).replace(b"2026", b"2099"))
+
+    assert decode_cursor(f"{forged}.{signature}") is None
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "",
+        "not-a-cursor",
+        # Unsigned, or signed with another key
+        _b64encode(b'{"k":["2026-01-01T00:00:00","a"]}'),
+        _b64encode(b'{"k":["2026-01-01T00:00:00","a"]}') + "." + _b64encode(b"\x00" * 12),
+    ],
+)
+def test_forged_or_malformed_cursors_are_rejected(cursor):
+    assert decode_cursor(cursor) is None
+
+
+def test_rejected_cursor_falls_back_to_the_first_page():
+    payload, signature = _cursor(START).split(".")
+    query, seek = apply_cursor_pagination(
+        select(Job.id), f"{payload}.{signature[::-1]}", Job.created_at, Job.id, "desc"
+    )
+
+    assert seek is None
+    assert "WHERE" not in _sql(query)
+
+
+@pytest.mark.parametrize(
+    "sort_order, backward, operator, direction",
+    [
+        ("asc", False, ">", "ASC"),
+        ("asc", True, "<", "DESC"),
+        ("desc", False, "<", "DESC"),
+        ("desc", True, ">", "ASC"),
+    ],
+)
+def test_seek_predicate_and_order(sort_order, backward, operator, direction):
+    query, seek = apply_cursor_pagination(
+        select(Job.id), _cursor(START, backward), Job.created_at, Job.id, sort_order
+    )
+
+    sql = _sql(query)
+    assert f"WHERE (jobs.created_at, jobs.id) {operator} (%(param_1)s, %(param_2)s::UUID)" in sql
+    assert sql.endswith(f"ORDER BY jobs.created_at {direction}, jobs.id {direction}")
+    assert seek == ("backward" if backward else "forward")
+    # Cursor values are bound with the columns' Python types
+    params = query.compile().params
+    assert params["param_1"] == START
+    assert isinstance(params["param_2"], uuid.UUID)
+
+
+def test_first_page_has_no_seek():
+    query, seek = apply_cursor_pagination(select(Job.id), None, Job.created_at, Job.id, "asc")
+
+    assert seek is None
+    assert _sql(query) == "SELECT jobs.id FROM jobs ORDER BY jobs.created_at ASC, jobs.id ASC"
+
+
+async def test_first_page_with_more_has_only_a_next_cursor():
+    rows = _rows(4)
+    db, items, next_cursor, prev_cursor = await _page(rows)
+
+    assert items == [row.job for row in rows[:3]]
+    assert next_cursor == {"k": [rows[2].cursor_sort_key.isoformat(), str(rows[2].job.id)]}
+    assert prev_cursor is None
+    # One extra row is fetched to detect the next page
+    assert "LIMIT %(param_1)s" in _sql(db.queries[0])
+    assert db.queries[0].compile().params["param_1"] == 4
+
+
+async def test_single_page_has_no_cursors():
+    _, items, next_cursor, prev_cursor = await _page(_rows(2))
+
+    assert len(items) == 2
+    assert next_cursor is None and prev_cursor is None
+
+
+async def test_middle_forward_page_has_both_cursors():
+    rows = _rows(4)
+    _, _, next_cursor, prev_cursor = await _page(rows, cursor=_cursor(LATER))
+
+    assert next_cursor["k"][1] == str(rows[2].job.id)
+    assert prev_cursor == {"k": [rows[0].cursor_sort_key.isoformat(), str(rows[0].job.id)], "b": 1}
+
+
+async def test_last_forward_page_has_only_a_prev_cursor():
+    rows = _rows(2)
+    _, items, next_cursor, prev_cursor = await _page(rows, cursor=_cursor(LATER))
+
+    assert items == [row.job for row in rows]
+    assert next_cursor is None
+    assert prev_cursor["k"][1] == str(rows[0].job.id)
+
+
+async def test_backward_page_with_more_is_reversed_and_has_both_cursors():
+    # Backward seeks come back in reverse ORDER BY direction
+    rows = list(reversed(_rows(4)))
+    _, items, next_cursor, prev_cursor = await _page(rows, cursor=_cursor(START, backward=True))
+
+    page = list(reversed(rows[:3]))
+    assert items == [row.job for row in page]
+    assert next_cursor == {"k": [page[-1].cursor_sort_key.isoformat(), str(page[-1].job.id)]}
+    assert prev_cursor == {"k": [page[0].cursor_sort_key.isoformat(), str(page[0].job.id)], "b": 1}
+
+
+async def test_backward_page_reaching_the_start_has_only_a_next_cursor():
+    rows = list(reversed(_rows(2)))
+    _, items, next_cursor, prev_cursor = await _page(rows, cursor=_cursor(START, backward=True))
+
+    assert items == [row.job for row in reversed(rows)]
+    assert next_cursor["k"][1] == str(rows[0].job.id)
+    assert prev_cursor is None
@@ -0,0 +1,57 @@
+"""EXPLAIN snapshots: the hot list queries must be served by their intended indexes."""
+import uuid
+
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+
+from app.db.models import Application, Job, JobCategory, PublishedJobCard
+from app.utils.pagination import apply_cursor_pagination
+
+
+async def _plan(db, query) -> str:
+    sql = str(query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    return "\n".join((await db.execute(text(f"EXPLAIN {sql}"))).scalars())
+
+
+def _listing(query, sort_field, id_field):
+    query, _ = apply_cursor_pagination(query, None, sort_field=sort_field, id_field=id_field)
+    return query.limit(21)
+
+
+def test_jobs_carry_no_published_listing_indexes():
+    # Published listings read published_job_cards; jobs only keeps the employer index
+    names = {index.name for index in Job.__table__.indexes}
+    assert "ix_jobs_employer_id_created_at_id" in names
+    assert not {name for name in names if "published" in name or name.startswith("ix_jobs_status_")}
+
+
+async def test_hot_queries_use_their_indexes(db):
+    # The tables are empty, so rule out sequential scans to see which index is chosen
+    await db.execute(text("SET LOCAL enable_seqscan = off"))
+    job_id, employer_id, category_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+    expected = {
+        "ix_published_job_cards_created_at_job_id": _listing(
+            select(PublishedJobCard), PublishedJobCard.created_at, PublishedJobCard.job_id
+        ),
+        "ix_published_job_cards_updated_at_job_id": _listing(
+            select(PublishedJobCard), PublishedJobCard.updated_at, PublishedJobCard.job_id
+        ),
+        "ix_jobs_employer_id_created_at_id": _listing(
+            select(Job).where(Job.employer_id == employer_id), Job.created_at, Job.id
+        ),
+        "ix_applications_job_id_status_created_at_id": _listing(
+            select(Application).where(Application.job_id == job_id, Application.status == "new"),
+            Application.created_at,
+            Application.id,
+        ),
+        "ix_applications_job_id_created_at_id": _listing(
+            select(Application).where(Application.job_id == job_id), Application.created_at, Application.id
+        ),
+        "ix_job_categories_category_id_job_id": select(JobCategory.job_id).where(
+            JobCategory.category_id == category_id
+        ),
+    }
+    for index_name, query in expected.items():
+        plan = await _plan(db, query)
+        assert index_name in plan, plan
@@ -0,0 +1,132 @@
+import asyncio
+import time
+
+import fakeredis
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from app.core.config import RateLimitPolicy
+from app.utils import rate_limit as rate_limit_module
+from app.utils.rate_limit import RateLimitMiddleware, rate_limit, rate_limit_many
+
+
+class CountingRedis(fakeredis.FakeAsyncRedis):
+    """In-memory Redis running the real Lua script, counting script round trips."""
+
+    round_trips = 0
+
+    async def evalsha(self, *args, **kwargs):
+        self.round_trips += 1
+        return await super().evalsha(*args, **kwargs)
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    client = CountingRedis(decode_responses=True)
+
+    async def get_redis():
+        return client
+
+    monkeypatch.setattr(rate_limit_module, "get_redis", get_redis)
+    monkeypatch.setattr(rate_limit_module, "_gcra_script", None)
+    monkeypatch.setattr(rate_limit_module, "_local_blocks", {})
+    return client
+
+
+async def test_burst_up_to_limit_then_denied(redis):
+    results = [await rate_limit("burst", limit=5, window_seconds=60) for _ in range(6)]
+
+    assert [result.allowed for result in results] == [True] * 5 + [False]
+    assert [result.remaining for result in results[:5]] == [4, 3, 2, 1, 0]
+    # One emission interval (60s / 5) until the next request is allowed
+    assert 0 < results[-1].retry_after <= 12
+
+
+async def test_concurrent_requests_never_exceed_the_limit(redis):
+    results = await asyncio.gather(*(rate_limit("concurrent", limit=10, window_seconds=60) for _ in range(50)))
+
+    assert sum(result.allowed for result in results) == 10
+
+
+async def test_denied_check_charges_no_key(redis):
+    await rate_limit_many([("tight", 1, 60, 1)])
+
+    results = await rate_limit_many([("loose", 10, 60, 1), ("tight", 1, 60, 1)])
+    assert [result.allowed for result in results] == [True, False]
+
+    # "loose" was not charged by the denied request
+    assert (await rate_limit("loose", limit=10, window_seconds=60)).remaining == 9
+
+
+async def test_cost_consumes_several_tokens(redis):
+    assert (await rate_limit("costly", limit=10, window_seconds=60, cost=4)).remaining == 6
+    assert not (await rate_limit("costly", limit=10, window_seconds=60, cost=7)).allowed
+
+
+async def test_one_round_trip_per_decision_and_local_precheck(redis):
+    # The first call also loads the script (NOSCRIPT, then a retry)
+    await rate_limit("warm-up", limit=1, window_seconds=60)
+    redis.round_trips = 0
+
+    for _ in range(20):
+        await rate_limit_many([("global", 1000, 60, 1), ("route", 3, 60, 1)])
+
+    # 3 allowed and the first denial go to Redis; later denials are answered in-process
+    assert redis.round_trips == 4
+
+
+async def test_throughput_smoke(redis):
+    await rate_limit("warm-up", limit=1, window_seconds=60)
+    redis.round_trips = 0
+    checks = [("throughput:global", 1_000_000, 60, 1), ("throughput:route", 1_000_000, 60, 1)]
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(rate_limit_many(checks) for _ in range(1000)))
+    elapsed = time.perf_counter() - start
+
+    assert all(result.allowed for pair in results for result in pair)
+    assert redis.round_trips == 1000
+    # Loose bound: in-memory Redis runs well over 1000 two-key decisions per second
+    assert elapsed < 10, f"{1000 / elapsed:.0f} decisions/s"
+
+
+async def test_fails_open_without_redis(monkeypatch):
+    async def get_redis():
+        raise ConnectionError("redis down")
+
+    monkeypatch.setattr(rate_limit_module, "get_redis", get_redis)
+    monkeypatch.setattr(rate_limit_module, "_gcra_script", None)
+    monkeypatch.setattr(rate_limit_module, "_local_blocks", {})
+
+    assert (await rate_limit("offline", limit=1, window_seconds=60)).allowed
+    assert (await rate_limit("offline", limit=1, window_seconds=60)).allowed
+
+
+async def test_middleware_applies_route_and_global_policies(redis):
+    async def endpoint(request):
+        return PlainTextResponse("ok")
+
+    app = RateLimitMiddleware(
+        Starlette(routes=[Route("/jobs/{job_id}", endpoint), Route("/other", endpoint)]),
+        policies={
+            "job": RateLimitPolicy(path="/jobs/{job_id}", limit=2, detail="Slow down"),
+            "global": RateLimitPolicy(path="*", methods=["*"], limit=100),
+        },
+    )
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        first = await client.get("/jobs/1")
+        await client.get("/jobs/2")
+        throttled = await client.get("/jobs/3")
+        other = await client.get("/other")
+
+    assert first.status_code == 200
+    assert first.headers["X-RateLimit-Remaining"] == "1"
+    assert throttled.status_code == 429
+    assert throttled.json() == {"detail": "Slow down"}
+    assert int(throttled.headers["Retry-After"]) >= 1
+    # Only the global policy applies to other paths; the throttled request wasn't charged
+    assert other.status_code == 200
+    assert other.headers["X-RateLimit-Remaining"] == "97"
@@ -0,0 +1,175 @@
+"""/auth/refresh against the database: selector lookup, rotation and legacy tokens."""
+from datetime import datetime, timedelta
+import secrets
+from types import SimpleNamespace
+
+import bcrypt
+from fastapi import HTTPException
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.api.v1 import auth
+from app.core.config import settings
+from app.core.security import create_refresh_token, hash_refresh_token, split_refresh_token
+from app.db.models import Employer, RefreshToken
+from app.schemas.auth import RefreshTokenRequest
+
+
+def _legacy_hash(token: str) -> str:
+    return bcrypt.hashpw(token.encode(), bcrypt.gensalt(rounds=4)).decode()
+
+
+async def _employer(db, email: str = "hr@resort.mv") -> Employer:
+    employer = Employer(company_name="Island Resort", email=email, password_hash="x")
+    db.add(employer)
+    await db.flush()
+    return employer
+
+
+async def _store(db, employer: Employer, **overrides) -> str:
+    token = create_refresh_token()
+    selector, verifier = split_refresh_token(token)
+    row = dict(
+        employer_id=employer.id,
+        selector=selector,
+        token_hash=hash_refresh_token(verifier),
+        expires_at=datetime.utcnow() + timedelta(days=1),
+    )
+    db.add(RefreshToken(**{**row, **overrides}))
+    await db.commit()
+    return token
+
+
+async def _store_legacy(db, employer: Employer) -> str:
+    token = secrets.token_urlsafe(32)
+    db.add(
+        RefreshToken(
+            employer_id=employer.id,
+            token_hash=_legacy_hash(token),
+            expires_at=datetime.utcnow() + timedelta(days=1),
+        )
+    )
+    await db.commit()
+    return token
+
+
+async def _refresh(db, token: str, employer_id=None):
+    request = RefreshTokenRequest(refresh_token=token, employer_id=employer_id)
+    return await auth.refresh_token(request, db=db)
+
+
+async def _rejected(db, token: str, employer_id=None) -> bool:
+    with pytest.raises(HTTPException) as raised:
+        await _refresh(db, token, employer_id)
+    return raised.value.status_code == 401
+
+
+async def test_selector_token_refreshes(db):
+    employer = await _employer(db)
+    token = await _store(db, employer)
+
+    response = await _refresh(db, token)
+
+    assert response.employer_id == str(employer.id)
+    assert split_refresh_token(response.refresh_token)[0] is not None
+
+
+async def test_wrong_verifier_is_rejected(db):
+    employer = await _employer(db)
+    selector, _ = split_refresh_token(await _store(db, employer))
+
+    assert await _rejected(db, f"{selector}.{secrets.token_urlsafe(32)}")
+
+
+async def test_revoked_and_expired_tokens_are_rejected(db):
+    employer = await _employer(db)
+    revoked = await _store(db, employer, revoked=1)
+    expired = await _store(db, employer, expires_at=datetime.utcnow() - timedelta(seconds=1))
+
+    assert await _rejected(db, revoked)
+    assert await _rejected(db, expired)
+
+
+async def test_rotation_rejects_the_old_token_on_reuse(db):
+    employer = await _employer(db)
+    token = await _store(db, employer)
+
+    rotated = await _refresh(db, token)
+
+    assert await _rejected(db, token)
+    assert (await _refresh(db, rotated.refresh_token)).employer_id == str(employer.id)
+
+
+async def test_legacy_token_is_rotated_into_the_new_format(db):
+    employer = await _employer(db)
+    legacy = await _store_legacy(db, employer)
+
+    response = await _refresh(db, legacy, employer.id)
+
+    assert split_refresh_token(response.refresh_token)[0] is not None
+    assert await _rejected(db, legacy, employer.id)
+    result = await db.execute(select(RefreshToken).where(RefreshToken.employer_id == employer.id))
+    rows = result.scalars()
+    assert sorted((row.selector is None, row.revoked) for row in rows) == [(False, 0), (True, 1)]
+
+
+async def test_legacy_scan_ignores_other_employers_rows(db, monkeypatch):
+    employer = await _employer(db)
+    other = await _employer(db, "hr@other.mv")
+    for _ in range(settings.REFRESH_TOKEN_LEGACY_SCAN_LIMIT + 5):
+        await _store_legacy(db, other)
+    legacy = await _store_legacy(db, employer)
+    checked = []
+
+    async def counting(fn, *args):
+        checked.append(args[1])
+        return fn(*args)
+
+    monkeypatch.setattr(auth, "run_in_hash_executor", counting)
+
+    assert (await _refresh(db, legacy, employer.id)).employer_id == str(employer.id)
+    assert len(checked) == 1
+    # Without the employer the legacy token isn't looked up at all
+    assert await _rejected(db, await _store_legacy(db, employer))
+    assert len(checked) == 1
+
+
+class RecordingSession:
+    """Captures the legacy lookup without a database; no rows match."""
+
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return SimpleNamespace(
+            scalars=lambda: SimpleNamespace(all=lambda: []),
+            scalar_one_or_none=lambda: None,
+        )
+
+    async def commit(self):
+        pass
+
+
+async def test_legacy_lookup_is_scoped_to_the_employer_and_capped():
+    db = RecordingSession()
+    employer_id = "0192f0c4-0000-7000-8000-000000000001"
+
+    with pytest.raises(HTTPException):
+        await _refresh(db, secrets.token_urlsafe(32), employer_id)
+
+    (statement,) = db.statements
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert "refresh_tokens.employer_id = %(employer_id_1)s" in sql
+    assert "refresh_tokens.selector IS NULL" in sql
+    assert "LIMIT" in sql
+
+
+async def test_legacy_token_without_employer_skips_the_lookup():
+    db = RecordingSession()
+
+    with pytest.raises(HTTPException):
+        await _refresh(db, secrets.token_urlsafe(32))
+
+    assert db.statements == []
@@ -0,0 +1,40 @@
+import secrets
+
+from app.core.config import settings
+from app.core.security import (
+    create_refresh_token,
+    hash_refresh_token,
+    is_legacy_refresh_token,
+    split_refresh_token,
+    verify_refresh_token,
+)
+from app.utils.rate_limit import RateLimitMiddleware
+
+
+def test_selector_verifier_round_trip():
+    token = create_refresh_token()
+    selector, verifier = split_refresh_token(token)
+    assert selector and verifier
+    assert verify_refresh_token(verifier, hash_refresh_token(verifier))
+    assert not verify_refresh_token(verifier + "x", hash_refresh_token(verifier))
+
+
+def test_legacy_tokens_are_recognised_by_shape():
+    legacy = secrets.token_urlsafe(32)
+    assert split_refresh_token(legacy) == (None, legacy)
+    assert is_legacy_refresh_token(legacy)
+    # Garbage never reaches the bcrypt scan
+    assert not is_legacy_refresh_token("")
+    assert not is_legacy_refresh_token("x" * 10_000)
+    assert not is_legacy_refresh_token(create_refresh_token())
+
+
+def test_legacy_scan_is_on_and_capped_by_default():
+    # Existing sessions keep working through the migration; the scan stays bounded
+    assert settings.REFRESH_TOKEN_ACCEPT_LEGACY is True
+    assert 0 < settings.REFRESH_TOKEN_LEGACY_SCAN_LIMIT <= 20
+
+
+def test_refresh_endpoint_is_rate_limited():
+    middleware = RateLimitMiddleware(app=None)
+    assert [name for name, _ in middleware._match("POST", "/api/v1/auth/refresh")] == ["refresh"]
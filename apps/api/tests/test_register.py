@@ -0,0 +1,70 @@
+from types import SimpleNamespace
+
+from fastapi import HTTPException
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1 import auth
+from app.db.base import engine
+from app.db.models import Employer
+from app.schemas.auth import RegisterRequest
+
+REQUEST = RegisterRequest(company_name="Resort", email="hr@resort.mv", password="pw")
+
+
+class RacingSession:
+    """Sees no existing employer, then loses the unique constraint on insert."""
+
+    def __init__(self):
+        self.commits = 0
+        self.rolled_back = False
+
+    async def execute(self, statement):
+        return SimpleNamespace(scalar_one_or_none=lambda: None)
+
+    def add(self, instance):
+        pass
+
+    async def commit(self):
+        self.commits += 1
+        if self.commits > 1:
+            raise IntegrityError("INSERT INTO employers", {}, Exception("duplicate key"))
+
+    async def rollback(self):
+        self.rolled_back = True
+
+
+async def _fast_hash(fn, *args):
+    return "hashed"
+
+
+async def test_register_race_loser_gets_400(monkeypatch):
+    monkeypatch.setattr(auth, "run_in_hash_executor", _fast_hash)
+    db = RacingSession()
+
+    with pytest.raises(HTTPException) as raised:
+        await auth.register(REQUEST, db=db)
+
+    assert raised.value.status_code == 400
+    assert raised.value.detail == "Email already registered"
+    assert db.rolled_back
+
+
+async def test_register_race_against_postgres(db, monkeypatch):
+    async def register_concurrently(fn, *args):
+        # The other request commits the same email while this one is hashing
+        async with AsyncSession(engine) as other:
+            other.add(Employer(company_name="Rival", email="hr@resort.mv", password_hash="x"))
+            await other.commit()
+        return "hashed"
+
+    monkeypatch.setattr(auth, "run_in_hash_executor", register_concurrently)
+
+    with pytest.raises(HTTPException) as raised:
+        await auth.register(REQUEST, db=db)
+
+    assert raised.value.status_code == 400
+    count = await db.execute(select(func.count()).where(Employer.email == "hr@resort.mv"))
+    assert count.scalar_one() == 1
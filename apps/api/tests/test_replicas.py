@@ -0,0 +1,72 @@
+import time
+
+import httpx
+from prometheus_client import REGISTRY
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from app.core.config import settings
+from app.db import replicas
+from app.db.base import make_engine
+from app.db.replicas import (
+    PRIMARY_PIN_COOKIE,
+    PrimaryPinMiddleware,
+    is_pinned_to_primary,
+    make_primary_pin,
+)
+
+
+def _cookie(value: str) -> str:
+    return f"other=1; {PRIMARY_PIN_COOKIE}={value}"
+
+
+def test_signed_pin_is_honoured_until_it_expires():
+    now = int(time.time())
+    assert is_pinned_to_primary(_cookie(make_primary_pin(now + 5)))
+    assert not is_pinned_to_primary(_cookie(make_primary_pin(now - 1)))
+    assert not is_pinned_to_primary(None)
+
+
+def test_forged_or_far_future_pins_are_ignored():
+    far_future = int(time.time()) + 10 * 365 * 86400
+    # Unsigned (the old format), tampered and garbage values
+    assert not is_pinned_to_primary(_cookie(str(far_future)))
+    signed = make_primary_pin(int(time.time()) + 5)
+    assert not is_pinned_to_primary(_cookie(f"{far_future}.{signed.split('.', 1)[1]}"))
+    assert not is_pinned_to_primary(_cookie("not-a-pin"))
+    # Even a correctly signed pin can't last longer than the configured pin time
+    assert not is_pinned_to_primary(_cookie(make_primary_pin(far_future)))
+
+
+async def test_successful_writes_set_a_signed_pin(monkeypatch):
+    monkeypatch.setattr(replicas.replica_router, "engines", [object()])
+
+    async def endpoint(request):
+        return PlainTextResponse("ok", status_code=int(request.query_params.get("status", 200)))
+
+    app = PrimaryPinMiddleware(Starlette(routes=[Route("/jobs", endpoint, methods=["GET", "POST"])]))
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        written = await client.post("/jobs")
+        failed = await client.post("/jobs?status=422")
+        read = await client.get("/jobs")
+
+    pin = written.cookies[PRIMARY_PIN_COOKIE]
+    assert is_pinned_to_primary(_cookie(pin))
+    assert f"Max-Age={settings.DB_REPLICA_PRIMARY_PIN_SECONDS}" in written.headers["set-cookie"]
+    assert PRIMARY_PIN_COOKIE not in failed.cookies
+    assert PRIMARY_PIN_COOKIE not in read.cookies
+
+
+def test_pool_gauges_follow_the_pool_after_dispose():
+    engine = make_engine(settings.DATABASE_URL, "gauge_test")
+    original = engine.pool
+
+    def idle() -> float:
+        return REGISTRY.get_sample_value("jobsmv_db_pool_idle_connections", {"pool": "gauge_test"})
+
+    assert idle() == 0
+    engine.sync_engine.dispose()
+    assert engine.pool is not original
+    engine.pool.checkedin = lambda: 7
+    assert idle() == 7
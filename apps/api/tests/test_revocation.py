@@ -0,0 +1,126 @@
+from types import SimpleNamespace
+
+import fakeredis
+from prometheus_client import REGISTRY
+import pytest
+
+from app.core import revocation as revocation_module
+from app.core.revocation import (
+    REVOKED_JTI_PREFIX,
+    RotatingBloomFilter,
+    is_token_revoked,
+    revoke_token,
+)
+
+
+class Clock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(revocation_module, "time", SimpleNamespace(time=clock.time))
+    return clock
+
+
+@pytest.fixture
+def revoked(monkeypatch, clock):
+    bloom = RotatingBloomFilter(bits=8192, hashes=4, generations=3, period=60)
+    monkeypatch.setattr(revocation_module, "_revoked", bloom)
+    return bloom
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+
+    async def get_redis():
+        return client
+
+    monkeypatch.setattr(revocation_module, "get_redis", get_redis)
+    return client
+
+
+@pytest.fixture
+def redis_down(monkeypatch):
+    async def get_redis():
+        raise ConnectionError("redis down")
+
+    monkeypatch.setattr(revocation_module, "get_redis", get_redis)
+
+
+def _checks(result: str) -> float:
+    labels = {"result": result}
+    return REGISTRY.get_sample_value("jobsmv_token_revocation_checks_total", labels) or 0
+
+
+def test_entries_age_out_after_generations_rotations(revoked, clock):
+    revoked.add("jti-1")
+
+    for _ in range(revoked.generations - 1):
+        clock.now += revoked.period
+        assert "jti-1" in revoked
+
+    clock.now += revoked.period
+    assert "jti-1" not in revoked
+
+
+def test_memory_stays_bounded(revoked, clock):
+    for number in range(20_000):
+        revoked.add(f"jti-{number}")
+        if number % 1000 == 0:
+            clock.now += revoked.period
+
+    assert len(revoked._filters) == revoked.generations
+    assert all(len(bits) == revoked.bits // 8 for _, bits in revoked._filters)
+
+
+def test_added_entries_are_always_found(revoked):
+    values = [f"jti-{number}" for number in range(500)]
+    for value in values:
+        revoked.add(value)
+
+    assert all(value in revoked for value in values)
+
+
+async def test_synced_negative_is_answered_locally(revoked, redis_down, monkeypatch):
+    monkeypatch.setattr(revocation_module, "_synced", True)
+    before = _checks("local_negative")
+
+    assert await is_token_revoked("never-revoked") is False
+    assert _checks("local_negative") == before + 1
+
+
+async def test_local_positive_is_confirmed_in_redis(revoked, redis, monkeypatch):
+    monkeypatch.setattr(revocation_module, "_synced", True)
+    await revoke_token("revoked-jti", revocation_module.time.time() + 300)
+    # A bloom false positive: in the local filter, but not revoked in Redis
+    revoked.add("false-positive")
+
+    assert await redis.ttl(f"{REVOKED_JTI_PREFIX}revoked-jti") > 0
+    assert await is_token_revoked("revoked-jti") is True
+    assert await is_token_revoked("false-positive") is False
+
+
+async def test_unsynced_checks_go_to_redis(revoked, redis, monkeypatch):
+    monkeypatch.setattr(revocation_module, "_synced", False)
+    await redis.set(f"{REVOKED_JTI_PREFIX}from-another-worker", "1")
+
+    assert await is_token_revoked("from-another-worker") is True
+    assert await is_token_revoked("not-revoked") is False
+
+
+@pytest.mark.parametrize("synced", [True, False])
+async def test_redis_error_returns_synced(revoked, redis_down, monkeypatch, synced):
+    monkeypatch.setattr(revocation_module, "_synced", synced)
+    revoked.add("maybe-revoked")
+    before = _checks("error")
+
+    # Synced: a local positive is treated as revoked. Unsynced: fail open.
+    assert await is_token_revoked("maybe-revoked") is synced
+    assert _checks("error") == before + 1
@@ -0,0 +1,118 @@
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+import uuid
+
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+
+from app.db.models import Employer, Job, JobSalary, PublishedJobCard
+from app.db.read_model import _card_values, salary_filter, sync_job_cards
+
+
+def _sql(predicate) -> str:
+    query = select(PublishedJobCard.job_id).where(predicate)
+    return str(query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def _job(is_salary_public: bool, *salaries: tuple[str, int, int]) -> SimpleNamespace:
+    now = datetime(2026, 1, 1)
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        employer_id=uuid.uuid4(),
+        title="Sous Chef",
+        description_md="Kitchen role",
+        requirements_md=None,
+        excerpt="Kitchen role",
+        location="Male'",
+        is_salary_public=is_salary_public,
+        salaries=[
+            JobSalary(
+                id=uuid.uuid4(), currency=currency, amount_min=Decimal(low), amount_max=Decimal(high),
+                created_at=now, updated_at=now,
+            )
+            for currency, low, high in salaries
+        ],
+        categories=[],
+        tags=[],
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def test_inverted_range_matches_nothing():
+    assert _sql(salary_filter(30_000, 10_000, None)).endswith("WHERE false")
+    assert _sql(salary_filter(30_000, 10_000, "MVR")).endswith("WHERE false")
+
+
+def test_currency_range_uses_envelope_containment():
+    sql = _sql(salary_filter(1_000, None, "USD"))
+    assert "salary_range_usd <@ numrange(1000, CAST(NULL AS NUMERIC), '[]')" in sql
+
+
+def test_any_currency_range_branches_start_with_indexed_conditions():
+    branches = salary_filter(10_000, 30_000, None).clauses
+    # Empty currency set (GIN), then one branch per currency led by its envelope (GiST)
+    assert _sql(branches[0]).endswith("WHERE published_job_cards.salary_currencies = CAST('{}' AS VARCHAR[])")
+    leading = [branch.clauses[0] for branch in branches[1:]]
+    assert [(condition.left.key, condition.operator.opstring) for condition in leading] == [
+        ("salary_range_mvr", "<@"),
+        ("salary_range_usd", "<@"),
+    ]
+
+
+def test_card_projects_public_salaries_into_filter_columns():
+    values = _card_values(_job(True, ("MVR", 10_000, 20_000), ("MVR", 15_000, 25_000)), datetime.utcnow())
+    assert values["salary_currencies"] == ["MVR"]
+    assert (values["salary_range_mvr"].lower, values["salary_range_mvr"].upper) == (10_000, 25_000)
+    assert values["salary_range_usd"] is None
+
+
+def test_card_hides_private_salaries_from_filter_columns():
+    values = _card_values(_job(False, ("MVR", 10_000, 20_000), ("USD", 1_000, 2_000)), datetime.utcnow())
+    assert values["salaries"] == []
+    assert values["salary_currencies"] == []
+    assert values["salary_range_mvr"] is None
+    assert values["salary_range_usd"] is None
+
+
+async def test_salary_filter_against_postgres(db):
+    employer = Employer(company_name="Resort", email="hr@example.mv", password_hash="x")
+    db.add(employer)
+    jobs = {
+        "mvr_in": (True, [("MVR", 12_000, 18_000)]),
+        "mvr_out": (True, [("MVR", 12_000, 45_000)]),
+        "both_in": (True, [("MVR", 15_000, 20_000), ("USD", 15_000, 20_000)]),
+        "usd_out": (True, [("MVR", 15_000, 20_000), ("USD", 1_000, 2_000)]),
+        "hidden": (False, [("MVR", 90_000, 99_000)]),
+        "none": (True, []),
+    }
+    ids = {}
+    for name, (public, salaries) in jobs.items():
+        job = Job(
+            employer=employer, title=name, description_md=name, status="published",
+            is_salary_public=public,
+            salaries=[JobSalary(currency=c, amount_min=low, amount_max=high) for c, low, high in salaries],
+        )
+        db.add(job)
+        await db.flush()
+        ids[job.id] = name
+    await sync_job_cards(db, list(ids))
+
+    async def matching(*args) -> set[str]:
+        result = await db.execute(select(PublishedJobCard.job_id).where(salary_filter(*args)))
+        return {ids[job_id] for job_id in result.scalars()}
+
+    assert await matching(10_000, 30_000, None) == {"mvr_in", "both_in", "hidden", "none"}
+    assert await matching(10_000, 30_000, "MVR") == {"mvr_in", "both_in", "usd_out"}
+    assert await matching(50_000, 100_000, "MVR") == set()
+    assert await matching(None, None, "USD") == {"both_in", "usd_out"}
+    assert await matching(30_000, 10_000, None) == set()
+
+    # Every branch of the any-currency predicate can use an index
+    await db.execute(text("SET LOCAL enable_seqscan = off"))
+    query = select(PublishedJobCard.job_id).where(salary_filter(10_000, 30_000, None))
+    sql = str(query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    plan = "\n".join((await db.execute(text(f"EXPLAIN {sql}"))).scalars())
+    assert "BitmapOr" in plan
+    assert "Seq Scan" not in plan
@@ -68,6 +68,17 @@ class ApiClient {
     }
   }
 
+  private getTokenEmployerId(token: string | null): string | undefined {
+    if (!token) return undefined;
+    try {
+      const payload = token.split('.')[1];
+      const decodedPayload = JSON.parse(atob(payload.replace(/-/g, '+').replace(/_/g, '/')));
+      return decodedPayload.employer_id;
+    } catch (error) {
+      return undefined;
+    }
+  }
+
   private isTokenExpiringSoon(): boolean {
     if (!this.tokenExpiry) return false;
     const now = Date.now();
@@ -87,6 +98,8 @@ class ApiClient {
       },
       body: JSON.stringify({
         refresh_token: this.refreshToken,
+        // Lets the API find pre-selector refresh tokens without scanning every employer's
+        employer_id: this.getTokenEmployerId(this.accessToken),
       }),
       credentials: "include",
       mode: "cors",
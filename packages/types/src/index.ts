@@ -23,6 +23,7 @@ export interface ApiError {
 export interface PaginatedResponse<T> {
   items: T[];
   next_cursor?: string | null;
+  prev_cursor?: string | null;
 }
 
 export type Currency = "MVR" | "USD";
@@ -34,6 +35,7 @@ export interface Job {
   title: string;
   description_md: string;
   requirements_md?: string;
+  excerpt?: string;
   location?: string;
   is_salary_public: boolean;
   salaries: JobSalary[];
@@ -51,6 +53,7 @@ export interface JobPublic {
   title: string;
   description_md: string;
   requirements_md?: string;
+  excerpt?: string;
   location?: string;
   is_salary_public: boolean;
   salary_hidden?: boolean;
@@ -62,6 +65,26 @@ export interface JobPublic {
   updated_at: string;
 }
 
+export interface FacetCount {
+  value: string;
+  count: number;
+}
+
+export interface SalaryBandCount {
+  currency: "MVR" | "USD";
+  min: number;
+  max?: number | null;
+  count: number;
+}
+
+export interface JobFacets {
+  total: number;
+  categories: FacetCount[];
+  locations: FacetCount[];
+  currencies: FacetCount[];
+  salary_bands: SalaryBandCount[];
+}
+
 export interface Employer {
   id: string;
   company_name: string;